@@ -0,0 +1,439 @@
+"""
+Benchmarks de desempenho da coleta e da carga
+
+Mede, com dados sintéticos (ver `benchmarks/synthetic.py`):
+  - collector: NewsCollectorService.collect_all contra feeds servidos
+    por um servidor HTTP local (fetch + parse + sentimento)
+  - sentiment_analyze / sentiment_analyze_batch: SentimentAnalysisService
+  - relational_projection: NewsArticle.to_relational_dict
+  - mongodb_save: MongoDBRepository.save em coleção mongomock
+  - postgresql_save: COPY + merge do PostgreSQLRepository em SQLite
+  - snowflake_save: DataFrame do SnowflakeRepository + upsert em duckdb
+  - import_repositories / import_services / cli_help: tempo de
+    inicialização num processo Python novo (importação e --help)
+
+Dependências opcionais (mongomock, duckdb) ausentes apenas pulam o
+benchmark correspondente. Cada execução com --save é anexada a
+`benchmarks/results/historico.jsonl` com o commit atual; --compare
+compara com a última execução salva de outro commit (mesmo --size) e
+aponta regressões acima de --threshold.
+
+Uso:
+    python benchmarks/bench_coleta.py --size 2000 --save --compare
+    python benchmarks/bench_coleta.py --only sentiment_analyze --repeat 10
+"""
+import argparse
+import csv
+import json
+import logging
+import platform
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Adicionar diretório raiz ao path para imports
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from benchmarks.synthetic import google_news_rss, news_texts, synthetic_articles
+from src.config import MongoDBConfig, PostgreSQLConfig, SnowflakeConfig
+from src.models import RELATIONAL_COLUMNS
+from src.repositories import MongoDBRepository, PostgreSQLRepository, SnowflakeRepository
+from src.services import NewsCollectorService, SentimentAnalysisService
+from src.sources import slugify
+
+RESULTS_FILE = Path(__file__).parent / 'results' / 'historico.jsonl'
+
+# Quantidade de queries (feeds) no benchmark do coletor
+COLLECTOR_QUERIES = 10
+
+# run(), itens processados por execução e limpeza ao final
+Case = Tuple[Callable[[], Any], int, Optional[Callable[[], None]]]
+
+BENCHMARKS: Dict[str, Callable[[argparse.Namespace], Case]] = {}
+
+
+class BenchmarkSkipped(Exception):
+    """Dependência opcional do benchmark não instalada"""
+
+
+def benchmark(name: str):
+    """Registra uma função de preparo de benchmark"""
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+class _FeedHandler(BaseHTTPRequestHandler):
+    """Serve os feeds sintéticos de `server.feeds` (path → bytes)"""
+
+    def do_GET(self):
+        body = self.server.feeds.get(self.path)
+        if body is None:
+            self.send_response(404)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/rss+xml; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class LocalFeedCollector(NewsCollectorService):
+    """Coletor que busca os feeds no servidor local em vez do Google News"""
+
+    def __init__(self, base_url: str, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.base_url = base_url
+
+    def _build_rss_url(self, query: str) -> str:
+        return f"{self.base_url}/{slugify(query)}.xml"
+
+
+@benchmark('collector')
+def bench_collector(args) -> Case:
+    queries = [f"BBAS3 Banco do Brasil {2015 + i}" for i in range(COLLECTOR_QUERIES)]
+    per_query = max(1, args.size // COLLECTOR_QUERIES)
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _FeedHandler)
+    server.feeds = {
+        f"/{slugify(query)}.xml": google_news_rss(query, per_query, seed=args.seed)
+        for query in queries
+    }
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    collector = LocalFeedCollector(
+        f"http://127.0.0.1:{server.server_port}",
+        SentimentAnalysisService(),
+        max_per_query=per_query,
+        max_years_back=50,
+        sleep_between=0.0,
+        max_workers=args.workers
+    )
+
+    def cleanup():
+        server.shutdown()
+        server.server_close()
+
+    return (lambda: collector.collect_all(queries)), per_query * len(queries), cleanup
+
+
+@benchmark('sentiment_analyze')
+def bench_sentiment_analyze(args) -> Case:
+    service = SentimentAnalysisService()
+    texts = news_texts(args.size, seed=args.seed)
+
+    def run():
+        for text in texts:
+            service.analyze(text)
+
+    return run, len(texts), None
+
+
+@benchmark('sentiment_analyze_batch')
+def bench_sentiment_analyze_batch(args) -> Case:
+    service = SentimentAnalysisService()
+    texts = news_texts(args.size, seed=args.seed)
+    return (lambda: service.analyze_batch(texts)), len(texts), None
+
+
+@benchmark('relational_projection')
+def bench_relational_projection(args) -> Case:
+    articles = synthetic_articles(args.size, seed=args.seed)
+
+    def run():
+        for article in articles:
+            article.to_relational_dict()
+
+    return run, len(articles), None
+
+
+@benchmark('mongodb_save')
+def bench_mongodb_save(args) -> Case:
+    try:
+        import mongomock
+    except ImportError:
+        raise BenchmarkSkipped("mongomock não instalado (pip install mongomock)")
+
+    repo = MongoDBRepository(MongoDBConfig(uri='mongodb://benchmark', database='bench', collection='noticias'))
+    repo._collection = mongomock.MongoClient()['bench']['noticias']
+    repo._ensure_indexes()
+    articles = synthetic_articles(args.size, seed=args.seed)
+    try:
+        repo.save(articles[:1])
+    except TypeError as e:
+        # UpdateOne do pymongo >= 4.9 repassa argumentos que o mongomock não aceita
+        raise BenchmarkSkipped(f"mongomock incompatível com o pymongo instalado: {e}")
+    return (lambda: repo.save(articles)), len(articles), None
+
+
+@benchmark('postgresql_save')
+def bench_postgresql_save(args) -> Case:
+    """
+    Mesmas etapas de `_save_merge` com SQLite no lugar do PostgreSQL:
+    CSV do COPY, carga da staging e INSERT ... ON CONFLICT (url_hash)
+    """
+    import sqlite3
+
+    repo = PostgreSQLRepository(PostgreSQLConfig(user='u', password='p', host='h', port='5432', database='bench'))
+    conn = sqlite3.connect(':memory:')
+    conn.execute(repo._create_table_sql())
+    staging_table = f"{repo.table_name}_staging"
+    conn.execute(f"CREATE TEMP TABLE {staging_table} AS SELECT * FROM {repo.table_name} WHERE 0")
+    placeholders = ', '.join('?' for _ in RELATIONAL_COLUMNS)
+    # SQLite exige WHERE em INSERT ... SELECT ... ON CONFLICT
+    merge_sql = repo._merge_sql(staging_table).replace(
+        f"FROM {staging_table} ", f"FROM {staging_table} WHERE true ", 1
+    )
+    articles = synthetic_articles(args.size, seed=args.seed)
+
+    def run():
+        buffer = repo._to_copy_buffer(articles)
+        rows = (
+            [None if value == repo.COPY_NULL else value for value in row]
+            for row in csv.reader(buffer)
+        )
+        conn.execute(f"DELETE FROM {staging_table}")
+        conn.executemany(f"INSERT INTO {staging_table} VALUES ({placeholders})", rows)
+        conn.execute(merge_sql)
+        conn.commit()
+
+    return run, len(articles), conn.close
+
+
+@benchmark('snowflake_save')
+def bench_snowflake_save(args) -> Case:
+    """
+    DataFrame do `SnowflakeRepository` (mesma conversão do write_pandas)
+    carregado com upsert por url_hash numa tabela duckdb
+    """
+    try:
+        import duckdb
+    except ImportError:
+        raise BenchmarkSkipped("duckdb não instalado (pip install duckdb)")
+
+    repo = SnowflakeRepository(SnowflakeConfig(user='u', password='p', account='a', warehouse='w', database='d', schema='s'))
+    # DDL com tipos do PostgreSQL (duckdb não conhece TIMESTAMP_TZ/NUMBER)
+    ddl = PostgreSQLRepository(PostgreSQLConfig(
+        user='u', password='p', host='h', port='5432', database='bench', table_name=repo.table_name
+    ))._create_table_sql()
+    conn = duckdb.connect()
+    conn.execute(ddl)
+    articles = synthetic_articles(args.size, seed=args.seed)
+
+    def run():
+        df = repo._to_dataframe(articles)
+        conn.register('staging_df', df)
+        conn.execute(f"INSERT OR REPLACE INTO {repo.table_name} SELECT * FROM staging_df")
+        conn.unregister('staging_df')
+
+    return run, len(articles), conn.close
+
+
+def _subprocess_case(*command: str) -> Case:
+    """Executa um comando Python num processo novo (sem cache de módulos)"""
+    def run():
+        subprocess.run([sys.executable, *command], cwd=root_dir, check=True, stdout=subprocess.DEVNULL)
+    return run, 1, None
+
+
+@benchmark('import_repositories')
+def bench_import_repositories(args) -> Case:
+    return _subprocess_case('-c', 'import src.repositories')
+
+
+@benchmark('import_services')
+def bench_import_services(args) -> Case:
+    return _subprocess_case('-c', 'import src.services')
+
+
+@benchmark('cli_help')
+def bench_cli_help(args) -> Case:
+    return _subprocess_case('collect_news_bbas3.py', '--help')
+
+
+def measure(run: Callable[[], Any], repeat: int, warmup: int = 1) -> List[float]:
+    """Durações (segundos) de `repeat` execuções após `warmup` execuções descartadas"""
+    for _ in range(warmup):
+        run()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def run_benchmarks(args) -> Dict[str, Dict[str, float]]:
+    """Executa os benchmarks selecionados e retorna as estatísticas por nome"""
+    results = {}
+    for name in args.only or BENCHMARKS:
+        try:
+            run, items, cleanup = BENCHMARKS[name](args)
+        except BenchmarkSkipped as e:
+            print(f"⏭️  {name}: {e}")
+            continue
+        try:
+            timings = measure(run, args.repeat, args.warmup)
+        finally:
+            if cleanup:
+                cleanup()
+
+        median = statistics.median(timings)
+        results[name] = {
+            'items': items,
+            'median_seconds': round(median, 6),
+            'min_seconds': round(min(timings), 6),
+            'stdev_seconds': round(statistics.stdev(timings), 6) if len(timings) > 1 else 0.0,
+            'items_per_second': round(items / median, 1) if median else 0.0,
+        }
+        print(
+            f"{name:<26} {median * 1000:10.1f} ms (mín {min(timings) * 1000:.1f})  "
+            f"{results[name]['items_per_second']:>12,.0f} itens/s"
+        )
+    return results
+
+
+def git_revision() -> Tuple[str, bool]:
+    """Commit atual e se há alterações não commitadas"""
+    def git(*cmd):
+        return subprocess.run(
+            ['git', *cmd], cwd=root_dir, capture_output=True, text=True, check=True
+        ).stdout.strip()
+
+    try:
+        return git('rev-parse', '--short', 'HEAD'), bool(git('status', '--porcelain', '--untracked-files=no'))
+    except (OSError, subprocess.CalledProcessError):
+        return 'desconhecido', False
+
+
+def build_record(args, results: Dict[str, Dict[str, float]]) -> Dict[str, Any]:
+    """Registro de uma execução para o histórico"""
+    commit, dirty = git_revision()
+    return {
+        'commit': commit,
+        'dirty': dirty,
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'machine': f"{platform.system()} {platform.machine()}",
+        'size': args.size,
+        'repeat': args.repeat,
+        'results': results,
+    }
+
+
+def load_history(path: Path) -> List[Dict[str, Any]]:
+    """Execuções salvas (mais antigas primeiro)"""
+    if not path.exists():
+        return []
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def find_baseline(
+    history: List[Dict[str, Any]],
+    record: Dict[str, Any],
+    commit: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """Última execução de outro commit (ou do commit pedido) com o mesmo tamanho"""
+    for previous in reversed(history):
+        if previous['size'] != record['size']:
+            continue
+        if commit is not None:
+            if previous['commit'].startswith(commit):
+                return previous
+        elif previous['commit'] != record['commit']:
+            return previous
+    return None
+
+
+def compare(baseline: Dict[str, Any], record: Dict[str, Any], threshold: float) -> List[str]:
+    """
+    Compara medianas com a execução de referência
+
+    Returns:
+        Nomes dos benchmarks que ficaram mais de `threshold` mais lentos
+    """
+    print(f"\n📊 Comparação com {baseline['commit']} ({baseline['timestamp']})")
+    regressions = []
+    for name, current in record['results'].items():
+        previous = baseline['results'].get(name)
+        if not previous:
+            continue
+        ratio = current['median_seconds'] / previous['median_seconds'] if previous['median_seconds'] else 1.0
+        if ratio > 1 + threshold:
+            status = '🔴 regressão'
+            regressions.append(name)
+        elif ratio < 1 - threshold:
+            status = '🟢 melhoria'
+        else:
+            status = '⚪ estável'
+        print(f"{name:<26} {(ratio - 1) * 100:+7.1f}%  {status}")
+    return regressions
+
+
+def save_record(path: Path, record: Dict[str, Any]):
+    """Anexa a execução ao histórico"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmarks de coleta, sentimento e carga")
+    parser.add_argument('--size', type=int, default=2000, help="Artigos/textos por benchmark")
+    parser.add_argument('--repeat', type=int, default=5, help="Execuções medidas por benchmark")
+    parser.add_argument('--warmup', type=int, default=1, help="Execuções descartadas antes da medição")
+    parser.add_argument('--workers', type=int, default=4, help="Threads do coletor")
+    parser.add_argument('--seed', type=int, default=0, help="Seed dos dados sintéticos")
+    parser.add_argument('--only', nargs='+', choices=sorted(BENCHMARKS), help="Executa apenas estes benchmarks")
+    parser.add_argument('--results', type=Path, default=RESULTS_FILE, help="Arquivo de histórico (JSONL)")
+    parser.add_argument('--save', action='store_true', help="Anexa o resultado ao histórico")
+    parser.add_argument('--compare', nargs='?', const='', default=None, metavar='COMMIT',
+                        help="Compara com a última execução de outro commit (ou do COMMIT informado)")
+    parser.add_argument('--threshold', type=float, default=0.2, help="Variação tolerada na comparação (0.2 = 20%%)")
+    parser.add_argument('--fail-on-regression', action='store_true', help="Sai com código 1 se houver regressão")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    # Logs por artigo/query distorcem as medições
+    logging.disable(logging.INFO)
+
+    print(f"⏱️  Benchmarks: {args.size} itens, {args.repeat} repetições")
+    try:
+        results = run_benchmarks(args)
+    finally:
+        logging.disable(logging.NOTSET)
+    record = build_record(args, results)
+
+    regressions = []
+    if args.compare is not None:
+        baseline = find_baseline(load_history(args.results), record, args.compare or None)
+        if baseline is None:
+            print("\nℹ️  Nenhuma execução anterior comparável no histórico")
+        else:
+            regressions = compare(baseline, record, args.threshold)
+
+    if args.save:
+        save_record(args.results, record)
+        print(f"\n💾 Resultado salvo em {args.results} (commit {record['commit']}{' + alterações' if record['dirty'] else ''})")
+
+    return 1 if regressions and args.fail_on_regression else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+"""
+Benchmark de memória dos modelos de dados
+
+Compara os modelos atuais (dataclasses com __slots__) com a versão
+anterior (dataclasses com __dict__ por instância e `asdict`) mantendo
+N artigos em memória, como `main()` faz em `all_articles`.
+
+Uso:
+    python benchmarks/bench_memoria_modelos.py --n 100000
+"""
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Optional
+
+# Adicionar diretório raiz ao path para imports
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from src.models import NewsArticle, SentimentAnalysis
+
+
+@dataclass
+class LegacySentimentAnalysis:
+    """SentimentAnalysis antes do __slots__"""
+    polarity: float
+    subjectivity: float
+    label: str
+    confidence: float
+    positive_keywords: int
+    negative_keywords: int
+
+    def to_dict(self):
+        return asdict(self)
+
+
+@dataclass
+class LegacyNewsArticle:
+    """NewsArticle antes do __slots__"""
+    url: str
+    query: str
+    titulo_noticia: str
+    publicada: Optional[str]
+    busca_feita: str
+    resumo: str
+    sentimentos: LegacySentimentAnalysis
+
+    def to_dict(self):
+        return {
+            'url': self.url,
+            'query': self.query,
+            'titulo_noticia': self.titulo_noticia,
+            'publicada': self.publicada,
+            'busca_feita': self.busca_feita,
+            'resumo': self.resumo,
+            'sentimentos': self.sentimentos.to_dict()
+        }
+
+
+def build(article_cls, sentiment_cls, n):
+    """Cria n artigos sintéticos (strings distintas, como na coleta real)"""
+    return [
+        article_cls(
+            url=f"https://news.google.com/rss/articles/{i:012d}",
+            query="BBAS3 Banco do Brasil resultados 2024",
+            titulo_noticia=f"Banco do Brasil divulga resultado {i} - Valor Econômico",
+            publicada=f"2024-{1 + i % 12:02d}-15T10:00:00+00:00",
+            busca_feita="2025-01-16T08:00:00+00:00",
+            resumo=f"Resumo da notícia {i} sobre lucro e inadimplência do agro",
+            sentimentos=sentiment_cls(0.1, 0.4, 'positive', 0.6, 2, 1)
+        )
+        for i in range(n)
+    ]
+
+
+def measure(label, article_cls, sentiment_cls, n):
+    """Mede pico de memória para manter n artigos e tempo de to_dict"""
+    gc.collect()
+    tracemalloc.start()
+    articles = build(article_cls, sentiment_cls, n)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for article in articles:
+        article.to_dict()
+    to_dict_seconds = time.perf_counter() - start
+
+    print(
+        f"{label:<10} {current / 1024 / 1024:9.1f} MB retidos "
+        f"({current / n:6.0f} B/artigo)  to_dict: {to_dict_seconds:6.2f}s"
+    )
+    del articles
+    return current
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de memória dos modelos")
+    parser.add_argument('--n', type=int, default=100_000, help="Quantidade de artigos")
+    args = parser.parse_args()
+
+    print(f"📊 {args.n} artigos em memória")
+    legacy = measure("legado", LegacyNewsArticle, LegacySentimentAnalysis, args.n)
+    slotted = measure("__slots__", NewsArticle, SentimentAnalysis, args.n)
+    print(f"➡️  Redução: {(1 - slotted / legacy) * 100:.1f}%")
+
+
+if __name__ == "__main__":
+    main()
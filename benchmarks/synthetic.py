@@ -0,0 +1,121 @@
+"""
+Dados sintéticos para os benchmarks
+
+Gera feeds RSS no formato do Google News e corpora de notícias de
+tamanho configurável. A geração é determinística (seed fixa): a mesma
+chamada produz os mesmos bytes em qualquer máquina, então resultados
+de commits diferentes são comparáveis.
+"""
+import random
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from typing import List
+from xml.sax.saxutils import escape
+
+from src.models import NewsArticle, SentimentAnalysis
+from src.services import SentimentAnalysisService
+
+SOURCES = [
+    'Valor Econômico', 'InfoMoney', 'Exame', 'Money Times', 'Estadão',
+    'Folha de S.Paulo', 'O Globo', 'CNN Brasil', 'Seu Dinheiro', 'E-Investidor'
+]
+
+SUBJECTS = [
+    'Banco do Brasil', 'BBAS3', 'Ações do BB', 'Carteira do agro', 'Conselho do BB',
+    'Tarcísio Hübner', 'Tesouro Nacional', 'Ibovespa', 'Bancos públicos', 'Crédito rural'
+]
+
+VERBS = [
+    'registra', 'anuncia', 'projeta', 'revisa', 'aponta', 'divulga', 'enfrenta', 'amplia'
+]
+
+FILLER = [
+    'trimestre', 'resultado', 'guidance', 'analistas', 'mercado', 'carteira', 'crédito',
+    'juros', 'Selic', 'agronegócio', 'balanço', 'investidores', 'bolsa', 'margem',
+    'captação', 'spread', 'provisões', 'governo', 'acionistas', 'patrimônio'
+]
+
+KEYWORDS = SentimentAnalysisService.POSITIVE_KEYWORDS + SentimentAnalysisService.NEGATIVE_KEYWORDS
+
+# Data de referência fixa (não depende do relógio da máquina)
+REFERENCE_DATE = datetime(2025, 6, 30, 12, 0, tzinfo=timezone.utc)
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    """Frase com vocabulário financeiro e ~1 keyword de sentimento a cada 6 palavras"""
+    tokens = [
+        rng.choice(KEYWORDS) if rng.random() < 0.15 else rng.choice(FILLER)
+        for _ in range(words)
+    ]
+    return ' '.join(tokens)
+
+
+def headline(rng: random.Random, i: int) -> str:
+    """Título no padrão do Google News ('<título> - <fonte>')"""
+    return (
+        f"{rng.choice(SUBJECTS)} {rng.choice(VERBS)} {rng.choice(KEYWORDS)} "
+        f"no {_sentence(rng, 4)} #{i} - {rng.choice(SOURCES)}"
+    )
+
+
+def news_texts(n: int, words: int = 60, seed: int = 0) -> List[str]:
+    """Corpus de `n` textos de notícia com ~`words` palavras cada"""
+    rng = random.Random(seed)
+    return [_sentence(rng, words) for _ in range(n)]
+
+
+def google_news_rss(query: str, n: int, seed: int = 0) -> bytes:
+    """
+    Feed RSS com `n` itens no formato do Google News
+
+    Mesmos elementos do feed real: title com a fonte no sufixo, link
+    news.google.com, guid, pubDate RFC 822, description em HTML escapado
+    e source.
+    """
+    rng = random.Random(f"{seed}:{query}")
+    items = []
+    for i in range(n):
+        title = headline(rng, i)
+        source = title.rsplit(' - ', 1)[-1]
+        link = f"https://news.google.com/rss/articles/CBMi{seed:04d}{rng.getrandbits(64):016x}{i:06d}?oc=5"
+        published = REFERENCE_DATE - timedelta(minutes=rng.randrange(0, 60 * 24 * 365))
+        description = f'<a href="{link}" target="_blank">{title}</a>&nbsp;&nbsp;<font color="#6f6f6f">{source}</font>'
+        items.append(
+            f"<item><title>{escape(title)}</title><link>{escape(link)}</link>"
+            f'<guid isPermaLink="false">{i:06d}</guid>'
+            f"<pubDate>{format_datetime(published, usegmt=True)}</pubDate>"
+            f"<description>{escape(description)}</description>"
+            f'<source url="https://www.example.com.br">{escape(source)}</source></item>'
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<rss version="2.0" xmlns:media="http://search.yahoo.com/mrss/"><channel>'
+        '<generator>NFE/5.0</generator>'
+        f'<title>"{escape(query)}" - Google Notícias</title>'
+        '<link>https://news.google.com/search?hl=pt-BR&amp;gl=BR&amp;ceid=BR:pt-419</link>'
+        '<language>pt-BR</language>'
+        f"{''.join(items)}</channel></rss>"
+    ).encode('utf-8')
+
+
+def synthetic_articles(n: int, seed: int = 0, queries: int = 10) -> List[NewsArticle]:
+    """`n` artigos completos (com sentimento), distribuídos em `queries` queries"""
+    rng = random.Random(seed)
+    labels = ('positive', 'negative', 'neutral')
+    articles = []
+    for i in range(n):
+        published = REFERENCE_DATE - timedelta(minutes=rng.randrange(0, 60 * 24 * 365))
+        polarity = round(rng.uniform(-1, 1), 4)
+        articles.append(NewsArticle(
+            url=f"https://news.google.com/rss/articles/CBMi{seed:04d}{i:010d}",
+            query=f"BBAS3 Banco do Brasil {2020 + i % queries}",
+            titulo_noticia=headline(rng, i),
+            publicada=published.isoformat(),
+            busca_feita=REFERENCE_DATE.isoformat(),
+            resumo=_sentence(rng, 25),
+            sentimentos=SentimentAnalysis(
+                polarity, round(rng.random(), 4), rng.choice(labels),
+                round(rng.random(), 4), rng.randrange(4), rng.randrange(4)
+            )
+        ))
+    return articles
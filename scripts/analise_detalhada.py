@@ -1,154 +1,157 @@
 """
 Análise detalhada de sentimentos com exemplos específicos e contexto
 """
-import json
+import heapq
+import sys
 from collections import Counter, defaultdict
-from dateutil import parser as dateparser
-import statistics
 from pathlib import Path
 
+# Adicionar diretório raiz ao path para imports
 BASE_DIR = Path(__file__).parent.parent
-JSON_FILE = BASE_DIR / "data" / "collected_articles_bbas3.json"
+sys.path.insert(0, str(BASE_DIR))
 
-# Carrega os dados
-with open(JSON_FILE, "r", encoding="utf-8") as f:
-    articles = json.load(f)
+from src.config import settings
+from src.models import parse_datetime
+from src.sinks import iter_article_dicts
+
+# Arquivo NDJSON gerado pela coleta (leitura em streaming)
+JSON_FILE = BASE_DIR / settings.app.json_output_file
+TOP_N = 10
+
+
+def push_top(heap, key, seq, item, n=TOP_N):
+    """Mantém os n maiores `key` em um heap mínimo"""
+    heapq.heappush(heap, (key, seq, item))
+    if len(heap) > n:
+        heapq.heappop(heap)
+
+
+def categorize_theme(query):
+    """Categoriza a query por tema"""
+    if "inadimplencia" in query.lower() or "agribusiness" in query.lower():
+        return "Inadimplência Agronegócio"
+    elif "resultados" in query.lower():
+        return "Resultados Financeiros"
+    elif "ofac" in query.lower() or "magnitsky" in query.lower():
+        return "Sanções Internacionais"
+    elif "B3" in query:
+        return "Mercado de Ações"
+    return "Geral"
+
+
+def summary(a):
+    """Campos usados na impressão (evita reter o artigo inteiro)"""
+    sent = a.get("sentimentos", {})
+    return {
+        "title": a.get("titulo_noticia", "Sem título")[:65],
+        "pub": (a.get("publicada") or "")[:10],
+        "polarity": sent.get("polarity", 0),
+        "confidence": sent.get("confidence", 0),
+        "label": sent.get("label", "neutral"),
+        "pos_kw": sent.get("positive_keywords", 0),
+        "neg_kw": sent.get("negative_keywords", 0),
+    }
+
+
+# Acumuladores de uma única passada sobre o arquivo
+labels = Counter()
+total = 0
+total_pos_keywords = 0
+total_neg_keywords = 0
+top_positive = []
+top_negative = []
+high_confidence = []
+sentiment_by_year = defaultdict(lambda: {"positive": 0, "negative": 0, "neutral": 0, "polarity_sum": 0.0})
+theme_sentiments = defaultdict(lambda: {"count": 0, "polarity_sum": 0.0, "positive": 0, "negative": 0, "neutral": 0})
+
+for a in iter_article_dicts(JSON_FILE):
+    total += 1
+    item = summary(a)
+    label = item["label"]
+    polarity = a.get("sentimentos", {}).get("polarity", 0.0)
+    labels[label] += 1
+    total_pos_keywords += item["pos_kw"]
+    total_neg_keywords += item["neg_kw"]
+
+    if label == "positive":
+        push_top(top_positive, item["polarity"], total, item)
+    elif label == "negative":
+        push_top(top_negative, -item["polarity"], total, item)
+    if item["confidence"] > 0.3:
+        push_top(high_confidence, item["confidence"], total, item)
+
+    # Análise temporal
+    dt = parse_datetime(a.get("publicada"))
+    if dt and label in ("positive", "negative", "neutral"):
+        year_data = sentiment_by_year[dt.year]
+        year_data[label] += 1
+        year_data["polarity_sum"] += polarity
+
+    # Análise por tema
+    theme = theme_sentiments[categorize_theme(a.get("query", ""))]
+    theme["count"] += 1
+    theme["polarity_sum"] += polarity
+    if label in ("positive", "negative", "neutral"):
+        theme[label] += 1
 
 print("="*80)
 print("ANÁLISE DETALHADA DE SENTIMENTOS - BBAS3/Banco do Brasil")
 print("="*80)
 
-# Separa artigos por categoria de sentimento
-positive_articles = [a for a in articles if a.get("sentimentos", {}).get("label") == "positive"]
-negative_articles = [a for a in articles if a.get("sentimentos", {}).get("label") == "negative"]
-neutral_articles = [a for a in articles if a.get("sentimentos", {}).get("label") == "neutral"]
+if total == 0:
+    print("\nNenhum artigo encontrado.")
+    sys.exit(0)
 
 print(f"\n📊 RESUMO GERAL:")
-print(f"   Total de artigos: {len(articles)}")
-print(f"   ✅ Positivos: {len(positive_articles)} ({len(positive_articles)/len(articles)*100:.1f}%)")
-print(f"   ❌ Negativos: {len(negative_articles)} ({len(negative_articles)/len(articles)*100:.1f}%)")
-print(f"   ⚪ Neutros: {len(neutral_articles)} ({len(neutral_articles)/len(articles)*100:.1f}%)")
+print(f"   Total de artigos: {total}")
+print(f"   ✅ Positivos: {labels['positive']} ({labels['positive']/total*100:.1f}%)")
+print(f"   ❌ Negativos: {labels['negative']} ({labels['negative']/total*100:.1f}%)")
+print(f"   ⚪ Neutros: {labels['neutral']} ({labels['neutral']/total*100:.1f}%)")
 
 # Análise de palavras-chave
 print(f"\n🔍 ANÁLISE DE PALAVRAS-CHAVE:")
-total_pos_keywords = sum(a.get("sentimentos", {}).get("positive_keywords", 0) for a in articles)
-total_neg_keywords = sum(a.get("sentimentos", {}).get("negative_keywords", 0) for a in articles)
 print(f"   Palavras-chave positivas detectadas: {total_pos_keywords}")
 print(f"   Palavras-chave negativas detectadas: {total_neg_keywords}")
-print(f"   Ratio positivo/negativo: {total_pos_keywords/total_neg_keywords if total_neg_keywords > 0 else 'N/A':.2f}")
+ratio = f"{total_pos_keywords/total_neg_keywords:.2f}" if total_neg_keywords > 0 else "N/A"
+print(f"   Ratio positivo/negativo: {ratio}")
 
 # Top 10 artigos mais polarizados
-print(f"\n📰 TOP 10 ARTIGOS MAIS POSITIVOS:")
-top_positive = sorted(positive_articles, 
-                     key=lambda x: x.get("sentimentos", {}).get("polarity", 0), 
-                     reverse=True)[:10]
-for i, a in enumerate(top_positive, 1):
-    sent = a.get("sentimentos", {})
-    title = a.get("titulo_noticia", "Sem título")[:65]
-    pol = sent.get("polarity", 0)
-    conf = sent.get("confidence", 0)
-    pos_kw = sent.get("positive_keywords", 0)
-    neg_kw = sent.get("negative_keywords", 0)
-    pub = a.get("publicada", "")[:10]
-    print(f"   [{i:2d}] {pol:6.4f} (conf:{conf:.2f}) [{pos_kw}+/{neg_kw}-] {pub} - {title}...")
-
-print(f"\n📰 TOP 10 ARTIGOS MAIS NEGATIVOS:")
-top_negative = sorted(negative_articles, 
-                     key=lambda x: x.get("sentimentos", {}).get("polarity", 0))[:10]
-for i, a in enumerate(top_negative, 1):
-    sent = a.get("sentimentos", {})
-    title = a.get("titulo_noticia", "Sem título")[:65]
-    pol = sent.get("polarity", 0)
-    conf = sent.get("confidence", 0)
-    pos_kw = sent.get("positive_keywords", 0)
-    neg_kw = sent.get("negative_keywords", 0)
-    pub = a.get("publicada", "")[:10]
-    print(f"   [{i:2d}] {pol:6.4f} (conf:{conf:.2f}) [{pos_kw}+/{neg_kw}-] {pub} - {title}...")
+for heading, heap in (("MAIS POSITIVOS", top_positive), ("MAIS NEGATIVOS", top_negative)):
+    print(f"\n📰 TOP 10 ARTIGOS {heading}:")
+    for i, (_, _, s) in enumerate(sorted(heap, reverse=True), 1):
+        print(f"   [{i:2d}] {s['polarity']:6.4f} (conf:{s['confidence']:.2f}) "
+              f"[{s['pos_kw']}+/{s['neg_kw']}-] {s['pub']} - {s['title']}...")
 
 # Análise temporal
 print(f"\n📅 ANÁLISE TEMPORAL DE SENTIMENTOS:")
-sentiment_by_year = defaultdict(lambda: {"positive": 0, "negative": 0, "neutral": 0, "polarities": []})
-
-for a in articles:
-    pubdate = a.get("publicada")
-    if pubdate:
-        try:
-            dt = dateparser.parse(pubdate)
-            year = dt.year
-            label = a.get("sentimentos", {}).get("label", "neutral")
-            polarity = a.get("sentimentos", {}).get("polarity", 0.0)
-            
-            sentiment_by_year[year][label] += 1
-            sentiment_by_year[year]["polarities"].append(polarity)
-        except:
-            pass
-
 for year in sorted(sentiment_by_year.keys()):
     data = sentiment_by_year[year]
     total_year = data["positive"] + data["negative"] + data["neutral"]
-    avg_pol = statistics.mean(data["polarities"]) if data["polarities"] else 0.0
+    avg_pol = data["polarity_sum"] / total_year if total_year else 0.0
     sentiment_trend = "📈 positivo" if avg_pol > 0.05 else "📉 negativo" if avg_pol < -0.05 else "➡️  neutro"
-    
+
     print(f"   {year}: {total_year:3d} artigos | "
           f"✅ {data['positive']:3d} | ❌ {data['negative']:3d} | ⚪ {data['neutral']:3d} | "
           f"Média: {avg_pol:7.4f} {sentiment_trend}")
 
 # Análise por tema
 print(f"\n🏷️  ANÁLISE POR TEMA:")
-theme_sentiments = defaultdict(lambda: {"articles": [], "polarities": []})
-
-for a in articles:
-    query = a.get("query", "")
-    polarity = a.get("sentimentos", {}).get("polarity", 0.0)
-    
-    # Categoriza por tema
-    if "inadimplencia" in query.lower() or "agribusiness" in query.lower():
-        theme = "Inadimplência Agronegócio"
-    elif "resultados" in query.lower():
-        theme = "Resultados Financeiros"
-    elif "ofac" in query.lower() or "magnitsky" in query.lower():
-        theme = "Sanções Internacionais"
-    elif "B3" in query:
-        theme = "Mercado de Ações"
-    else:
-        theme = "Geral"
-    
-    theme_sentiments[theme]["articles"].append(a)
-    theme_sentiments[theme]["polarities"].append(polarity)
-
 for theme in sorted(theme_sentiments.keys()):
     data = theme_sentiments[theme]
-    articles_count = len(data["articles"])
-    avg_pol = statistics.mean(data["polarities"]) if data["polarities"] else 0.0
-    
-    positive = sum(1 for a in data["articles"] if a.get("sentimentos", {}).get("label") == "positive")
-    negative = sum(1 for a in data["articles"] if a.get("sentimentos", {}).get("label") == "negative")
-    neutral = sum(1 for a in data["articles"] if a.get("sentimentos", {}).get("label") == "neutral")
-    
+    avg_pol = data["polarity_sum"] / data["count"] if data["count"] else 0.0
     sentiment_icon = "✅" if avg_pol > 0.05 else "❌" if avg_pol < -0.05 else "⚪"
-    
-    print(f"   {sentiment_icon} {theme:30s}: {articles_count:3d} artigos | "
+
+    print(f"   {sentiment_icon} {theme:30s}: {data['count']:3d} artigos | "
           f"Polaridade média: {avg_pol:7.4f} | "
-          f"+{positive} /{neutral} /-{negative}")
+          f"+{data['positive']} /{data['neutral']} /-{data['negative']}")
 
 # Artigos com alta confiança
 print(f"\n🎯 ARTIGOS COM ALTA CONFIANÇA (>0.3):")
-high_confidence = sorted(
-    [a for a in articles if a.get("sentimentos", {}).get("confidence", 0) > 0.3],
-    key=lambda x: x.get("sentimentos", {}).get("confidence", 0),
-    reverse=True
-)[:10]
-
-for i, a in enumerate(high_confidence, 1):
-    sent = a.get("sentimentos", {})
-    title = a.get("titulo_noticia", "Sem título")[:65]
-    pol = sent.get("polarity", 0)
-    conf = sent.get("confidence", 0)
-    label = sent.get("label", "neutral")
-    icon = "✅" if label == "positive" else "❌" if label == "negative" else "⚪"
-    print(f"   [{i:2d}] {icon} {conf:.4f} | pol:{pol:7.4f} | {title}...")
+for i, (_, _, s) in enumerate(sorted(high_confidence, reverse=True), 1):
+    icon = "✅" if s["label"] == "positive" else "❌" if s["label"] == "negative" else "⚪"
+    print(f"   [{i:2d}] {icon} {s['confidence']:.4f} | pol:{s['polarity']:7.4f} | {s['title']}...")
 
 print("\n" + "="*80)
 print(f"💾 Dados salvos em: {JSON_FILE}")
-print(f"🗄️  Dados no MongoDB: bigData.projeto_ativos")
+print(f"🗄️  Dados no MongoDB: {settings.mongodb.database}.{settings.mongodb.collection}")
 print("="*80)
@@ -1,5 +1,5 @@
 # Script rápido para análises apenas (sem recoletar dados)
-# Usa os dados já coletados em collected_articles_bbas3.json
+# Usa os dados já coletados em collected_articles_bbas3.ndjson
 
 $ErrorActionPreference = 'Continue'
 
@@ -8,8 +8,8 @@ Write-Host "  ANÁLISE RÁPIDA - DADOS EXISTENTES" -ForegroundColor Cyan
 Write-Host "========================================`n" -ForegroundColor Cyan
 
 # Verificar se arquivo JSON existe
-if (-Not (Test-Path ".\collected_articles_bbas3.json")) {
-    Write-Host "❌ Arquivo collected_articles_bbas3.json não encontrado." -ForegroundColor Red
+if (-Not (Test-Path ".\collected_articles_bbas3.ndjson")) {
+    Write-Host "❌ Arquivo collected_articles_bbas3.ndjson não encontrado." -ForegroundColor Red
     Write-Host "   Execute .\pipeline_completo.ps1 primeiro para coletar dados.`n" -ForegroundColor Yellow
     exit 1
 }
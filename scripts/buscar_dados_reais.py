@@ -1,217 +1,17 @@
-import yfinance as yf
-import pandas as pd
-from snowflake.connector import connect
-from snowflake.connector.pandas_tools import write_pandas
-from sqlalchemy import create_engine
-from datetime import datetime
+"""
+Busca cotações históricas da BBAS3 (Yahoo Finance) e carrega no PostgreSQL e no Snowflake
 
-# ================================
-# CONFIGURAÇÕES
-# ================================
+Atalho para `python -m src load prices` (aceita --dry-run e --since).
+Credenciais e conexões vêm do .env.
+"""
+import sys
+from pathlib import Path
 
-# Ação para buscar (BBAS3 = Banco do Brasil)
-# Nota: Use BBAS3.SAO se .SA não funcionar
-TICKER = "BBAS3.SAO"  # .SAO indica ações da B3 (Brasil)
-DATA_INICIO = "2020-01-01"
-DATA_FIM = datetime.now().strftime("%Y-%m-%d")
+# Adicionar diretório raiz ao path para imports
+BASE_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_DIR))
 
-# PostgreSQL
-pg_user = "postgres"
-pg_password = "llwk20051"
-pg_host = "localhost"
-pg_port = "5432"
-pg_db = "bigdata"
+from src.cli import main
 
-# Snowflake
-sf_user = "ZZPOWERTECHZZ"
-sf_password = "m#zzx3PiyAzRf7Tg"
-sf_account = "RYQPYZE-FW60752"
-sf_warehouse = "COMPUTE_WH"
-sf_database = "BBAS3"
-sf_schema = "PUBLIC"
-
-# ================================
-# BUSCAR DADOS DA API (Yahoo Finance)
-# ================================
-
-print(f"📊 Buscando dados de {TICKER} via API Yahoo Finance...")
-print(f"   Período: {DATA_INICIO} até {DATA_FIM}\n")
-
-# Baixar dados históricos com tratamento de erros SSL
-try:
-    acao = yf.Ticker(TICKER)
-    df = acao.history(start=DATA_INICIO, end=DATA_FIM)
-except Exception as e:
-    if "SSL" in str(e) or "certificate" in str(e):
-        print(f"⚠️  Erro de certificado SSL. Tentando sem validação SSL...")
-        # Desabilitar verificação SSL (usar com cuidado)
-        import ssl
-        ssl._create_default_https_context = ssl._create_unverified_context
-        try:
-            acao = yf.Ticker(TICKER)
-            df = acao.history(start=DATA_INICIO, end=DATA_FIM)
-        except Exception as e2:
-            print(f"❌ Erro mesmo sem validação SSL: {e2}")
-            df = pd.DataFrame()
-    else:
-        print(f"❌ Erro ao buscar dados: {e}")
-        df = pd.DataFrame()
-
-# Verificar se conseguiu dados
-if df.empty:
-    print(f"⚠️  Ticker {TICKER} não retornou dados. Tentando BBAS3.SA...")
-    TICKER = "BBAS3.SA"
-    try:
-        acao = yf.Ticker(TICKER)
-        df = acao.history(start=DATA_INICIO, end=DATA_FIM)
-    except Exception as e:
-        print(f"❌ Erro com BBAS3.SA: {e}")
-        df = pd.DataFrame()
-    
-    if df.empty:
-        print("❌ Nenhum ticker funcionou. Continuando sem dados históricos...")
-        print("   Possíveis causas:")
-        print("   - API Yahoo Finance temporariamente indisponível")
-        print("   - Ticker mudou de símbolo")
-        print("   - Problemas de conexão com internet")
-        print("\n✅ Pipeline continuará com coleta de notícias...\n")
-        # Criar DataFrame vazio com estrutura correta
-        df = pd.DataFrame(columns=['Date', 'Open', 'High', 'Low', 'Close', 'Volume'])
-        df['Variacao_Percentual'] = []
-        df = df.rename(columns={
-            'Date': 'Data',
-            'Open': 'Abertura',
-            'High': 'Maxima',
-            'Low': 'Minima',
-            'Close': 'Fechamento',
-            'Volume': 'Volume'
-        })
-        # Pular salvamento nos bancos se não há dados
-        print("⏭️  Pulando salvamento de dados históricos (sem dados)\n")
-        import sys
-        sys.exit(0)  # Exit 0 para não parar o pipeline
-
-# Resetar index para ter a data como coluna
-df.reset_index(inplace=True)
-
-# Converter data para formato de data simples (sem timezone)
-df['Date'] = pd.to_datetime(df['Date']).dt.date
-
-# Calcular variação percentual diária
-df['Variacao_Percentual'] = df['Close'].pct_change() * 100
-
-# Renomear colunas para português
-df = df.rename(columns={
-    'Date': 'Data',
-    'Open': 'Abertura',
-    'High': 'Maxima',
-    'Low': 'Minima',
-    'Close': 'Fechamento',
-    'Volume': 'Volume'
-})
-
-# Arredondar valores para 2 casas decimais
-df['Abertura'] = df['Abertura'].round(2)
-df['Maxima'] = df['Maxima'].round(2)
-df['Minima'] = df['Minima'].round(2)
-df['Fechamento'] = df['Fechamento'].round(2)
-df['Variacao_Percentual'] = df['Variacao_Percentual'].round(2)
-
-# Selecionar apenas as colunas necessárias
-df = df[['Data', 'Abertura', 'Maxima', 'Minima', 'Fechamento', 'Volume', 'Variacao_Percentual']]
-
-# Remover linhas com dados faltantes
-df = df.dropna()
-
-print(f"✅ {len(df)} registros obtidos da API!\n")
-print("📋 Primeiras 5 linhas:")
-print(df.head())
-print("\n📋 Últimas 5 linhas:")
-print(df.tail())
-
-# ================================
-# SALVAR NO POSTGRESQL
-# ================================
-
-print("\n" + "=" * 60)
-print("💾 SALVANDO NO POSTGRESQL")
-print("=" * 60)
-
-pg_engine = create_engine(
-    f"postgresql://{pg_user}:{pg_password}@{pg_host}:{pg_port}/{pg_db}"
-)
-
-nome_tabela_pg = "bbas3_dados_reais_api"
-
-df.to_sql(
-    nome_tabela_pg,
-    pg_engine,
-    if_exists='replace',  # Substitui se a tabela já existir
-    index=False
-)
-
-print(f"✅ Dados salvos no PostgreSQL na tabela '{nome_tabela_pg}'")
-
-# ================================
-# SALVAR NO SNOWFLAKE
-# ================================
-
-print("\n" + "=" * 60)
-print("❄️  SALVANDO NO SNOWFLAKE")
-print("=" * 60)
-
-sf_conn = connect(
-    user=sf_user,
-    password=sf_password,
-    account=sf_account,
-    warehouse=sf_warehouse,
-    database=sf_database,
-    schema=sf_schema,
-)
-
-nome_tabela_sf = "BBAS3_DADOS_REAIS_API"
-
-sucesso, conta, num_chunks, _ = write_pandas(
-    conn=sf_conn,
-    df=df,
-    table_name=nome_tabela_sf,
-    auto_create_table=True,
-    overwrite=True
-)
-
-print(f"✅ Dados salvos no Snowflake na tabela '{nome_tabela_sf}'")
-print(f"   → Sucesso: {sucesso}, Linhas inseridas: {conta}")
-
-# ================================
-# ESTATÍSTICAS DOS DADOS
-# ================================
-
-print("\n" + "=" * 60)
-print("📈 ESTATÍSTICAS DOS DADOS OBTIDOS")
-print("=" * 60)
-
-print(f"\nPeríodo coberto:")
-print(f"  De: {df['Data'].min()}")
-print(f"  Até: {df['Data'].max()}")
-print(f"  Total de dias: {len(df)}")
-
-print(f"\nPreço de Fechamento:")
-print(f"  Mínimo: R$ {df['Fechamento'].min():.2f}")
-print(f"  Máximo: R$ {df['Fechamento'].max():.2f}")
-print(f"  Médio: R$ {df['Fechamento'].mean():.2f}")
-
-print(f"\nVariação Diária:")
-print(f"  Maior alta: {df['Variacao_Percentual'].max():.2f}%")
-print(f"  Maior queda: {df['Variacao_Percentual'].min():.2f}%")
-print(f"  Média: {df['Variacao_Percentual'].mean():.2f}%")
-
-print(f"\nVolume:")
-print(f"  Médio diário: {df['Volume'].mean():,.0f} ações")
-print(f"  Máximo: {df['Volume'].max():,.0f} ações")
-
-sf_conn.close()
-
-print("\n🎉 Processo concluído com sucesso!")
-print("\nPróximos passos:")
-print("  1. Execute o script 'transformar_dados_api.py' para criar o modelo dimensional")
-print("  2. Use as views criadas para análises no Snowflake")
+if __name__ == "__main__":
+    sys.exit(main(['load', 'prices', *sys.argv[1:]]))
@@ -61,7 +61,7 @@ Write-Host "  ✅ PIPELINE CONCLUÍDO COM SUCESSO!" -ForegroundColor Green
 Write-Host "========================================" -ForegroundColor Cyan
 
 Write-Host "`n📁 Arquivos gerados:" -ForegroundColor White
-Write-Host "   • collected_articles_bbas3.json (arquivo local)" -ForegroundColor Gray
+Write-Host "   • collected_articles_bbas3.ndjson (arquivo local)" -ForegroundColor Gray
 Write-Host "   • MongoDB: bigData.projeto_ativos (banco de dados)" -ForegroundColor Gray
 
 Write-Host "`n⏱️  Tempo total de execução: $($duration.Minutes) min $($duration.seconds) seg" -ForegroundColor White
@@ -122,7 +122,7 @@ Write-Host "`n📁 Dados Disponíveis:" -ForegroundColor White
 Write-Host "   ├─ MongoDB: bigData.projeto_ativos (notícias)" -ForegroundColor Gray
 Write-Host "   ├─ PostgreSQL: bigdata.bbas3_dados_reais_api (cotações)" -ForegroundColor Gray
 Write-Host "   ├─ PostgreSQL: bigdata.dados_mong (notícias)" -ForegroundColor Gray
-Write-Host "   └─ JSON local: collected_articles_bbas3.json" -ForegroundColor Gray
+Write-Host "   └─ JSON local: collected_articles_bbas3.ndjson" -ForegroundColor Gray
 
 Write-Host "`n❄️  Snowflake Data Warehouse:" -ForegroundColor White
 Write-Host "   Database: BBAS3" -ForegroundColor Gray
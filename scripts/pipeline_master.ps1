@@ -135,7 +135,7 @@ Write-Success "Noticias coletadas com sucesso"
 Write-Info "MongoDB: bigData.projeto_ativos (estrutura nested)"
 Write-Info "PostgreSQL: bigdata.noticias_bbas3 (estrutura flat)"
 Write-Info "Snowflake: BBAS3.PUBLIC.DADOS_MONG (estrutura flat)"
-Write-Info "Local: data/collected_articles_bbas3.json"
+Write-Info "Local: data/collected_articles_bbas3.ndjson"
 
 # ===============================================================================
 # FASE 3: ANALISE DE SENTIMENTOS E VALIDACAO
@@ -211,7 +211,7 @@ Write-Host "   [OK] Validacoes e relatorios gerados" -ForegroundColor $green
 Write-Host "`nDados Armazenados:" -ForegroundColor $white
 Write-Host ""
 Write-Host "   LOCAL:" -ForegroundColor $yellow
-Write-Host "      - data/collected_articles_bbas3.json" -ForegroundColor $gray
+Write-Host "      - data/collected_articles_bbas3.ndjson" -ForegroundColor $gray
 Write-Host ""
 Write-Host "   MONGODB (Nested - Analise agregada):" -ForegroundColor $yellow
 Write-Host "      - Database: bigData" -ForegroundColor $gray
@@ -0,0 +1,53 @@
+"""
+Recalcula os sentimentos de todos os artigos armazenados no MongoDB
+usando vários processos em paralelo.
+
+Uso:
+    python scripts/reprocessar_sentimentos.py --workers 16 --chunk-size 500
+"""
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+# Adicionar diretório raiz ao path para imports
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from src.config import settings
+from src.repositories import MongoDBRepository
+from src.services import SentimentRescoringService
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-score de sentimentos no MongoDB")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Processos paralelos (padrão: número de CPUs)")
+    parser.add_argument('--chunk-size', type=int, default=500,
+                        help="Artigos por lote enviado a cada processo")
+    parser.add_argument('--dry-run', action='store_true',
+                        help="Calcula os sentimentos sem gravar no MongoDB")
+    args = parser.parse_args()
+
+    repository = MongoDBRepository(config=settings.mongodb)
+    try:
+        service = SentimentRescoringService(
+            repository,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            dry_run=args.dry_run
+        )
+        stats = service.run()
+        logger.info(f"📊 {stats['articles_per_second']} artigos/s")
+    finally:
+        repository.close()
+
+
+if __name__ == "__main__":
+    main()
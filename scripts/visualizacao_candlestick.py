@@ -152,5 +152,7 @@ fig.update_xaxes(title_text="Data", row=2, col=1)
 output_file = root_dir / 'data' / 'grafico_candlestick.html'
 fig.write_html(str(output_file))
 print(f"\n✅ Gráfico salvo em: {output_file}")
-print("🌐 Abrindo no navegador...")
-fig.show()
+# --no-show: só grava o HTML (execução pelo orquestrador)
+if "--no-show" not in sys.argv:
+    print("🌐 Abrindo no navegador...")
+    fig.show()
@@ -140,5 +140,7 @@ fig.update_yaxes(title_text="Ano")
 output_file = root_dir / 'data' / 'heatmap_correlacao.html'
 fig.write_html(str(output_file))
 print(f"\n✅ Heatmap salvo em: {output_file}")
-print("🌐 Abrindo no navegador...")
-fig.show()
+# --no-show: só grava o HTML (execução pelo orquestrador)
+if "--no-show" not in sys.argv:
+    print("🌐 Abrindo no navegador...")
+    fig.show()
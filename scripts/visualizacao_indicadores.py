@@ -172,5 +172,7 @@ fig.update_yaxes(title_text="Volume", row=4, col=1)
 output_file = root_dir / 'data' / 'dashboard_indicadores.html'
 fig.write_html(str(output_file))
 print(f"\n✅ Dashboard salvo em: {output_file}")
-print("🌐 Abrindo no navegador...")
-fig.show()
+# --no-show: só grava o HTML (execução pelo orquestrador)
+if "--no-show" not in sys.argv:
+    print("🌐 Abrindo no navegador...")
+    fig.show()
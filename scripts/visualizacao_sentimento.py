@@ -138,5 +138,7 @@ fig.add_hline(y=0, line_dash="dash", line_color="white", opacity=0.3, secondary_
 output_file = root_dir / 'data' / 'correlacao_sentimento_preco.html'
 fig.write_html(str(output_file))
 print(f"\n✅ Gráfico salvo em: {output_file}")
-print("🌐 Abrindo no navegador...")
-fig.show()
+# --no-show: só grava o HTML (execução pelo orquestrador)
+if "--no-show" not in sys.argv:
+    print("🌐 Abrindo no navegador...")
+    fig.show()
@@ -0,0 +1,6 @@
+"""Permite executar a CLI com `python -m src`"""
+import sys
+
+from src.cli import main
+
+sys.exit(main())
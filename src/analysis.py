@@ -0,0 +1,140 @@
+"""
+Análise de sentimentos do arquivo NDJSON coletado
+Resumo em uma única passada (memória não cresce com os artigos)
+"""
+import heapq
+import statistics
+from array import array
+from collections import Counter, defaultdict
+from datetime import date
+from typing import Any, Dict, Optional
+
+from src.models import parse_datetime
+from src.sinks import iter_article_dicts
+
+
+def summarize_sentiments(path: str, since: Optional[date] = None, top: int = 3) -> Dict[str, Any]:
+    """
+    Resume os sentimentos dos artigos de um arquivo NDJSON
+
+    Args:
+        path: Arquivo gerado pela coleta
+        since: Considera só artigos publicados a partir desta data
+        top: Quantidade de artigos mais positivos/negativos
+
+    Returns:
+        Dict com total, distribuição, polaridade, confiança, médias por
+        query, artigos extremos e contagem por ano
+    """
+    total = 0
+    sentiments = Counter()
+    polarities = array('d')
+    subjectivity_sum = 0.0
+    confidence_sum = 0.0
+    most_negative = []  # heap (-polaridade, ordem, título)
+    most_positive = []  # heap (polaridade, ordem, título)
+    years = Counter()
+    sentiment_by_query = defaultdict(lambda: [0.0, 0])
+
+    for a in iter_article_dicts(path):
+        dt = parse_datetime(a.get("publicada"))
+        if since and (dt is None or dt.date() < since):
+            continue
+
+        sent = a.get("sentimentos", {})
+        polarity = sent.get("polarity", 0.0)
+        title = a.get("titulo_noticia", "Sem título")
+
+        total += 1
+        sentiments[sent.get("label", "neutral")] += 1
+        polarities.append(polarity)
+        subjectivity_sum += sent.get("subjectivity", 0.0)
+        confidence_sum += sent.get("confidence", 0.0)
+
+        heapq.heappush(most_negative, (-polarity, total, title))
+        if len(most_negative) > top:
+            heapq.heappop(most_negative)
+        heapq.heappush(most_positive, (polarity, total, title))
+        if len(most_positive) > top:
+            heapq.heappop(most_positive)
+
+        if dt:
+            years[dt.year] += 1
+
+        acc = sentiment_by_query[a.get("query", "desconhecido")]
+        acc[0] += polarity
+        acc[1] += 1
+
+    summary: Dict[str, Any] = {'total': total}
+    if not total:
+        return summary
+
+    summary.update({
+        'sentiments': dict(sentiments.most_common()),
+        'polarity': {
+            'mean': statistics.mean(polarities),
+            'median': statistics.median(polarities),
+            'stdev': statistics.stdev(polarities) if len(polarities) > 1 else 0.0,
+            'min': min(polarities),
+            'max': max(polarities),
+        },
+        'confidence_mean': confidence_sum / total,
+        'subjectivity_mean': subjectivity_sum / total,
+        'query_polarity': {
+            q: round(s / n, 4) if n else 0.0
+            for q, (s, n) in sentiment_by_query.items()
+        },
+        'most_negative': [(-p, title) for p, _, title in sorted(most_negative, reverse=True)],
+        'most_positive': [(p, title) for p, _, title in sorted(most_positive, reverse=True)],
+        'years': dict(sorted(years.items())),
+    })
+    return summary
+
+
+def format_summary(summary: Dict[str, Any]) -> str:
+    """Texto do resumo no formato do antigo scripts/sentimentos.py"""
+    total = summary['total']
+    lines = [
+        "=" * 60,
+        "=== ANÁLISE DE SENTIMENTOS - BBAS3/Banco do Brasil ===",
+        "=" * 60,
+        f"\nTotal de artigos analisados: {total}",
+    ]
+    if not total:
+        return "\n".join(lines)
+
+    lines.append("\n--- Distribuição de Sentimento ---")
+    for k, v in summary['sentiments'].items():
+        lines.append(f"  {k.capitalize():12s}: {v:3d} ({v / total * 100:5.1f}%)")
+
+    polarity = summary['polarity']
+    lines += [
+        "\n--- Métricas de Polaridade ---",
+        f"  Polaridade média:    {polarity['mean']:7.4f}",
+        f"  Polaridade mediana:  {polarity['median']:7.4f}",
+        f"  Desvio padrão:       {polarity['stdev']:7.4f}",
+        f"  Mínimo (negativo):   {polarity['min']:7.4f}",
+        f"  Máximo (positivo):   {polarity['max']:7.4f}",
+        "\n--- Métricas de Confiança ---",
+        f"  Confiança média:     {summary['confidence_mean']:7.4f}",
+        f"  Subjetividade média: {summary['subjectivity_mean']:7.4f}",
+        "\n--- Sentimento Médio por Query ---",
+    ]
+    for query, avg_pol in sorted(summary['query_polarity'].items(), key=lambda x: x[1], reverse=True):
+        label = "positivo" if avg_pol > 0.05 else "negativo" if avg_pol < -0.05 else "neutro"
+        lines.append(f"  {avg_pol:7.4f} ({label:8s}): {query[:50]}")
+
+    lines.append("\n--- Artigos Mais NEGATIVOS ---")
+    for i, (pol, title) in enumerate(summary['most_negative'], 1):
+        lines.append(f"  [{i}] {pol:7.4f} - {title[:70]}...")
+
+    lines.append("\n--- Artigos Mais POSITIVOS ---")
+    for i, (pol, title) in enumerate(summary['most_positive'], 1):
+        lines.append(f"  [{i}] {pol:7.4f} - {title[:70]}...")
+
+    lines.append("\n--- Artigos por Ano ---")
+    for y, c in summary['years'].items():
+        lines.append(f"  {y}: {c} artigos")
+
+    lines.append("\n" + "=" * 60)
+    return "\n".join(lines)
@@ -0,0 +1,166 @@
+"""
+Backfill por janelas de data
+Divide cada query em buscas `after:`/`before:` para ultrapassar o limite
+de entradas por feed do Google News RSS
+"""
+import logging
+import re
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from src.models import NewsArticle, generate_url_hash
+from src.services import NewsCollectorService
+
+logger = logging.getLogger(__name__)
+
+# Sufixo de ano usado nas queries de amostragem ("... resultados 2024")
+_YEAR_SUFFIX_RE = re.compile(r'\s+(19|20)\d{2}$')
+
+
+def base_queries(queries: Iterable[str]) -> List[str]:
+    """Remove o sufixo de ano das queries e elimina repetições"""
+    result = []
+    for query in queries:
+        base = _YEAR_SUFFIX_RE.sub('', query.strip())
+        if base not in result:
+            result.append(base)
+    return result
+
+
+@dataclass(frozen=True)
+class DateWindow:
+    """Intervalo de datas [start, end) de uma busca"""
+    start: date
+    end: date
+
+    @property
+    def days(self) -> int:
+        return (self.end - self.start).days
+
+    def split(self) -> Tuple['DateWindow', 'DateWindow']:
+        """Divide a janela ao meio"""
+        middle = self.start + timedelta(days=self.days // 2)
+        return DateWindow(self.start, middle), DateWindow(middle, self.end)
+
+    def apply(self, query: str) -> str:
+        """Query restrita à janela (operadores do Google News)"""
+        return f"{query} after:{self.start.isoformat()} before:{self.end.isoformat()}"
+
+
+class DateWindowBackfill:
+    """
+    Coleta de histórico por janelas de data adaptativas
+
+    Cada query base começa em janelas de `initial_window_days`. Uma janela
+    cujo feed atinge `saturation` entradas foi truncada pelo Google News e
+    é dividida ao meio (até `min_window_days`); as demais custam uma única
+    requisição. As janelas de todas as queries são buscadas em paralelo
+    pelo coletor e os artigos são mesclados sem repetir `url_hash`.
+    """
+
+    def __init__(
+        self,
+        collector: NewsCollectorService,
+        start: date,
+        end: date,
+        initial_window_days: int = 365,
+        min_window_days: int = 1,
+        saturation: Optional[int] = None
+    ):
+        self.collector = collector
+        self.start = start
+        self.end = end
+        self.initial_window_days = max(1, initial_window_days)
+        self.min_window_days = max(1, min_window_days)
+        self.saturation = saturation or collector.max_per_query
+        # Estatísticas da última execução
+        self.requests = 0
+        self.splits = 0
+
+    def windows(self) -> List[DateWindow]:
+        """Janelas iniciais cobrindo [start, end)"""
+        windows = []
+        current = self.start
+        while current < self.end:
+            upper = min(current + timedelta(days=self.initial_window_days), self.end)
+            windows.append(DateWindow(current, upper))
+            current = upper
+        return windows
+
+    def _collect_window(self, query: str, window: DateWindow) -> Tuple[List[NewsArticle], int]:
+        articles, feed_size = self.collector.collect_with_feed_size(window.apply(query))
+        # Artigos ficam associados à query base, não à janela
+        for article in articles:
+            article.query = query
+        return articles, feed_size
+
+    def iter_query_results(self, queries: Iterable[str]) -> Iterator[Tuple[Optional[str], List[NewsArticle]]]:
+        """
+        Gera artigos novos de cada janela assim que ela termina
+
+        Janelas intermediárias são geradas como (None, artigos); a última
+        janela de cada query base é gerada como (query, artigos), indicando
+        que a query foi concluída.
+        """
+        self.requests = 0
+        self.splits = 0
+        seen_hashes: Set[str] = set()
+        remaining: Dict[str, int] = {}
+        failed: Set[str] = set()
+        work = []
+        for query in queries:
+            windows = self.windows()
+            remaining[query] = len(windows)
+            work.extend((query, window) for window in windows)
+        work.reverse()
+
+        workers = self.collector.max_workers
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='backfill') as executor:
+            pending = {}
+
+            def submit_more():
+                while work and len(pending) < workers:
+                    query, window = work.pop()
+                    pending[executor.submit(self._collect_window, query, window)] = (query, window)
+                    self.requests += 1
+
+            submit_more()
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    query, window = pending.pop(future)
+                    remaining[query] -= 1
+                    try:
+                        articles, feed_size = future.result()
+                    except Exception as e:
+                        logger.error(f"❌ Erro na janela {window.start}–{window.end} de '{query}': {e}")
+                        # Query com janela falha nunca é dada como concluída
+                        failed.add(query)
+                        articles, feed_size = [], 0
+
+                    if feed_size >= self.saturation and window.days > self.min_window_days:
+                        # Janela truncada: busca as metades (os artigos já
+                        # coletados são mantidos e deduplicados adiante)
+                        halves = window.split()
+                        work.extend((query, half) for half in reversed(halves))
+                        remaining[query] += len(halves)
+                        self.splits += 1
+                        logger.info(
+                            f"✂️  Janela saturada ({feed_size} entradas), dividindo: "
+                            f"{query} {window.start}–{window.end}"
+                        )
+
+                    new_articles = []
+                    for article in articles:
+                        url_hash = generate_url_hash(article.url)
+                        if url_hash not in seen_hashes:
+                            seen_hashes.add(url_hash)
+                            new_articles.append(article)
+
+                    submit_more()
+                    finished = remaining[query] == 0 and query not in failed
+                    yield (query if finished else None), new_articles
+
+        logger.info(f"📚 Backfill: {self.requests} requisições, {self.splits} janelas divididas")
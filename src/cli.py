@@ -0,0 +1,267 @@
+"""
+CLI unificada do pipeline BBAS3
+
+    python -m src collect [--dry-run] [--since D] [--workers N] [--resume] [--backfill] [--until D]
+    python -m src load prices|articles [--dry-run] [--since D]
+    python -m src load migrate [--dry-run]
+    python -m src transform {prices,news,correlation,all} [--dry-run]
+    python -m src analyze [--since D] [--file ARQUIVO]
+    python -m src run [ETAPA ...] [--dry-run] [--since D] [--workers N]
+    python -m src dag [ETAPA ...] [--force] [--list]
+
+Cada comando registra só as opções que respeita (migração e transformações
+sempre processam as tabelas inteiras, então não aceitam --since). `run`
+recusa opções que nenhuma das etapas escolhidas respeita. `run` encadeia
+etapas em sequência no mesmo processo, compartilhando o pool PostgreSQL e
+a sessão Snowflake (um único login por execução); `dag` executa o pipeline
+completo como DAG, com ramos independentes em paralelo e cache por etapa.
+"""
+import argparse
+import logging
+from datetime import date
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from src import metrics
+from src.config import Settings, get_settings
+from src.context import PipelineContext
+
+logger = logging.getLogger(__name__)
+
+# Etapas padrão de `run`: coleta (já grava nos bancos) → migração → transformações
+DEFAULT_RUN = ["collect", "load:migrate", "transform:all"]
+
+# Opções globais e as etapas que de fato as respeitam
+GLOBAL_OPTIONS = ('dry_run', 'since', 'workers')
+STAGE_OPTIONS = {
+    'collect': {'dry_run', 'since', 'workers'},
+    'load:prices': {'dry_run', 'since'},
+    'load:articles': {'dry_run', 'since'},
+    'load:migrate': {'dry_run'},
+    'transform': {'dry_run'},
+    'analyze': {'since'},
+}
+
+
+def _collect(context: PipelineContext, args: argparse.Namespace) -> Dict[str, Any]:
+    from src.collection import run_collection
+    return run_collection(
+        context,
+        resume=args.resume,
+        backfill=args.backfill,
+        until=args.until,
+        checkpoint_path=args.checkpoint
+    )
+
+
+def _load(context: PipelineContext, args: argparse.Namespace) -> Dict[str, Any]:
+    if args.target == 'prices':
+        from src.prices import load_prices
+        return load_prices(context)
+    if args.target == 'articles':
+        from src.loaders import load_articles
+        return load_articles(context, args.file or context.settings.app.json_output_file)
+    from src.loaders import MIGRATION_TABLES, migrate_tables
+    return migrate_tables(context, args.tables or MIGRATION_TABLES)
+
+
+def _transform(context: PipelineContext, args: argparse.Namespace) -> Dict[str, List[str]]:
+    from src.transforms import TRANSFORMS, run_transforms
+    groups = list(TRANSFORMS) if args.group == 'all' else [args.group]
+    return {group: run_transforms(context, group) for group in groups}
+
+
+def _analyze(context: PipelineContext, args: argparse.Namespace) -> Dict[str, Any]:
+    from src.analysis import format_summary, summarize_sentiments
+    summary = summarize_sentiments(args.file or context.settings.app.json_output_file, since=context.since)
+    print(format_summary(summary))
+    return summary
+
+
+def _run(context: PipelineContext, args: argparse.Namespace) -> Dict[str, Any]:
+    # Etapas já validadas por parse_args antes de executar a primeira
+    results = {}
+    for stage, stage_args in args.stage_args:
+        logger.info(f"▶️  Etapa {stage}")
+        results[stage] = stage_args.handler(context, stage_args)
+    return results
+
+
+def _dag(context: PipelineContext, args: argparse.Namespace) -> Dict[str, Any]:
+    from src.orchestrator import FAILED, DAGRunner, StageCache, pipeline_stages
+    settings = context.settings
+    runner = DAGRunner(
+        pipeline_stages(),
+        cache=StageCache(settings.app.orchestrator_cache_path or None),
+        max_workers=args.jobs or settings.app.orchestrator_workers
+    )
+    try:
+        selected = runner.select(args.stages)
+    except ValueError as e:
+        raise SystemExit(f"❌ {e}")
+    if args.list:
+        for name in selected:
+            depends_on = runner.stages[name].depends_on
+            print(f"{name}" + (f" ← {', '.join(depends_on)}" if depends_on else ""))
+        return {}
+
+    results = runner.run(context, targets=args.stages, force=args.force)
+    logger.info("📋 Etapas: " + ", ".join(f"{name}={result.status}" for name, result in results.items()))
+    failed = [name for name, result in results.items() if result.status == FAILED]
+    if failed:
+        raise SystemExit(f"❌ Etapas com erro: {', '.join(failed)}")
+    return {
+        name: {'status': result.status, 'seconds': result.seconds, 'result': result.result}
+        for name, result in results.items()
+    }
+
+
+def _options(stage_args: argparse.Namespace) -> Set[str]:
+    """Opções globais respeitadas por uma etapa (comando[:alvo])"""
+    key = stage_args.command
+    if key == 'load':
+        key = f"load:{stage_args.target}"
+    return STAGE_OPTIONS[key]
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Argumentos de linha de comando"""
+    dry_run = argparse.ArgumentParser(add_help=False)
+    dry_run.add_argument(
+        '--dry-run', action='store_true',
+        help="executa sem gravar em bancos, arquivos ou Snowflake"
+    )
+    since = argparse.ArgumentParser(add_help=False)
+    since.add_argument(
+        '--since', type=date.fromisoformat,
+        help="considera só dados a partir desta data (AAAA-MM-DD)"
+    )
+    workers = argparse.ArgumentParser(add_help=False)
+    workers.add_argument(
+        '--workers', type=int,
+        help="threads de coleta (padrão: COLLECTOR_WORKERS)"
+    )
+
+    parser = argparse.ArgumentParser(prog="python -m src", description="Pipeline de dados BBAS3")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    collect = commands.add_parser(
+        'collect', parents=[dry_run, since, workers], help="coleta notícias e grava nos bancos"
+    )
+    collect.add_argument(
+        '--resume', action='store_true',
+        help="continua a execução anterior a partir do checkpoint"
+    )
+    collect.add_argument(
+        '--checkpoint',
+        help="arquivo de checkpoint (padrão: CHECKPOINT_PATH)"
+    )
+    collect.add_argument(
+        '--backfill', action='store_true',
+        help="coleta histórico dividindo cada query em janelas de data (início: --since)"
+    )
+    collect.add_argument(
+        '--until', type=date.fromisoformat,
+        help="fim do backfill (AAAA-MM-DD; padrão: amanhã)"
+    )
+    collect.set_defaults(handler=_collect)
+
+    load = commands.add_parser(
+        'load', parents=[dry_run, since], help="carrega cotações, NDJSON ou migra tabelas"
+    )
+    load.add_argument(
+        'target', choices=['prices', 'articles', 'migrate'],
+        help="prices: Yahoo Finance → PostgreSQL/Snowflake; articles: NDJSON → bancos; "
+             "migrate: PostgreSQL → Snowflake (tabelas inteiras, sem --since)"
+    )
+    load.add_argument('--file', help="arquivo NDJSON de `articles` (padrão: OUTPUT_JSON)")
+    load.add_argument('--tables', nargs='+', help="tabelas de `migrate`")
+    load.set_defaults(handler=_load)
+
+    transform = commands.add_parser(
+        'transform', parents=[dry_run], help="recria tabelas e views no Snowflake (sempre completas)"
+    )
+    transform.add_argument('group', choices=['prices', 'news', 'correlation', 'all'])
+    transform.set_defaults(handler=_transform)
+
+    analyze = commands.add_parser('analyze', parents=[since], help="resumo de sentimentos do NDJSON")
+    analyze.add_argument('--file', help="arquivo NDJSON (padrão: OUTPUT_JSON)")
+    analyze.set_defaults(handler=_analyze)
+
+    run = commands.add_parser(
+        'run', parents=[dry_run, since, workers],
+        help="encadeia etapas no mesmo processo (opções valem para as etapas que as respeitam)"
+    )
+    run.add_argument(
+        'stages', nargs='*', metavar='ETAPA',
+        help=f"etapas no formato comando[:alvo] (padrão: {' '.join(DEFAULT_RUN)})"
+    )
+    run.set_defaults(handler=_run)
+
+    dag = commands.add_parser(
+        'dag', parents=[dry_run, since, workers],
+        help="pipeline completo em DAG com cache por etapa (--since: cotações e coleta; "
+             "--workers: coleta)"
+    )
+    dag.add_argument(
+        'stages', nargs='*', metavar='ETAPA',
+        help="etapas desejadas, com suas dependências (padrão: todas)"
+    )
+    dag.add_argument('--force', action='store_true', help="ignora o cache e executa todas as etapas")
+    dag.add_argument('--list', action='store_true', help="lista as etapas e dependências sem executar")
+    dag.add_argument('--jobs', type=int, help="etapas em paralelo (padrão: ORCHESTRATOR_WORKERS)")
+    dag.set_defaults(handler=_dag)
+
+    args = parser.parse_args(argv)
+    passed = {option for option in GLOBAL_OPTIONS if getattr(args, option, None)}
+
+    if args.command == 'load' and passed - _options(args):
+        parser.error(f"load {args.target} não aceita --since (copia as tabelas inteiras)")
+
+    if args.command == 'run':
+        # Valida todas as etapas antes de executar a primeira
+        args.stage_args = []
+        for stage in args.stages or DEFAULT_RUN:
+            stage_args = parse_args(stage.split(':'))
+            if stage_args.command in ('run', 'dag'):
+                parser.error(f"etapa inválida em run: {stage}")
+            args.stage_args.append((stage, stage_args))
+        honored = set().union(*(_options(stage_args) for _, stage_args in args.stage_args))
+        ignored = passed - honored
+        if ignored:
+            flags = ', '.join('--' + option.replace('_', '-') for option in sorted(ignored))
+            parser.error(f"{flags} não é respeitado por nenhuma das etapas: {' '.join(args.stages or DEFAULT_RUN)}")
+
+    return args
+
+
+def main(argv: Optional[List[str]] = None, settings: Optional[Settings] = None) -> int:
+    """Executa um comando; conexões são fechadas ao final"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(message)s"
+    )
+    args = parse_args(argv)
+    settings = settings or get_settings()
+    if settings.app.metrics_enabled:
+        metrics.enable()
+
+    handler: Callable[[PipelineContext, argparse.Namespace], Any] = args.handler
+    context = PipelineContext(
+        settings,
+        dry_run=getattr(args, 'dry_run', False),
+        since=getattr(args, 'since', None),
+        workers=getattr(args, 'workers', None)
+    )
+    with context:
+        result = handler(context, args)
+
+    # Resumo de métricas da execução (JSON e, opcionalmente, Prometheus)
+    if metrics.enabled():
+        metrics.write_json(
+            settings.app.metrics_json_file,
+            extra={'command': args.command, 'result': result}
+        )
+        logger.info(f"📈 Métricas: {settings.app.metrics_json_file}")
+        if settings.app.metrics_prometheus_file:
+            metrics.write_prometheus(settings.app.metrics_prometheus_file)
+    return 0
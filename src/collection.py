@@ -0,0 +1,223 @@
+"""
+Etapa de coleta de notícias
+Google News RSS (ou fontes configuradas) → sentimento → micro-lotes
+gravados nos repositórios habilitados e no NDJSON local
+"""
+import logging
+import math
+from datetime import date, timedelta
+from typing import Any, Dict, Optional
+
+from src.backfill import DateWindowBackfill, base_queries
+from src.context import PipelineContext
+from src.fetchers import CircuitBreaker, RetryPolicy
+from src.pipeline import StreamingPipeline
+from src.services import NewsCollectorService, NewsPersistenceService, SentimentAnalysisService
+from src.sinks import NDJSONSink
+from src.sources import MultiSourceCollector, build_sources
+from src.state import CollectionCheckpoint, SeenArticleIndex, SentimentCache
+
+logger = logging.getLogger(__name__)
+
+
+def run_collection(
+    context: PipelineContext,
+    resume: bool = False,
+    backfill: bool = False,
+    until: Optional[date] = None,
+    checkpoint_path: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Coleta as queries configuradas e grava em streaming
+
+    Em `context.dry_run` os artigos são coletados e analisados, mas nada é
+    gravado: sem repositórios, NDJSON, checkpoint, cache HTTP de feeds ou
+    índices em disco (índices e caches ficam só em memória).
+
+    Returns:
+        Dict com run_id, estatísticas do pipeline e do cache de sentimento
+    """
+    settings = context.settings
+    dry_run = context.dry_run
+
+    logger.info("="*60)
+    logger.info("🚀 INICIANDO COLETA DE NOTÍCIAS BBAS3" + (" (dry-run)" if dry_run else ""))
+    logger.info("="*60)
+
+    # Checkpoint da execução (queries concluídas e lotes gravados)
+    checkpoint = None
+    if not dry_run:
+        checkpoint = CollectionCheckpoint(checkpoint_path or settings.app.checkpoint_path, resume=resume)
+        if checkpoint.finished:
+            logger.info(f"✅ Execução {checkpoint.run_id} já foi concluída; nada a retomar")
+            return {'run_id': checkpoint.run_id, 'pipeline': None}
+
+    # Inicializa serviços
+    sentiment_cache = SentimentCache(
+        max_size=settings.app.sentiment_cache_size,
+        path=None if dry_run else settings.app.sentiment_cache_path or None
+    )
+    sentiment_service = SentimentAnalysisService(cache=sentiment_cache)
+
+    # Índice local de artigos já persistidos (coleta incremental)
+    seen_index = None
+    if settings.app.seen_index_path:
+        seen_index = SeenArticleIndex(':memory:' if dry_run else settings.app.seen_index_path)
+        logger.info(f"🗂️  Índice local: {seen_index.count()} artigos já coletados")
+
+    # Índice de quase-duplicatas (mesma matéria em veículos diferentes)
+    near_duplicates = None
+    if settings.app.near_dup_index_path:
+        # Importado aqui: numpy só é carregado com o índice ativo
+        from src.dedup import NearDuplicateIndex
+        near_duplicates = NearDuplicateIndex(
+            ':memory:' if dry_run else settings.app.near_dup_index_path,
+            threshold=settings.app.near_dup_threshold
+        )
+
+    # Backfill: queries sem sufixo de ano, buscadas por janelas de data
+    queries = settings.queries
+    max_years_back = settings.app.max_years_back
+    since = context.since
+    if backfill:
+        queries = base_queries(settings.queries)
+        until = until or date.today() + timedelta(days=1)
+        since = since or until - timedelta(days=365 * max_years_back)
+        max_years_back = max(max_years_back, math.ceil((date.today() - since).days / 365))
+        logger.info(f"📚 Backfill de {since} a {until} para {len(queries)} queries base")
+
+    collector = NewsCollectorService(
+        sentiment_service=sentiment_service,
+        max_per_query=settings.app.max_articles_per_query,
+        max_years_back=max_years_back,
+        sleep_between=settings.app.sleep_between_requests,
+        max_workers=context.workers or settings.app.collector_workers,
+        rate_limit_burst=settings.app.rate_limit_burst,
+        # Em dry-run o cache ETag não é gravado: senão a próxima coleta real
+        # receberia 304 e pularia feeds cujos artigos nunca foram gravados
+        cache_dir=None if dry_run else settings.app.feed_cache_dir or None,
+        seen_index=seen_index,
+        watermark_lookback_days=settings.app.watermark_lookback_days,
+        reuse_cached_feeds=resume,
+        retry_policy=RetryPolicy(
+            max_retries=settings.app.fetch_max_retries,
+            backoff_base=settings.app.fetch_backoff_base,
+            backoff_max=settings.app.fetch_backoff_max
+        ),
+        circuit_breaker=CircuitBreaker(
+            error_rate=settings.app.circuit_error_rate,
+            cooldown=settings.app.circuit_cooldown
+        ),
+        since=since
+    )
+
+    # Repositórios compartilhados pelo contexto (fechados ao fim da execução)
+    repositories = context.news_repositories()
+    persistence = NewsPersistenceService(
+        repositories,
+        concurrent=settings.app.concurrent_save,
+        timeout=settings.app.save_timeout or None
+    )
+
+    # Arquivo local NDJSON (append), gravado a cada micro-lote
+    json_sink = None
+    if settings.app.save_json_local and not dry_run:
+        json_sink = NDJSONSink(settings.app.json_output_file)
+
+    # Coleta e persistência em streaming: lotes são gravados enquanto
+    # as demais queries ainda estão sendo buscadas
+    if repositories:
+        logger.info("💾 Gravando em lotes nos bancos durante a coleta")
+
+    # Fontes além do Google News usam o cliente HTTP assíncrono
+    source = collector
+    source_names = [name.strip() for name in settings.app.news_sources.split(',') if name.strip()]
+    if source_names != ['google_news'] and not backfill:
+        sources = build_sources(
+            source_names,
+            rss_feeds=settings.app.rss_feeds,
+            local_dir=settings.app.local_feeds_dir
+        )
+        source = MultiSourceCollector(collector, sources)
+    if backfill:
+        source = DateWindowBackfill(
+            collector,
+            start=since,
+            end=until,
+            initial_window_days=settings.app.backfill_window_days,
+            min_window_days=settings.app.backfill_min_window_days
+        )
+
+    pipeline = StreamingPipeline(
+        source,
+        persistence,
+        json_sink=json_sink,
+        seen_index=seen_index,
+        batch_size=settings.app.pipeline_batch_size,
+        queue_size=settings.app.pipeline_queue_size,
+        checkpoint=checkpoint,
+        near_duplicates=near_duplicates
+    )
+    try:
+        stats = pipeline.run(queries)
+    finally:
+        if json_sink:
+            json_sink.close()
+        if seen_index:
+            seen_index.close()
+        if near_duplicates:
+            near_duplicates.close()
+
+    logger.info(f"\n📊 Total de artigos únicos coletados: {stats['articles']}")
+    if near_duplicates:
+        logger.info(f"🧬 Quase-duplicatas agrupadas: {stats['near_duplicates']}")
+    if stats['first_batch_seconds'] is not None:
+        logger.info(f"⏱️  Primeiro lote gravado em {stats['first_batch_seconds']:.1f}s")
+    if not isinstance(source, MultiSourceCollector):
+        logger.info(
+            f"🌐 Requisições HTTP: {collector.fetcher.requests} "
+            f"({collector.fetcher.retries} repetições)"
+        )
+    cache_stats = sentiment_cache.stats()
+    logger.info(
+        f"🧠 Cache de sentimento: {cache_stats['hits']} acertos, "
+        f"{cache_stats['misses']} análises ({cache_stats['hit_rate']:.0%} de acerto)"
+    )
+    sentiment_cache.close()
+
+    for repo in repositories:
+        repo_name = persistence._repo_name(repo)
+        count = stats['saved'].get(repo_name, 0)
+        status = "✅" if count > 0 or not stats['articles'] else "❌"
+        logger.info(f"{status} {repo_name}: {count} artigos salvos")
+
+    # Resumo final
+    logger.info("\n" + "="*60)
+    logger.info("✅ COLETA FINALIZADA COM SUCESSO!")
+    logger.info("="*60)
+    logger.info(f"📊 Total de notícias: {stats['articles']}")
+    if checkpoint and not checkpoint.finished:
+        pending = len(checkpoint.pending(queries))
+        logger.warning(f"⚠️  {pending} queries pendentes; continue com --resume")
+
+    if dry_run:
+        logger.info("🧪 Dry-run: nenhum dado foi gravado")
+    else:
+        if settings.mongodb.enabled:
+            logger.info(f"💾 MongoDB: {settings.mongodb.database}.{settings.mongodb.collection}")
+
+        if settings.postgresql.enabled:
+            logger.info(f"💾 PostgreSQL: {settings.postgresql.database}.{settings.postgresql.table_name}")
+
+        if settings.snowflake.enabled:
+            logger.info(f"💾 Snowflake: {settings.snowflake.database}.{settings.snowflake.schema}.{settings.snowflake.table_name}")
+
+        if settings.app.save_json_local:
+            logger.info(f"📄 NDJSON: {settings.app.json_output_file}")
+
+    logger.info("="*60)
+    return {
+        'run_id': checkpoint.run_id if checkpoint else None,
+        'pipeline': stats,
+        'sentiment_cache': cache_stats,
+    }
@@ -1,14 +1,13 @@
 """
 Configurações centralizadas do projeto.
 Carrega variáveis de ambiente do arquivo .env
+
+O .env é lido e `settings` é montado no primeiro acesso (`get_settings()`
+ou `from src.config import settings`), não na importação do módulo.
 """
 import os
 from dataclasses import dataclass
 from typing import Optional
-from dotenv import load_dotenv
-
-# Carrega variáveis do arquivo .env
-load_dotenv()
 
 
 @dataclass
@@ -18,6 +17,7 @@ class MongoDBConfig:
     database: str
     collection: str
     enabled: bool = True
+    bulk_size: int = 1000
 
     @classmethod
     def from_env(cls) -> 'MongoDBConfig':
@@ -25,7 +25,8 @@ class MongoDBConfig:
             uri=os.getenv('MONGO_URI', 'mongodb://localhost:27017/'),
             database=os.getenv('MONGO_DB', 'bigData'),
             collection=os.getenv('MONGO_COLLECTION', 'projeto_ativos'),
-            enabled=os.getenv('MONGO_ENABLED', 'true').lower() == 'true'
+            enabled=os.getenv('MONGO_ENABLED', 'true').lower() == 'true',
+            bulk_size=int(os.getenv('MONGO_BULK_SIZE', '1000'))
         )
 
 
@@ -39,6 +40,7 @@ class PostgreSQLConfig:
     database: str
     table_name: str = 'noticias_bbas3'
     enabled: bool = True
+    load_mode: str = 'merge'
 
     @classmethod
     def from_env(cls) -> 'PostgreSQLConfig':
@@ -49,7 +51,8 @@ class PostgreSQLConfig:
             port=os.getenv('PG_PORT', '5432'),
             database=os.getenv('PG_DB', 'bigdata'),
             table_name=os.getenv('PG_TABLE', 'noticias_bbas3'),
-            enabled=os.getenv('PG_ENABLED', 'true').lower() == 'true'
+            enabled=os.getenv('PG_ENABLED', 'true').lower() == 'true',
+            load_mode=os.getenv('PG_LOAD_MODE', 'merge').lower()
         )
 
     def get_connection_string(self) -> str:
@@ -68,6 +71,7 @@ class SnowflakeConfig:
     schema: str
     table_name: str = 'NOTICIAS_BBAS3'
     enabled: bool = True
+    load_mode: str = 'merge'
 
     @classmethod
     def from_env(cls) -> 'SnowflakeConfig':
@@ -79,7 +83,8 @@ class SnowflakeConfig:
             database=os.getenv('SF_DATABASE', 'BBAS3'),
             schema=os.getenv('SF_SCHEMA', 'PUBLIC'),
             table_name=os.getenv('SF_TABLE', 'NOTICIAS_BBAS3'),
-            enabled=os.getenv('SF_ENABLED', 'true').lower() == 'true'
+            enabled=os.getenv('SF_ENABLED', 'true').lower() == 'true',
+            load_mode=os.getenv('SF_LOAD_MODE', 'merge').lower()
         )
 
 
@@ -92,6 +97,35 @@ class AppConfig:
     json_output_file: str
     log_level: str
     save_json_local: bool = True
+    collector_workers: int = 8
+    rate_limit_burst: int = 4
+    feed_cache_dir: str = 'data/cache/feeds'
+    seen_index_path: str = 'data/state/seen_articles.sqlite3'
+    watermark_lookback_days: int = 7
+    sentiment_cache_size: int = 10000
+    sentiment_cache_path: str = 'data/cache/sentiment.sqlite3'
+    concurrent_save: bool = True
+    save_timeout: float = 600.0
+    pipeline_batch_size: int = 200
+    pipeline_queue_size: int = 4
+    checkpoint_path: str = 'data/state/checkpoint_coleta.json'
+    backfill_window_days: int = 365
+    backfill_min_window_days: int = 1
+    fetch_max_retries: int = 4
+    fetch_backoff_base: float = 1.0
+    fetch_backoff_max: float = 60.0
+    circuit_error_rate: float = 0.5
+    circuit_cooldown: float = 60.0
+    news_sources: str = 'google_news'
+    rss_feeds: str = ''
+    local_feeds_dir: str = 'data/feeds'
+    near_dup_index_path: str = 'data/state/near_duplicates.sqlite3'
+    near_dup_threshold: float = 0.7
+    metrics_enabled: bool = False
+    metrics_json_file: str = 'data/metrics/ultima_execucao.json'
+    metrics_prometheus_file: str = ''
+    orchestrator_cache_path: str = 'data/state/orquestrador.json'
+    orchestrator_workers: int = 4
 
     @classmethod
     def from_env(cls) -> 'AppConfig':
@@ -99,9 +133,38 @@ class AppConfig:
             max_articles_per_query=int(os.getenv('MAX_PER_QUERY', '100')),
             max_years_back=int(os.getenv('MAX_YEARS_BACK', '5')),
             sleep_between_requests=float(os.getenv('SLEEP_BETWEEN_REQUESTS', '1.0')),
-            json_output_file=os.getenv('OUTPUT_JSON', 'data/collected_articles_bbas3.json'),
+            json_output_file=os.getenv('OUTPUT_JSON', 'data/collected_articles_bbas3.ndjson'),
             log_level=os.getenv('LOG_LEVEL', 'INFO'),
-            save_json_local=os.getenv('SAVE_JSON_LOCAL', 'true').lower() == 'true'
+            save_json_local=os.getenv('SAVE_JSON_LOCAL', 'true').lower() == 'true',
+            collector_workers=int(os.getenv('COLLECTOR_WORKERS', '8')),
+            rate_limit_burst=int(os.getenv('RATE_LIMIT_BURST', '4')),
+            feed_cache_dir=os.getenv('FEED_CACHE_DIR', 'data/cache/feeds'),
+            seen_index_path=os.getenv('SEEN_INDEX_PATH', 'data/state/seen_articles.sqlite3'),
+            watermark_lookback_days=int(os.getenv('WATERMARK_LOOKBACK_DAYS', '7')),
+            sentiment_cache_size=int(os.getenv('SENTIMENT_CACHE_SIZE', '10000')),
+            sentiment_cache_path=os.getenv('SENTIMENT_CACHE_PATH', 'data/cache/sentiment.sqlite3'),
+            concurrent_save=os.getenv('CONCURRENT_SAVE', 'true').lower() == 'true',
+            save_timeout=float(os.getenv('SAVE_TIMEOUT_SECONDS', '600')),
+            pipeline_batch_size=int(os.getenv('PIPELINE_BATCH_SIZE', '200')),
+            pipeline_queue_size=int(os.getenv('PIPELINE_QUEUE_SIZE', '4')),
+            checkpoint_path=os.getenv('CHECKPOINT_PATH', 'data/state/checkpoint_coleta.json'),
+            backfill_window_days=int(os.getenv('BACKFILL_WINDOW_DAYS', '365')),
+            backfill_min_window_days=int(os.getenv('BACKFILL_MIN_WINDOW_DAYS', '1')),
+            fetch_max_retries=int(os.getenv('FETCH_MAX_RETRIES', '4')),
+            fetch_backoff_base=float(os.getenv('FETCH_BACKOFF_BASE', '1.0')),
+            fetch_backoff_max=float(os.getenv('FETCH_BACKOFF_MAX', '60')),
+            circuit_error_rate=float(os.getenv('CIRCUIT_ERROR_RATE', '0.5')),
+            circuit_cooldown=float(os.getenv('CIRCUIT_COOLDOWN_SECONDS', '60')),
+            news_sources=os.getenv('NEWS_SOURCES', 'google_news'),
+            rss_feeds=os.getenv('RSS_FEEDS', ''),
+            local_feeds_dir=os.getenv('LOCAL_FEEDS_DIR', 'data/feeds'),
+            near_dup_index_path=os.getenv('NEAR_DUP_INDEX_PATH', 'data/state/near_duplicates.sqlite3'),
+            near_dup_threshold=float(os.getenv('NEAR_DUP_THRESHOLD', '0.7')),
+            metrics_enabled=os.getenv('METRICS_ENABLED', 'false').lower() == 'true',
+            metrics_json_file=os.getenv('METRICS_JSON', 'data/metrics/ultima_execucao.json'),
+            metrics_prometheus_file=os.getenv('METRICS_PROMETHEUS_FILE', ''),
+            orchestrator_cache_path=os.getenv('ORCHESTRATOR_CACHE', 'data/state/orquestrador.json'),
+            orchestrator_workers=int(os.getenv('ORCHESTRATOR_WORKERS', '4'))
         )
 
 
@@ -135,5 +198,22 @@ class Settings:
         ]
 
 
-# Instância global de configurações
-settings = Settings()
+# Instância global de configurações (criada sob demanda)
+_settings: Optional[Settings] = None
+
+
+def get_settings() -> Settings:
+    """Retorna as configurações globais, carregando o .env na primeira chamada"""
+    global _settings
+    if _settings is None:
+        from dotenv import load_dotenv
+        load_dotenv()
+        _settings = Settings()
+    return _settings
+
+
+def __getattr__(name: str):
+    # `from src.config import settings` continua funcionando (PEP 562)
+    if name == 'settings':
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
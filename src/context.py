@@ -0,0 +1,98 @@
+"""
+Contexto de execução compartilhado entre etapas
+Configurações, opções globais (--dry-run, --since, --workers) e
+repositórios/conexões criados uma única vez por processo
+"""
+import logging
+import threading
+from datetime import date
+from typing import Callable, Dict, List, Optional
+
+from src.config import Settings, get_settings
+from src.repositories import INewsRepository
+
+logger = logging.getLogger(__name__)
+
+
+class PipelineContext:
+    """
+    Recursos compartilhados pelas etapas de uma execução
+
+    Cada repositório (e seu pool/sessão) é criado no primeiro uso e
+    reaproveitado pelas etapas seguintes: coleta, carga e transformação
+    no mesmo processo fazem um único login no Snowflake e abrem um único
+    pool PostgreSQL. Seguro para etapas executadas em paralelo.
+    """
+
+    def __init__(
+        self,
+        settings: Optional[Settings] = None,
+        dry_run: bool = False,
+        since: Optional[date] = None,
+        workers: Optional[int] = None
+    ):
+        self.settings = settings or get_settings()
+        self.dry_run = dry_run
+        self.since = since
+        self.workers = workers
+        self._repositories: Dict[str, INewsRepository] = {}
+        self._lock = threading.Lock()
+
+    def _repository(self, name: str, factory: Callable[[], INewsRepository]) -> INewsRepository:
+        with self._lock:
+            repo = self._repositories.get(name)
+            if repo is None:
+                repo = self._repositories[name] = factory()
+            return repo
+
+    @property
+    def mongodb(self) -> INewsRepository:
+        from src.repositories import MongoDBRepository
+        return self._repository('mongodb', lambda: MongoDBRepository(self.settings.mongodb))
+
+    @property
+    def postgresql(self) -> INewsRepository:
+        from src.repositories import PostgreSQLRepository
+        return self._repository('postgresql', lambda: PostgreSQLRepository(self.settings.postgresql))
+
+    @property
+    def snowflake(self) -> INewsRepository:
+        from src.repositories import SnowflakeRepository
+        return self._repository('snowflake', lambda: SnowflakeRepository(self.settings.snowflake))
+
+    def news_repositories(self) -> List[INewsRepository]:
+        """Repositórios de notícias habilitados (nenhum em --dry-run)"""
+        if self.dry_run:
+            return []
+        repositories = []
+        if self.settings.mongodb.enabled:
+            repositories.append(self.mongodb)
+        if self.settings.postgresql.enabled:
+            repositories.append(self.postgresql)
+        if self.settings.snowflake.enabled:
+            repositories.append(self.snowflake)
+        return repositories
+
+    def postgres_engine(self):
+        """Engine SQLAlchemy do PostgreSQL (mesmo pool do repositório)"""
+        return self.postgresql.engine()
+
+    def snowflake_connection(self):
+        """Sessão Snowflake (mesma sessão do repositório)"""
+        return self.snowflake.connection()
+
+    def close(self):
+        """Fecha todas as conexões abertas"""
+        with self._lock:
+            repositories, self._repositories = list(self._repositories.values()), {}
+        for repo in repositories:
+            try:
+                repo.close()
+            except Exception as e:
+                logger.warning(f"⚠️  Erro ao fechar {type(repo).__name__}: {e}")
+
+    def __enter__(self) -> 'PipelineContext':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
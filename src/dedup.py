@@ -0,0 +1,215 @@
+"""
+Detecção de quase-duplicatas entre notícias
+MinHash sobre título limpo + resumo e LSH por bandas num índice SQLite
+incremental: a mesma matéria sindicada por vários veículos recebe um
+único `cluster_id`
+"""
+import html
+import logging
+import re
+import sqlite3
+import threading
+import unicodedata
+import zlib
+from pathlib import Path
+from typing import Iterable, List, Optional, Set
+
+import numpy as np
+
+from src.models import NewsArticle, generate_url_hash
+
+logger = logging.getLogger(__name__)
+
+# Primo de Mersenne 2^31 - 1: a*x + b cabe em uint64 sem overflow
+_PRIME = np.uint64((1 << 31) - 1)
+_WORD_RE = re.compile(r'[a-z0-9]+')
+# Descrição HTML do Google News: <a href="…/articles/<id>">título</a> <font>fonte</font>
+_SOURCE_TAG_RE = re.compile(r'<font\b[^>]*>.*?</font>', re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r'<[^>]*(?:>|$)')
+_URL_RE = re.compile(r'\b(?:https?://|www\.)\S+', re.IGNORECASE)
+
+
+def normalize_text(text: str) -> str:
+    """Minúsculas, sem acentos e sem pontuação"""
+    ascii_text = unicodedata.normalize('NFKD', text or '').encode('ascii', 'ignore').decode()
+    return ' '.join(_WORD_RE.findall(ascii_text.lower()))
+
+
+def strip_markup(text: str) -> str:
+    """Texto visível de um resumo HTML: sem tags, URLs, entidades e rótulo da fonte"""
+    text = _SOURCE_TAG_RE.sub(' ', text or '')
+    text = html.unescape(_TAG_RE.sub(' ', text))
+    return _URL_RE.sub(' ', text)
+
+
+class MinHasher:
+    """
+    Assinaturas MinHash de `num_perm` funções hash sobre shingles de palavras
+
+    As permutações são derivadas de `seed` fixa: assinaturas gravadas em
+    execuções anteriores continuam comparáveis.
+    """
+
+    def __init__(self, num_perm: int = 128, shingle_size: int = 3, seed: int = 1):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, int(_PRIME), size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, int(_PRIME), size=num_perm, dtype=np.uint64)
+
+    def shingles(self, text: str) -> Set[int]:
+        """Hashes (crc32) dos n-gramas de palavras do texto normalizado"""
+        words = normalize_text(text).split()
+        if not words:
+            return set()
+        size = min(self.shingle_size, len(words))
+        return {
+            zlib.crc32(' '.join(words[i:i + size]).encode())
+            for i in range(len(words) - size + 1)
+        }
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """Assinatura uint32 do texto (None para texto vazio)"""
+        shingles = self.shingles(text)
+        if not shingles:
+            return None
+        values = np.fromiter(shingles, dtype=np.uint64, count=len(shingles)) % _PRIME
+        hashes = (self._a[:, None] * values[None, :] + self._b[:, None]) % _PRIME
+        return hashes.min(axis=1).astype(np.uint32)
+
+    @staticmethod
+    def similarity(left: np.ndarray, right: np.ndarray) -> float:
+        """Estimativa de similaridade de Jaccard entre duas assinaturas"""
+        return float(np.count_nonzero(left == right)) / len(left)
+
+
+class NearDuplicateIndex:
+    """
+    Índice LSH incremental de assinaturas MinHash (SQLite)
+
+    A assinatura é dividida em `bands` bandas; artigos que coincidem em
+    alguma banda são candidatos e só os candidatos têm a similaridade
+    estimada, então o custo por artigo não depende do tamanho do índice.
+    Um artigo com similaridade >= `threshold` entra no grupo do candidato
+    mais parecido; caso contrário abre um grupo novo cujo id canônico é o
+    próprio `url_hash`.
+    """
+
+    def __init__(
+        self,
+        path: str = ':memory:',
+        num_perm: int = 128,
+        bands: int = 16,
+        threshold: float = 0.7,
+        hasher: Optional[MinHasher] = None
+    ):
+        if num_perm % bands:
+            raise ValueError("num_perm deve ser múltiplo de bands")
+        self.path = path
+        self.hasher = hasher or MinHasher(num_perm=num_perm)
+        self.bands = bands
+        self.rows = self.hasher.num_perm // bands
+        self.threshold = threshold
+        self.duplicates = 0
+
+        if path != ':memory:':
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS minhash_signatures ("
+            "url_hash TEXT PRIMARY KEY, cluster_id TEXT NOT NULL, signature BLOB NOT NULL)"
+        )
+        # bucket = número da banda + valores da banda (um índice simples)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS lsh_buckets ("
+            "bucket BLOB NOT NULL, url_hash TEXT NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_lsh_buckets ON lsh_buckets (bucket)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def text_for(article: NewsArticle) -> str:
+        """
+        Texto comparado: título limpo + texto visível do resumo
+
+        No Google News o resumo é só o link (id único por cópia) com o
+        título e a fonte; nesse caso apenas o título é comparado.
+        """
+        title = article.titulo_limpo
+        summary = strip_markup(article.resumo)
+        if title and normalize_text(summary).startswith(normalize_text(title)):
+            return title
+        return f"{title} {summary}"
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [
+            band.to_bytes(2, 'big') + signature[band * self.rows:(band + 1) * self.rows].tobytes()
+            for band in range(self.bands)
+        ]
+
+    def _assign(self, article: NewsArticle) -> str:
+        url_hash = generate_url_hash(article.url)
+        row = self._conn.execute(
+            "SELECT cluster_id FROM minhash_signatures WHERE url_hash = ?", (url_hash,)
+        ).fetchone()
+        if row:
+            return row[0]
+
+        signature = self.hasher.signature(self.text_for(article))
+        if signature is None:
+            return url_hash
+
+        band_keys = self._band_keys(signature)
+        placeholders = ', '.join('?' for _ in band_keys)
+        candidates = self._conn.execute(
+            f"SELECT DISTINCT s.url_hash, s.cluster_id, s.signature "
+            f"FROM lsh_buckets b JOIN minhash_signatures s ON s.url_hash = b.url_hash "
+            f"WHERE b.bucket IN ({placeholders})",
+            band_keys
+        ).fetchall()
+
+        cluster_id, best = url_hash, self.threshold
+        for _, candidate_cluster, blob in candidates:
+            score = self.hasher.similarity(signature, np.frombuffer(blob, dtype=np.uint32))
+            if score >= best:
+                cluster_id, best = candidate_cluster, score
+        if cluster_id != url_hash:
+            self.duplicates += 1
+
+        self._conn.execute(
+            "INSERT INTO minhash_signatures (url_hash, cluster_id, signature) VALUES (?, ?, ?)",
+            (url_hash, cluster_id, signature.tobytes())
+        )
+        self._conn.executemany(
+            "INSERT INTO lsh_buckets (bucket, url_hash) VALUES (?, ?)",
+            [(bucket, url_hash) for bucket in band_keys]
+        )
+        return cluster_id
+
+    def assign(self, article: NewsArticle) -> str:
+        """Define e retorna o `cluster_id` do artigo, adicionando-o ao índice"""
+        return self.assign_many([article])[0]
+
+    def assign_many(self, articles: Iterable[NewsArticle]) -> List[str]:
+        """Define o `cluster_id` de vários artigos numa única transação"""
+        with self._lock:
+            clusters = []
+            for article in articles:
+                article.cluster_id = self._assign(article)
+                clusters.append(article.cluster_id)
+            self._conn.commit()
+        return clusters
+
+    def count(self) -> int:
+        """Total de artigos no índice"""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM minhash_signatures").fetchone()[0]
+
+    def close(self):
+        """Fecha conexão"""
+        with self._lock:
+            self._conn.close()
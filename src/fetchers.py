@@ -0,0 +1,666 @@
+"""
+Camada de acesso HTTP aos feeds
+Controla a taxa de requisições enviadas a cada host, repete falhas
+transitórias com backoff exponencial, pausa a coleta quando a taxa de
+erros dispara (circuit breaker) e mantém cache em disco com GET
+condicional (ETag / Last-Modified). Inclui um cliente assíncrono
+(aiohttp) para buscar muitos feeds em paralelo com conexões reutilizadas
+"""
+import asyncio
+import gzip
+import hashlib
+import json
+import logging
+import os
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Callable, Deque, Dict, Optional
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+
+from src import metrics
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "Mozilla/5.0 (compatible; bbas3-news-collector/2.0)"
+
+
+class TokenBucket:
+    """
+    Token bucket thread-safe
+
+    Libera até `capacity` requisições em rajada e repõe tokens
+    continuamente à taxa de `rate` tokens por segundo.
+    """
+
+    def __init__(self, rate: float, capacity: int = 1):
+        if rate <= 0:
+            raise ValueError("rate deve ser maior que zero")
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        """Repõe tokens proporcionalmente ao tempo decorrido"""
+        now = time.monotonic()
+        elapsed = now - self._last
+        self._last = now
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+
+    def set_rate(self, rate: float):
+        """Altera a taxa de reposição (tokens já acumulados são mantidos)"""
+        with self._lock:
+            self._refill()
+            self.rate = rate
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Consome tokens, bloqueando até que estejam disponíveis
+
+        Returns:
+            float: Tempo total de espera em segundos
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+
+class HostRateLimiter:
+    """
+    Mantém um token bucket independente por host
+
+    O intervalo de cada host se adapta ao servidor: dobra a cada resposta
+    de sobrecarga (429/503), até `max_interval`, e volta gradualmente a
+    `min_interval` conforme as requisições têm sucesso.
+    """
+
+    # Fator de recuperação do intervalo a cada sucesso
+    RECOVERY_FACTOR = 0.9
+
+    def __init__(self, min_interval: float = 1.0, burst: int = 1, max_interval: float = 60.0):
+        self.min_interval = min_interval
+        self.burst = burst
+        self.max_interval = max(max_interval, min_interval)
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._intervals: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _bucket_for(self, host: str) -> Optional[TokenBucket]:
+        """Retorna (criando se necessário) o bucket do host"""
+        if self.min_interval <= 0:
+            return None
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(rate=1.0 / self.min_interval, capacity=self.burst)
+                self._buckets[host] = bucket
+                self._intervals[host] = self.min_interval
+            return bucket
+
+    def acquire(self, url: str) -> float:
+        """Aguarda permissão para requisitar a URL; retorna o tempo de espera"""
+        bucket = self._bucket_for(urlparse(url).netloc)
+        if bucket is None:
+            return 0.0
+        return bucket.acquire()
+
+    def interval(self, url: str) -> float:
+        """Intervalo atual entre requisições ao host da URL"""
+        return self._intervals.get(urlparse(url).netloc, self.min_interval)
+
+    def _adjust(self, url: str, factor: float):
+        host = urlparse(url).netloc
+        bucket = self._bucket_for(host)
+        if bucket is None:
+            return
+        with self._lock:
+            current = self._intervals[host]
+            updated = min(self.max_interval, max(self.min_interval, current * factor))
+            self._intervals[host] = updated
+        if updated != current:
+            bucket.set_rate(1.0 / updated)
+
+    def slow_down(self, url: str):
+        """Dobra o intervalo do host após sinal de sobrecarga"""
+        self._adjust(url, 2.0)
+
+    def speed_up(self, url: str):
+        """Reduz o intervalo do host após um sucesso"""
+        self._adjust(url, self.RECOVERY_FACTOR)
+
+
+@dataclass
+class RetryPolicy:
+    """Parâmetros de repetição de requisições com falha transitória"""
+    max_retries: int = 4
+    backoff_base: float = 1.0
+    backoff_max: float = 60.0
+    # Maior Retry-After respeitado (segundos)
+    max_retry_after: float = 300.0
+    retry_statuses: tuple = (429, 500, 502, 503, 504)
+
+    def backoff(self, attempt: int) -> float:
+        """Espera da tentativa `attempt` (0, 1, ...): exponencial com full jitter"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+
+class RetryBudget:
+    """
+    Orçamento de repetições compartilhado
+
+    Cada requisição deposita `ratio` fichas e cada repetição consome uma,
+    limitando as repetições a ~`ratio` do tráfego (mais uma reserva de
+    `min_retries`). Evita que uma falha generalizada multiplique a carga.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 10):
+        self.ratio = ratio
+        self.max_tokens = float(min_retries) + 100 * ratio
+        self._tokens = float(min_retries)
+        self._lock = threading.Lock()
+
+    def deposit(self):
+        """Registra uma requisição original"""
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Tenta reservar uma repetição"""
+        with self._lock:
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return True
+            return False
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker compartilhado por todas as requisições do coletor
+
+    Acompanha o resultado das últimas `window` requisições; quando a taxa
+    de erros atinge `error_rate` (com ao menos `min_requests` amostras),
+    o circuito abre e todas as threads pausam por `cooldown` segundos.
+    Depois disso uma única requisição de teste decide entre fechar o
+    circuito ou reabri-lo.
+
+    Só 2xx/304 contam como sucesso. Erros de rede, 5xx, 403 e 429 contam
+    como falha; os demais 4xx (ex.: 404 de uma URL) são neutros.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    # 4xx que indicam bloqueio do host, não um problema da URL
+    FAILURE_STATUSES = (403, 429)
+
+    @classmethod
+    def outcome(cls, status: Optional[int]) -> Optional[bool]:
+        """Resultado de uma resposta de erro: False (falha) ou None (neutra)"""
+        if status is not None and 400 <= status < 500 and status not in cls.FAILURE_STATUSES:
+            return None
+        return False
+
+    def __init__(
+        self,
+        error_rate: float = 0.5,
+        window: int = 20,
+        min_requests: int = 10,
+        cooldown: float = 60.0
+    ):
+        self.error_rate = error_rate
+        self.min_requests = min_requests
+        self.cooldown = cooldown
+        self.state = self.CLOSED
+        self.opened = 0
+        self._outcomes: Deque[bool] = deque(maxlen=window)
+        self._open_until = 0.0
+        self._probe_in_flight = False
+        self._cond = threading.Condition()
+
+    def before_request(self) -> float:
+        """Bloqueia enquanto o circuito estiver aberto; retorna o tempo de espera"""
+        waited = 0.0
+        with self._cond:
+            while True:
+                if self.state == self.CLOSED:
+                    return waited
+                now = time.monotonic()
+                if self.state == self.OPEN and now >= self._open_until:
+                    self.state = self.HALF_OPEN
+                if self.state == self.HALF_OPEN and not self._probe_in_flight:
+                    self._probe_in_flight = True
+                    return waited
+                timeout = max(self._open_until - now, 0.05)
+                self._cond.wait(timeout)
+                waited += time.monotonic() - now
+
+    def record(self, success: Optional[bool]):
+        """Registra o resultado de uma requisição (None: neutro, fora da janela)"""
+        with self._cond:
+            if success is None:
+                # Não decide o estado; só libera a vaga da requisição de teste
+                if self.state == self.HALF_OPEN and self._probe_in_flight:
+                    self._probe_in_flight = False
+                    self._cond.notify_all()
+                return
+            if self.state == self.HALF_OPEN and self._probe_in_flight:
+                self._probe_in_flight = False
+                if success:
+                    self.state = self.CLOSED
+                    self._outcomes.clear()
+                    logger.info("🟢 Circuito fechado: coleta retomada")
+                else:
+                    self._open()
+                self._cond.notify_all()
+                return
+
+            self._outcomes.append(success)
+            failures = self._outcomes.count(False)
+            if (
+                self.state == self.CLOSED
+                and len(self._outcomes) >= self.min_requests
+                and failures / len(self._outcomes) >= self.error_rate
+            ):
+                self._open()
+
+    def _open(self):
+        self.state = self.OPEN
+        self.opened += 1
+        self._open_until = time.monotonic() + self.cooldown
+        self._outcomes.clear()
+        logger.warning(f"🔴 Circuito aberto: muitas falhas, coleta pausada por {self.cooldown:.0f}s")
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Converte o cabeçalho Retry-After (segundos ou data HTTP) em segundos"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        target = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if target.tzinfo is None:
+        target = target.replace(tzinfo=timezone.utc)
+    return max(0.0, (target - datetime.now(timezone.utc)).total_seconds())
+
+
+@dataclass
+class FetchResult:
+    """Resultado de uma requisição de feed"""
+    url: str
+    status: int
+    body: bytes = b''
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def not_modified(self) -> bool:
+        """True quando o servidor respondeu 304 (feed inalterado)"""
+        return self.status == 304
+
+
+class FeedCache:
+    """
+    Cache HTTP em disco indexado pela URL do feed
+
+    Para cada URL guarda `<hash>.json` (ETag, Last-Modified, data da busca)
+    e `<hash>.xml` (corpo bruto da última resposta 200).
+    """
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _key(self, url: str) -> str:
+        return hashlib.sha1(url.encode()).hexdigest()
+
+    def _write_atomic(self, path: Path, data: bytes):
+        """Escreve arquivo via renomeação para não deixar cache corrompido"""
+        tmp = path.with_suffix(path.suffix + f'.{threading.get_ident()}.tmp')
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+
+    def get_validators(self, url: str) -> Dict[str, str]:
+        """Retorna cabeçalhos condicionais para a URL (vazio se não houver cache)"""
+        meta_path = self.directory / f"{self._key(url)}.json"
+        if not meta_path.exists():
+            return {}
+        try:
+            meta = json.loads(meta_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+
+    def get_body(self, url: str) -> Optional[bytes]:
+        """Retorna corpo bruto armazenado para a URL"""
+        body_path = self.directory / f"{self._key(url)}.xml"
+        return body_path.read_bytes() if body_path.exists() else None
+
+    def store(self, result: FetchResult):
+        """Armazena validadores e corpo de uma resposta 200"""
+        key = self._key(result.url)
+        meta = {
+            'url': result.url,
+            'etag': result.etag,
+            'last_modified': result.last_modified,
+            'fetched_at': datetime.now(timezone.utc).isoformat()
+        }
+        self._write_atomic(self.directory / f"{key}.xml", result.body)
+        self._write_atomic(
+            self.directory / f"{key}.json",
+            json.dumps(meta, ensure_ascii=False).encode('utf-8')
+        )
+
+
+class FeedFetcher:
+    """
+    Busca feeds via HTTP com rate limit por host e cache condicional
+
+    Falhas transitórias (timeouts, erros de conexão, 429 e 5xx) são
+    repetidas com backoff exponencial com jitter, respeitando Retry-After
+    e o orçamento de repetições; o circuit breaker pausa todas as buscas
+    quando a taxa de erros dispara.
+    """
+
+    def __init__(
+        self,
+        rate_limiter: Optional[HostRateLimiter] = None,
+        cache: Optional[FeedCache] = None,
+        timeout: float = 30.0,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        self.rate_limiter = rate_limiter or HostRateLimiter(min_interval=0)
+        self.cache = cache
+        self.timeout = timeout
+        self.retry_policy = retry_policy or RetryPolicy(max_retries=0)
+        self.retry_budget = retry_budget or RetryBudget()
+        self.circuit_breaker = circuit_breaker
+        self._sleep = sleep
+        # Contadores para o resumo da execução
+        self.requests = 0
+        self.retries = 0
+        self._counter_lock = threading.Lock()
+
+    def fetch(self, url: str) -> FetchResult:
+        """
+        Faz GET (condicional, se houver cache) da URL, repetindo falhas
+        transitórias
+
+        Returns:
+            FetchResult: status 304 indica que o feed não mudou
+
+        Raises:
+            urllib.error.URLError: Falha definitiva ou tentativas esgotadas
+        """
+        self.retry_budget.deposit()
+        attempt = 0
+        while True:
+            if self.circuit_breaker:
+                self.circuit_breaker.before_request()
+            try:
+                result = self._fetch_once(url)
+            except (urllib.error.URLError, TimeoutError, ConnectionError) as e:
+                status = e.code if isinstance(e, urllib.error.HTTPError) else None
+                retryable = status is None or status in self.retry_policy.retry_statuses
+                if self.circuit_breaker:
+                    self.circuit_breaker.record(CircuitBreaker.outcome(status))
+                if status in (429, 503):
+                    self.rate_limiter.slow_down(url)
+
+                if (
+                    not retryable
+                    or attempt >= self.retry_policy.max_retries
+                    or not self.retry_budget.withdraw()
+                ):
+                    raise
+
+                delay = self.retry_policy.backoff(attempt)
+                if isinstance(e, urllib.error.HTTPError):
+                    retry_after = parse_retry_after(e.headers.get('Retry-After') if e.headers else None)
+                    if retry_after is not None:
+                        delay = min(retry_after, self.retry_policy.max_retry_after)
+                logger.warning(
+                    f"🔁 Falha ao buscar feed ({status or e}); "
+                    f"tentativa {attempt + 2} em {delay:.1f}s"
+                )
+                with self._counter_lock:
+                    self.retries += 1
+                metrics.inc('http_retries_total')
+                attempt += 1
+                self._sleep(delay)
+                continue
+
+            except Exception:
+                # Erro inesperado: libera o circuito e propaga
+                if self.circuit_breaker:
+                    self.circuit_breaker.record(False)
+                raise
+
+            if self.circuit_breaker:
+                self.circuit_breaker.record(True)
+            self.rate_limiter.speed_up(url)
+            return result
+
+    def _fetch_once(self, url: str) -> FetchResult:
+        """Uma única requisição HTTP (condicional, se houver cache)"""
+        headers = {
+            'User-Agent': USER_AGENT,
+            'Accept-Encoding': 'gzip'
+        }
+        if self.cache:
+            headers.update(self.cache.get_validators(url))
+
+        self.rate_limiter.acquire(url)
+        with self._counter_lock:
+            self.requests += 1
+        request = urllib.request.Request(url, headers=headers)
+
+        try:
+            with metrics.timer('feed_fetch_seconds'), \
+                    urllib.request.urlopen(request, timeout=self.timeout) as response:
+                body = response.read()
+                if response.headers.get('Content-Encoding') == 'gzip':
+                    body = gzip.decompress(body)
+                result = FetchResult(
+                    url=url,
+                    status=response.status,
+                    body=body,
+                    etag=response.headers.get('ETag'),
+                    last_modified=response.headers.get('Last-Modified'),
+                    headers=dict(response.headers)
+                )
+        except urllib.error.HTTPError as e:
+            metrics.inc('http_responses_total', status=e.code)
+            if e.code != 304:
+                raise
+            logger.debug(f"Feed inalterado (304): {url}")
+            return FetchResult(url=url, status=304, headers=dict(e.headers or {}))
+
+        metrics.inc('http_responses_total', status=result.status)
+        if self.cache and result.status == 200:
+            self.cache.store(result)
+        return result
+
+
+class AsyncFeedClient:
+    """
+    Cliente HTTP assíncrono para buscar muitos feeds de uma vez
+
+    Usa uma única `aiohttp.ClientSession`: o pool mantém conexões
+    keep-alive abertas (até `max_connections`, `per_host` por host), então
+    adicionar feeds não multiplica handshakes TCP/TLS. Respeita intervalo
+    mínimo por host, GET condicional via `FeedCache` e a mesma política de
+    repetição do `FeedFetcher`. URLs `file://` são lidas do disco
+    (feeds gravados, para testes offline).
+
+    Uso:
+        async with AsyncFeedClient(cache=cache) as client:
+            result = await client.fetch(url)
+    """
+
+    def __init__(
+        self,
+        cache: Optional[FeedCache] = None,
+        timeout: float = 30.0,
+        max_connections: int = 20,
+        per_host: int = 4,
+        min_interval: float = 0.0,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_budget: Optional[RetryBudget] = None
+    ):
+        self.cache = cache
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.per_host = per_host
+        self.min_interval = min_interval
+        self.retry_policy = retry_policy or RetryPolicy(max_retries=0)
+        self.retry_budget = retry_budget or RetryBudget()
+        self.requests = 0
+        self.retries = 0
+        self._session = None
+        self._host_locks: Dict[str, asyncio.Lock] = {}
+        self._next_slot: Dict[str, float] = {}
+
+    async def __aenter__(self) -> 'AsyncFeedClient':
+        try:
+            import aiohttp
+        except ImportError as e:
+            raise ImportError("aiohttp é necessário para o cliente assíncrono (pip install aiohttp)") from e
+        connector = aiohttp.TCPConnector(
+            limit=self.max_connections,
+            limit_per_host=self.per_host,
+            keepalive_timeout=30
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            headers={'User-Agent': USER_AGENT}
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def fetch(self, url: str) -> FetchResult:
+        """
+        Busca a URL repetindo falhas transitórias
+
+        Raises:
+            urllib.error.HTTPError: Status de erro definitivo ou tentativas esgotadas
+        """
+        if url.startswith('file://'):
+            path = Path(url2pathname(urlparse(url).path))
+            body = await asyncio.to_thread(path.read_bytes)
+            return FetchResult(url=url, status=200, body=body)
+
+        import aiohttp
+
+        self.retry_budget.deposit()
+        attempt = 0
+        while True:
+            retry_after = None
+            try:
+                return await self._fetch_once(url)
+            except urllib.error.HTTPError as e:
+                error = e
+                retryable = e.code in self.retry_policy.retry_statuses
+                retry_after = parse_retry_after(e.headers.get('Retry-After') if e.headers else None)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error = e
+                retryable = True
+
+            if (
+                not retryable
+                or attempt >= self.retry_policy.max_retries
+                or not self.retry_budget.withdraw()
+            ):
+                raise error
+
+            delay = self.retry_policy.backoff(attempt)
+            if retry_after is not None:
+                delay = min(retry_after, self.retry_policy.max_retry_after)
+            logger.warning(f"🔁 Falha ao buscar feed ({error}); tentativa {attempt + 2} em {delay:.1f}s")
+            self.retries += 1
+            metrics.inc('http_retries_total')
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def _throttle(self, url: str):
+        """Garante o intervalo mínimo entre requisições ao mesmo host"""
+        if self.min_interval <= 0:
+            return
+        host = urlparse(url).netloc
+        lock = self._host_locks.setdefault(host, asyncio.Lock())
+        loop = asyncio.get_running_loop()
+        async with lock:
+            wait = self._next_slot.get(host, 0.0) - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._next_slot[host] = loop.time() + self.min_interval
+
+    async def _fetch_once(self, url: str) -> FetchResult:
+        """Uma única requisição HTTP (condicional, se houver cache)"""
+        if self._session is None:
+            raise RuntimeError("AsyncFeedClient deve ser usado com 'async with'")
+
+        headers = self.cache.get_validators(url) if self.cache else {}
+        await self._throttle(url)
+        self.requests += 1
+
+        start = time.perf_counter()
+        async with self._session.get(url, headers=headers) as response:
+            metrics.inc('http_responses_total', status=response.status)
+            response_headers = dict(response.headers)
+            if response.status == 304:
+                logger.debug(f"Feed inalterado (304): {url}")
+                return FetchResult(url=url, status=304, headers=response_headers)
+            if response.status >= 400:
+                raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+            # aiohttp já descomprime gzip/deflate
+            body = await response.read()
+            result = FetchResult(
+                url=url,
+                status=response.status,
+                body=body,
+                etag=response.headers.get('ETag'),
+                last_modified=response.headers.get('Last-Modified'),
+                headers=response_headers
+            )
+        metrics.observe('feed_fetch_seconds', time.perf_counter() - start)
+
+        if self.cache and result.status == 200:
+            await asyncio.to_thread(self.cache.store, result)
+        return result
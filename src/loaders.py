@@ -0,0 +1,109 @@
+"""
+Etapas de carga
+Reenvio do NDJSON local aos bancos e migração de tabelas PostgreSQL → Snowflake
+"""
+import logging
+from collections import Counter
+from datetime import date, datetime, timezone
+from typing import Dict, Iterator, List, Sequence
+
+from src.context import PipelineContext
+from src.models import NewsArticle, parse_datetime
+from src.services import NewsPersistenceService
+from src.sinks import iter_articles
+
+logger = logging.getLogger(__name__)
+
+# Tabelas copiadas do PostgreSQL para o Snowflake (DADOS_MONG alimenta FATO_NOTICIAS)
+MIGRATION_TABLES = ("bbas3_dados_hist_ricos_1", "dados_mong")
+
+
+def _published_since(articles: Iterator[NewsArticle], since: date) -> Iterator[NewsArticle]:
+    cutoff = datetime(since.year, since.month, since.day, tzinfo=timezone.utc)
+    for article in articles:
+        published = parse_datetime(article.publicada)
+        if published is None:
+            continue
+        if published.tzinfo is None:
+            published = published.replace(tzinfo=timezone.utc)
+        if published >= cutoff:
+            yield article
+
+
+def load_articles(context: PipelineContext, path: str) -> Dict[str, int]:
+    """
+    Grava os artigos de um arquivo NDJSON nos repositórios habilitados
+
+    Lê em streaming e grava em lotes de PIPELINE_BATCH_SIZE (upsert por URL,
+    então reenvios são idempotentes). Com `context.since`, só artigos
+    publicados a partir da data; em dry-run apenas conta.
+
+    Returns:
+        Dict com artigos lidos e salvos por repositório
+    """
+    settings = context.settings
+    articles = iter_articles(path)
+    if context.since:
+        articles = _published_since(articles, context.since)
+
+    repositories = context.news_repositories()
+    persistence = NewsPersistenceService(
+        repositories,
+        concurrent=settings.app.concurrent_save,
+        timeout=settings.app.save_timeout or None
+    )
+
+    read = 0
+    saved: Counter = Counter()
+    batch: List[NewsArticle] = []
+    for article in articles:
+        read += 1
+        batch.append(article)
+        if len(batch) >= settings.app.pipeline_batch_size:
+            saved.update(persistence.save_all(batch))
+            batch = []
+    if batch:
+        saved.update(persistence.save_all(batch))
+
+    logger.info(f"📄 {read} artigos lidos de {path}")
+    if context.dry_run:
+        logger.info("🧪 Dry-run: artigos não gravados")
+    for name, count in saved.items():
+        logger.info(f"💾 {name}: {count} artigos salvos")
+    return {'articles': read, **saved}
+
+
+def migrate_tables(context: PipelineContext, tables: Sequence[str] = MIGRATION_TABLES) -> Dict[str, int]:
+    """
+    Copia tabelas do PostgreSQL para o Snowflake (substituindo as existentes)
+
+    Usa o pool PostgreSQL e a sessão Snowflake do contexto. Em dry-run
+    apenas lista o plano, sem conectar.
+
+    Returns:
+        Dict tabela → linhas copiadas
+    """
+    if context.dry_run:
+        for table in tables:
+            logger.info(f"🧪 Dry-run: {table} → {table.upper()}")
+        return {}
+
+    import pandas as pd
+    from snowflake.connector.pandas_tools import write_pandas
+
+    engine = context.postgres_engine()
+    conn = context.snowflake_connection()
+    copied = {}
+    for table in tables:
+        df = pd.read_sql(f'SELECT * FROM "{table}"', engine)
+        logger.info(f"📥 {table}: {len(df)} registros lidos do PostgreSQL")
+        success, _, nrows, _ = write_pandas(
+            conn=conn,
+            df=df,
+            table_name=table.upper(),
+            auto_create_table=True,
+            overwrite=True
+        )
+        logger.info(f"❄️  {table.upper()}: {nrows} linhas no Snowflake (sucesso: {success})")
+        copied[table] = nrows
+    return copied
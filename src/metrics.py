@@ -0,0 +1,258 @@
+"""
+Métricas de execução da coleta
+Contadores, timers e histogramas em memória, com resumo JSON por
+execução e exportação opcional no formato textfile do Prometheus
+(node_exporter --collector.textfile)
+
+Uso:
+    from src import metrics
+
+    metrics.enable()
+    with metrics.timer('feed_parse_seconds'):
+        ...
+    metrics.inc('articles_collected_total', 10, query='BBAS3 B3')
+
+Desativadas (padrão), as funções retornam imediatamente: o custo é uma
+chamada de função e um teste de flag.
+"""
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+# Limites (segundos) dos buckets dos histogramas de duração
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0)
+
+MetricKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+def _key(name: str, labels: Dict[str, Any]) -> MetricKey:
+    return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+class Histogram:
+    """Distribuição de valores em buckets cumulativos (estilo Prometheus)"""
+
+    __slots__ = ('buckets', 'counts', 'count', 'sum', 'min', 'max')
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = float('inf')
+        self.max = float('-inf')
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            'count': self.count,
+            'sum': round(self.sum, 6),
+            'mean': round(self.sum / self.count, 6) if self.count else 0.0,
+            'min': round(self.min, 6) if self.count else 0.0,
+            'max': round(self.max, 6) if self.count else 0.0,
+        }
+
+
+class _Timer:
+    """Context manager que registra a duração num histograma"""
+
+    __slots__ = ('registry', 'key', 'start')
+
+    def __init__(self, registry: 'MetricsRegistry', key: MetricKey):
+        self.registry = registry
+        self.key = key
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.registry._observe(self.key, time.perf_counter() - self.start)
+        return False
+
+
+class _NullTimer:
+    """Timer sem efeito (métricas desativadas)"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class MetricsRegistry:
+    """Armazena contadores e histogramas de uma execução (thread-safe)"""
+
+    def __init__(self):
+        self.started_at = time.time()
+        self._counters: Dict[MetricKey, float] = {}
+        self._histograms: Dict[MetricKey, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name: str, value: float = 1, **labels):
+        key = _key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def _observe(self, key: MetricKey, value: float):
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.observe(value)
+
+    def observe(self, name: str, value: float, **labels):
+        self._observe(_key(name, labels), value)
+
+    def timer(self, name: str, **labels) -> _Timer:
+        return _Timer(self, _key(name, labels))
+
+    def summary(self) -> Dict[str, Any]:
+        """Resumo JSON-serializável: {nome: valor} ou {nome: {labels: valor}}"""
+        def place(target: Dict[str, Any], key: MetricKey, value: Any):
+            name, labels = key
+            if labels:
+                label_text = ','.join(f"{k}={v}" for k, v in labels)
+                target.setdefault(name, {})[label_text] = value
+            else:
+                target[name] = value
+
+        with self._lock:
+            counters: Dict[str, Any] = {}
+            for key, value in sorted(self._counters.items()):
+                place(counters, key, value)
+            histograms: Dict[str, Any] = {}
+            for key, histogram in sorted(self._histograms.items()):
+                place(histograms, key, histogram.to_dict())
+
+        return {
+            'started_at': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(self.started_at)),
+            'elapsed_seconds': round(time.time() - self.started_at, 3),
+            'counters': counters,
+            'timers': histograms,
+        }
+
+    def to_prometheus(self, prefix: str = 'bbas3_news_') -> str:
+        """Métricas no formato de exposição texto do Prometheus"""
+        def labels_text(labels, extra=()):
+            items = list(labels) + list(extra)
+            if not items:
+                return ''
+            escaped = (
+                k + '="' + str(v).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') + '"'
+                for k, v in items
+            )
+            return '{' + ','.join(escaped) + '}'
+
+        lines = []
+        with self._lock:
+            seen_types = set()
+            for (name, labels), value in sorted(self._counters.items()):
+                metric = prefix + name
+                if metric not in seen_types:
+                    lines.append(f"# TYPE {metric} counter")
+                    seen_types.add(metric)
+                lines.append(f"{metric}{labels_text(labels)} {value}")
+
+            for (name, labels), histogram in sorted(self._histograms.items()):
+                metric = prefix + name
+                if metric not in seen_types:
+                    lines.append(f"# TYPE {metric} histogram")
+                    seen_types.add(metric)
+                cumulative = 0
+                for bound, count in zip(histogram.buckets, histogram.counts):
+                    cumulative += count
+                    lines.append(f"{metric}_bucket{labels_text(labels, [('le', bound)])} {cumulative}")
+                lines.append(f"{metric}_bucket{labels_text(labels, [('le', '+Inf')])} {histogram.count}")
+                lines.append(f"{metric}_sum{labels_text(labels)} {histogram.sum}")
+                lines.append(f"{metric}_count{labels_text(labels)} {histogram.count}")
+
+        return '\n'.join(lines) + '\n'
+
+
+# Registro da execução atual (None = métricas desativadas)
+_registry: Optional[MetricsRegistry] = None
+
+
+def enable() -> MetricsRegistry:
+    """Ativa as métricas com um registro novo"""
+    global _registry
+    _registry = MetricsRegistry()
+    return _registry
+
+
+def disable():
+    """Desativa as métricas"""
+    global _registry
+    _registry = None
+
+
+def enabled() -> bool:
+    return _registry is not None
+
+
+def inc(name: str, value: float = 1, **labels):
+    """Incrementa um contador"""
+    if _registry is not None:
+        _registry.inc(name, value, **labels)
+
+
+def observe(name: str, value: float, **labels):
+    """Registra um valor (ex.: duração já medida) num histograma"""
+    if _registry is not None:
+        _registry.observe(name, value, **labels)
+
+
+def timer(name: str, **labels):
+    """Context manager que mede a duração do bloco"""
+    if _registry is None:
+        return _NULL_TIMER
+    return _registry.timer(name, **labels)
+
+
+def summary() -> Dict[str, Any]:
+    """Resumo da execução atual (vazio se desativadas)"""
+    return _registry.summary() if _registry is not None else {}
+
+
+def _write_atomic(path: str, text: str):
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_suffix(target.suffix + '.tmp')
+    tmp.write_text(text, encoding='utf-8')
+    os.replace(tmp, target)
+
+
+def write_json(path: str, extra: Optional[Dict[str, Any]] = None):
+    """Grava o resumo da execução em JSON (com dados extras, ex.: stats do pipeline)"""
+    if _registry is None:
+        return
+    data = summary()
+    if extra:
+        data.update(extra)
+    _write_atomic(path, json.dumps(data, ensure_ascii=False, indent=2, default=str))
+
+
+def write_prometheus(path: str):
+    """Grava as métricas para o textfile collector do node_exporter"""
+    if _registry is None:
+        return
+    _write_atomic(path, _registry.to_prometheus())
@@ -1,15 +1,97 @@
 """
 Modelos de dados do projeto
 """
-from dataclasses import dataclass, asdict
+from array import array
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import Optional, Dict, Any, Iterable, List, Tuple
+import hashlib
 import re
 
+from dateutil import parser as date_parser
 
-@dataclass
+from src import metrics
+
+# Padrões de limpeza de texto (compilados uma única vez)
+_WHITESPACE_RE = re.compile(r'\s+')
+_CONTROL_CHARS_RE = re.compile(r'[\x00-\x1F\x7F-\x9F]')
+
+
+# Colunas da projeção relacional (ordem de to_relational_dict) e tipo lógico
+RELATIONAL_SCHEMA = [
+    ('url', 'text'),
+    ('url_hash', 'text'),
+    ('query', 'text'),
+    ('query_category', 'text'),
+    ('titulo_noticia', 'text'),
+    ('titulo_limpo', 'text'),
+    ('fonte_noticia', 'text'),
+    ('resumo', 'text'),
+    ('publicada', 'timestamp'),
+    ('busca_feita', 'timestamp'),
+    ('ano_publicacao', 'int'),
+    ('mes_publicacao', 'int'),
+    ('sentimento_label', 'text'),
+    ('sentimento_polarity', 'float'),
+    ('sentimento_subjectivity', 'float'),
+    ('sentimento_confidence', 'float'),
+    ('sentimento_positive_keywords', 'int'),
+    ('sentimento_negative_keywords', 'int'),
+    ('sentimento_score', 'float'),
+    ('relevancia', 'float'),
+    ('cluster_id', 'text'),
+]
+RELATIONAL_COLUMNS = [name for name, _ in RELATIONAL_SCHEMA]
+
+
+def generate_url_hash(url: str) -> str:
+    """Gera hash MD5 da URL (chave única do artigo nos bancos relacionais)"""
+    return hashlib.md5(url.encode()).hexdigest()
+
+
+@lru_cache(maxsize=8192)
+def parse_datetime(date_str: Optional[str]) -> Optional[datetime]:
+    """
+    Converte string de data em datetime
+
+    Tenta primeiro o parser ISO 8601 nativo (rápido) e só recorre ao
+    dateutil para outros formatos. Resultados são memoizados, já que a
+    mesma data de publicação se repete entre muitos artigos.
+    """
+    if not date_str:
+        return None
+    try:
+        return datetime.fromisoformat(date_str)
+    except (TypeError, ValueError):
+        pass
+    try:
+        return date_parser.parse(date_str)
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def to_relational_columns(articles: Iterable['NewsArticle']) -> Dict[str, List[Any]]:
+    """
+    Projeta vários artigos no formato relacional colunar
+
+    Returns:
+        Dict com uma lista por coluna (ordem de RELATIONAL_COLUMNS)
+    """
+    rows = [article.to_relational_row() for article in articles]
+    if not rows:
+        return {name: [] for name in RELATIONAL_COLUMNS}
+    return {name: list(values) for name, values in zip(RELATIONAL_COLUMNS, zip(*rows))}
+
+
+@dataclass(slots=True, frozen=True)
 class SentimentAnalysis:
-    """Modelo de análise de sentimento"""
+    """
+    Modelo de análise de sentimento
+
+    Imutável: a mesma instância pode ser compartilhada pelo cache de
+    sentimento entre vários artigos.
+    """
     polarity: float
     subjectivity: float
     label: str
@@ -19,7 +101,14 @@ class SentimentAnalysis:
 
     def to_dict(self) -> Dict[str, Any]:
         """Converte para dicionário"""
-        return asdict(self)
+        return {
+            'polarity': self.polarity,
+            'subjectivity': self.subjectivity,
+            'label': self.label,
+            'confidence': self.confidence,
+            'positive_keywords': self.positive_keywords,
+            'negative_keywords': self.negative_keywords
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'SentimentAnalysis':
@@ -34,9 +123,9 @@ class SentimentAnalysis:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class NewsArticle:
-    """Modelo de artigo de notícia"""
+    """Modelo de artigo de notícia (com __slots__, sem __dict__ por instância)"""
     url: str
     query: str
     titulo_noticia: str
@@ -44,10 +133,12 @@ class NewsArticle:
     busca_feita: str
     resumo: str
     sentimentos: SentimentAnalysis
+    # Id canônico do grupo de quase-duplicatas (ver src.dedup)
+    cluster_id: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Converte para dicionário (MongoDB)"""
-        return {
+        data = {
             'url': self.url,
             'query': self.query,
             'titulo_noticia': self.titulo_noticia,
@@ -56,45 +147,68 @@ class NewsArticle:
             'resumo': self.resumo,
             'sentimentos': self.sentimentos.to_dict()
         }
+        if self.cluster_id:
+            data['cluster_id'] = self.cluster_id
+        return data
+
+    @property
+    def titulo_limpo(self) -> str:
+        """Título sem a fonte (mesmo valor da coluna titulo_limpo)"""
+        return self._extract_clean_title(self.titulo_noticia)
 
     def to_relational_dict(self) -> Dict[str, Any]:
         """
         Converte para formato relacional (PostgreSQL/Snowflake)
         Expande sentimentos em colunas separadas e limpa dados
         """
-        return {
+        return dict(zip(RELATIONAL_COLUMNS, self.to_relational_row()))
+
+    def to_relational_row(self) -> Tuple[Any, ...]:
+        """
+        Projeção relacional como tupla (ordem de RELATIONAL_COLUMNS)
+        Cada data é parseada uma única vez
+        """
+        sentimentos = self.sentimentos
+        published = parse_datetime(self.publicada)
+        title = self.titulo_noticia
+        url_hash = generate_url_hash(self.url)
+        
+        return (
             # Identificação
-            'url': self._clean_text(self.url),
-            'url_hash': self._generate_url_hash(self.url),
+            self._clean_text(self.url),
+            url_hash,
             
             # Metadados da busca
-            'query': self._clean_text(self.query),
-            'query_category': self._categorize_query(self.query),
+            self._clean_text(self.query),
+            self._categorize_query(self.query),
             
             # Conteúdo
-            'titulo_noticia': self._clean_text(self.titulo_noticia),
-            'titulo_limpo': self._extract_clean_title(self.titulo_noticia),
-            'fonte_noticia': self._extract_source(self.titulo_noticia),
-            'resumo': self._clean_text(self.resumo),
+            self._clean_text(title),
+            self._extract_clean_title(title),
+            self._extract_source(title),
+            self._clean_text(self.resumo),
             
             # Datas (formato ISO 8601 para compatibilidade)
-            'publicada': self._parse_date(self.publicada),
-            'busca_feita': self._parse_date(self.busca_feita),
-            'ano_publicacao': self._extract_year(self.publicada),
-            'mes_publicacao': self._extract_month(self.publicada),
+            self._format_date(self.publicada, published),
+            self._format_date(self.busca_feita, parse_datetime(self.busca_feita)),
+            published.year if published else None,
+            published.month if published else None,
             
             # Análise de Sentimento (expandido)
-            'sentimento_label': self.sentimentos.label,
-            'sentimento_polarity': round(self.sentimentos.polarity, 4),
-            'sentimento_subjectivity': round(self.sentimentos.subjectivity, 4),
-            'sentimento_confidence': round(self.sentimentos.confidence, 4),
-            'sentimento_positive_keywords': self.sentimentos.positive_keywords,
-            'sentimento_negative_keywords': self.sentimentos.negative_keywords,
+            sentimentos.label,
+            round(sentimentos.polarity, 4),
+            round(sentimentos.subjectivity, 4),
+            round(sentimentos.confidence, 4),
+            sentimentos.positive_keywords,
+            sentimentos.negative_keywords,
             
             # Métricas derivadas
-            'sentimento_score': self._calculate_sentiment_score(),
-            'relevancia': self._calculate_relevance()
-        }
+            self._calculate_sentiment_score(),
+            self._calculate_relevance(),
+            
+            # Grupo de quase-duplicatas (sem grupo: o próprio artigo)
+            self.cluster_id or url_hash
+        )
 
     @staticmethod
     def _clean_text(text: Optional[str]) -> str:
@@ -102,16 +216,15 @@ class NewsArticle:
         if not text:
             return ''
         # Remove quebras de linha, tabs e espaços múltiplos
-        cleaned = re.sub(r'\s+', ' ', str(text))
+        cleaned = _WHITESPACE_RE.sub(' ', str(text))
         # Remove caracteres de controle
-        cleaned = re.sub(r'[\x00-\x1F\x7F-\x9F]', '', cleaned)
+        cleaned = _CONTROL_CHARS_RE.sub('', cleaned)
         return cleaned.strip()
 
     @staticmethod
     def _generate_url_hash(url: str) -> str:
         """Gera hash da URL para uso como chave única"""
-        import hashlib
-        return hashlib.md5(url.encode()).hexdigest()
+        return generate_url_hash(url)
 
     @staticmethod
     def _categorize_query(query: str) -> str:
@@ -145,45 +258,32 @@ class NewsArticle:
         parts = title.split(' - ')
         return parts[-1].strip() if len(parts) > 1 else 'Desconhecido'
 
+    @staticmethod
+    def _format_date(date_str: Optional[str], parsed: Optional[datetime]) -> Optional[str]:
+        """Converte data para formato ISO 8601 (strings com 'T' são mantidas)"""
+        if not date_str or not isinstance(date_str, str):
+            return None
+        # Já está em formato ISO
+        if 'T' in date_str:
+            return date_str
+        return parsed.isoformat() if parsed else None
+
     @staticmethod
     def _parse_date(date_str: Optional[str]) -> Optional[str]:
         """Converte data para formato ISO 8601"""
-        if not date_str:
-            return None
-        try:
-            # Já está em formato ISO
-            if 'T' in date_str:
-                return date_str
-            # Tenta parsear e converter
-            from dateutil import parser
-            dt = parser.parse(date_str)
-            return dt.isoformat()
-        except:
-            return None
+        return NewsArticle._format_date(date_str, parse_datetime(date_str))
 
     @staticmethod
     def _extract_year(date_str: Optional[str]) -> Optional[int]:
         """Extrai ano da data"""
-        if not date_str:
-            return None
-        try:
-            from dateutil import parser
-            dt = parser.parse(date_str)
-            return dt.year
-        except:
-            return None
+        dt = parse_datetime(date_str)
+        return dt.year if dt else None
 
     @staticmethod
     def _extract_month(date_str: Optional[str]) -> Optional[int]:
         """Extrai mês da data"""
-        if not date_str:
-            return None
-        try:
-            from dateutil import parser
-            dt = parser.parse(date_str)
-            return dt.month
-        except:
-            return None
+        dt = parse_datetime(date_str)
+        return dt.month if dt else None
 
     def _calculate_sentiment_score(self) -> float:
         """
@@ -221,13 +321,141 @@ class NewsArticle:
     def from_dict(cls, data: Dict[str, Any]) -> 'NewsArticle':
         """Cria instância a partir de dicionário"""
         sentiment_data = data.get('sentimentos', {})
+        # Evita gerar o timestamp padrão quando o campo existe
+        busca_feita = data['busca_feita'] if 'busca_feita' in data else datetime.now().isoformat()
         
         return cls(
             url=data.get('url', ''),
             query=data.get('query', ''),
             titulo_noticia=data.get('titulo_noticia', ''),
             publicada=data.get('publicada'),
-            busca_feita=data.get('busca_feita', datetime.now().isoformat()),
+            busca_feita=busca_feita,
             resumo=data.get('resumo', ''),
-            sentimentos=SentimentAnalysis.from_dict(sentiment_data)
+            sentimentos=SentimentAnalysis.from_dict(sentiment_data),
+            cluster_id=data.get('cluster_id')
         )
+
+
+class NewsArticleBatch:
+    """
+    Lote de artigos armazenado diretamente em colunas tipadas
+
+    Colunas numéricas não nulas ficam em buffers `array` (float64/int64),
+    que são entregues ao pandas/pyarrow sem cópia; texto, datas (ISO 8601)
+    e inteiros anuláveis ficam em listas. Nenhum dict por linha é criado.
+    Com `dedupe=True` uma URL repetida substitui a linha anterior.
+
+    Como as exportações compartilham os buffers, o lote fica congelado
+    depois de `to_pandas`/`to_arrow`.
+    """
+
+    # Colunas sempre preenchidas, guardadas em buffers tipados
+    FLOAT_COLUMNS = (
+        'sentimento_polarity', 'sentimento_subjectivity', 'sentimento_confidence',
+        'sentimento_score', 'relevancia',
+    )
+    INT_COLUMNS = ('sentimento_positive_keywords', 'sentimento_negative_keywords')
+
+    def __init__(self, articles: Iterable['NewsArticle'] = (), dedupe: bool = True):
+        self.dedupe = dedupe
+        self._columns: Dict[str, Any] = {}
+        for name in RELATIONAL_COLUMNS:
+            if name in self.FLOAT_COLUMNS:
+                self._columns[name] = array('d')
+            elif name in self.INT_COLUMNS:
+                self._columns[name] = array('q')
+            else:
+                self._columns[name] = []
+        self._buffers = [self._columns[name] for name in RELATIONAL_COLUMNS]
+        self._row_by_hash: Dict[str, int] = {}
+        self._url_hash_idx = RELATIONAL_COLUMNS.index('url_hash')
+        self._frozen = False
+        self.extend(articles)
+
+    def __len__(self) -> int:
+        return len(self._columns['url_hash'])
+
+    def append(self, article: 'NewsArticle'):
+        """Projeta o artigo e grava cada valor na sua coluna"""
+        if self._frozen:
+            raise ValueError("Lote já exportado; crie um novo NewsArticleBatch")
+        row = article.to_relational_row()
+        if self.dedupe:
+            url_hash = row[self._url_hash_idx]
+            existing = self._row_by_hash.get(url_hash)
+            if existing is not None:
+                for buffer, value in zip(self._buffers, row):
+                    buffer[existing] = value
+                return
+            self._row_by_hash[url_hash] = len(self)
+        for buffer, value in zip(self._buffers, row):
+            buffer.append(value)
+
+    def extend(self, articles: Iterable['NewsArticle']):
+        """Adiciona vários artigos (projeção medida uma vez por lote)"""
+        rows = 0
+        with metrics.timer('model_projection_seconds'):
+            for article in articles:
+                self.append(article)
+                rows += 1
+        metrics.inc('model_projection_rows_total', rows)
+
+    def columns(self) -> Dict[str, Any]:
+        """Colunas na ordem de RELATIONAL_COLUMNS (buffers internos, sem cópia)"""
+        return dict(self._columns)
+
+    def to_pandas(self):
+        """
+        DataFrame relacional
+
+        Colunas numéricas são views numpy dos buffers do lote (sem cópia);
+        colunas de texto e datas são convertidas pelo pandas (com cópia).
+        """
+        import numpy as np
+        import pandas as pd
+
+        self._frozen = True
+        data = {}
+        for name in RELATIONAL_COLUMNS:
+            buffer = self._columns[name]
+            if isinstance(buffer, array):
+                dtype = np.float64 if buffer.typecode == 'd' else np.int64
+                data[name] = np.frombuffer(buffer, dtype=dtype) if len(buffer) else np.empty(0, dtype=dtype)
+            else:
+                data[name] = buffer
+        # copy=False: sem ele o pandas copia cada coluna de um dict
+        return pd.DataFrame(data, columns=RELATIONAL_COLUMNS, copy=False)
+
+    def to_arrow(self):
+        """
+        Tabela pyarrow com tipos da projeção relacional
+
+        Colunas de data viram timestamp UTC; valores não parseáveis ficam nulos.
+        """
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            raise ImportError("pyarrow é necessário para exportar em Arrow/Parquet") from e
+        import pandas as pd
+
+        self._frozen = True
+        arrays = []
+        for name, kind in RELATIONAL_SCHEMA:
+            buffer = self._columns[name]
+            if isinstance(buffer, array):
+                arrow_type = pa.float64() if buffer.typecode == 'd' else pa.int64()
+                arrays.append(pa.Array.from_buffers(arrow_type, len(buffer), [None, pa.py_buffer(buffer)]))
+            elif kind == 'timestamp':
+                values = pd.to_datetime(pd.Series(buffer, dtype=object), errors='coerce', utc=True, format='ISO8601')
+                arrays.append(pa.array(values, type=pa.timestamp('us', tz='UTC')))
+            elif kind == 'int':
+                arrays.append(pa.array(buffer, type=pa.int64()))
+            else:
+                arrays.append(pa.array(buffer, type=pa.string()))
+        return pa.Table.from_arrays(arrays, names=RELATIONAL_COLUMNS)
+
+    def write_parquet(self, path: str, compression: str = 'zstd'):
+        """Grava o lote em Parquet"""
+        import pyarrow.parquet as pq
+
+        pq.write_table(self.to_arrow(), path, compression=compression)
@@ -0,0 +1,389 @@
+"""
+Orquestrador do pipeline em DAG
+Etapas declaradas com dependências, ramos independentes em paralelo e
+cache por impressão digital das entradas (etapas inalteradas são puladas)
+"""
+import hashlib
+import json
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from src import metrics
+from src.context import PipelineContext
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = Path(__file__).parent.parent
+
+# Estados finais de uma etapa
+RAN = 'ran'
+CACHED = 'cached'
+FAILED = 'failed'
+BLOCKED = 'blocked'
+
+
+def fingerprint(*parts: Any) -> str:
+    """Hash estável de valores serializáveis em JSON"""
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+@dataclass(frozen=True)
+class Stage:
+    """
+    Etapa do pipeline
+
+    Attributes:
+        name: Identificador único
+        run: Executa a etapa com o contexto compartilhado
+        depends_on: Etapas que precisam terminar antes
+        inputs: Entradas externas que entram na impressão digital
+            (ex.: data do dia, SQL executado, script chamado)
+        volatile: Lê uma fonte externa que muda sozinha (sempre executa)
+        output: Reduz o resultado ao conteúdo produzido; o hash dele é o que
+            as dependentes enxergam. None indica que nada mudou (mantém o
+            hash anterior). Sem `output`, o hash é a própria impressão digital.
+        outputs: Arquivos gerados; se algum sumir, a etapa executa de novo
+        cache_if: Decide pelo resultado se a execução entra no cache (ex.:
+            busca vazia não conta); sem ela, toda execução sem erro entra
+    """
+    name: str
+    run: Callable[[PipelineContext], Any]
+    depends_on: Tuple[str, ...] = ()
+    inputs: Optional[Callable[[PipelineContext], Any]] = None
+    volatile: bool = False
+    output: Optional[Callable[[Any], Any]] = None
+    outputs: Tuple[str, ...] = ()
+    cache_if: Optional[Callable[[Any], bool]] = None
+
+
+@dataclass
+class StageResult:
+    """Resultado de uma etapa na execução atual"""
+    status: str
+    fingerprint: Optional[str] = None
+    digest: Optional[str] = None
+    seconds: float = 0.0
+    result: Any = None
+    error: Optional[str] = None
+
+
+class StageCache:
+    """
+    Impressões digitais e hashes de saída da última execução bem-sucedida
+    de cada etapa, persistidos em JSON (vazio = só memória)
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = Path(path) if path else None
+        self._lock = threading.Lock()
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        if self.path and self.path.exists():
+            try:
+                self.entries = json.loads(self.path.read_text(encoding='utf-8'))
+            except (OSError, ValueError) as e:
+                logger.warning(f"⚠️  Cache do orquestrador ilegível ({e}); executando tudo")
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self.entries.get(name)
+
+    def record(self, name: str, fingerprint: str, digest: str):
+        """Registra uma etapa concluída e grava o arquivo"""
+        with self._lock:
+            self.entries[name] = {
+                'fingerprint': fingerprint,
+                'digest': digest,
+                'finished_at': datetime.now().isoformat(),
+            }
+            if self.path:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self.path.with_suffix(self.path.suffix + '.tmp')
+                tmp.write_text(json.dumps(self.entries, ensure_ascii=False, indent=2), encoding='utf-8')
+                os.replace(tmp, self.path)
+
+
+class DAGRunner:
+    """
+    Executa etapas respeitando dependências
+
+    Etapas cujas dependências terminaram são iniciadas imediatamente, em
+    até `max_workers` threads. A impressão digital de uma etapa combina
+    suas entradas externas com os hashes de saída das dependências: se
+    for igual à da última execução, a etapa é pulada e repassa o hash
+    anterior, o que também pula as dependentes. Falhas bloqueiam apenas
+    as etapas que dependem da etapa com erro.
+    """
+
+    def __init__(self, stages: Sequence[Stage], cache: Optional[StageCache] = None, max_workers: int = 4):
+        self.stages = {stage.name: stage for stage in stages}
+        if len(self.stages) != len(stages):
+            raise ValueError("Nomes de etapa duplicados")
+        self.order = self._topological_order()
+        self.cache = cache or StageCache()
+        self.max_workers = max(1, max_workers)
+
+    def _topological_order(self) -> List[str]:
+        for stage in self.stages.values():
+            unknown = [dep for dep in stage.depends_on if dep not in self.stages]
+            if unknown:
+                raise ValueError(f"Etapa {stage.name} depende de etapas inexistentes: {unknown}")
+
+        order: List[str] = []
+        state: Dict[str, str] = {}
+
+        def visit(name: str, path: Tuple[str, ...]):
+            if state.get(name) == 'done':
+                return
+            if state.get(name) == 'visiting':
+                raise ValueError(f"Ciclo entre etapas: {' → '.join(path + (name,))}")
+            state[name] = 'visiting'
+            for dep in self.stages[name].depends_on:
+                visit(dep, path + (name,))
+            state[name] = 'done'
+            order.append(name)
+
+        for name in self.stages:
+            visit(name, ())
+        return order
+
+    def select(self, targets: Optional[Iterable[str]] = None) -> List[str]:
+        """Etapas necessárias para os alvos (todas se None), em ordem topológica"""
+        if not targets:
+            return list(self.order)
+        needed = set()
+        pending = list(targets)
+        while pending:
+            name = pending.pop()
+            if name not in self.stages:
+                raise ValueError(f"Etapa desconhecida: {name}")
+            if name not in needed:
+                needed.add(name)
+                pending.extend(self.stages[name].depends_on)
+        return [name for name in self.order if name in needed]
+
+    def _fingerprint(self, stage: Stage, context: PipelineContext, digests: Dict[str, str]) -> str:
+        inputs = stage.inputs(context) if stage.inputs else None
+        return fingerprint(stage.name, inputs, [digests[dep] for dep in stage.depends_on])
+
+    def _is_fresh(self, stage: Stage, stage_fingerprint: str) -> bool:
+        if stage.volatile:
+            return False
+        entry = self.cache.get(stage.name)
+        if not entry or entry['fingerprint'] != stage_fingerprint:
+            return False
+        return all((BASE_DIR / path).exists() for path in stage.outputs)
+
+    def _digest(self, stage: Stage, stage_fingerprint: str, result: Any) -> str:
+        if stage.output is None:
+            return stage_fingerprint
+        produced = stage.output(result)
+        if produced is None:
+            entry = self.cache.get(stage.name)
+            return entry['digest'] if entry else stage_fingerprint
+        return fingerprint(produced)
+
+    @staticmethod
+    def _execute(stage: Stage, context: PipelineContext) -> Tuple[Any, float]:
+        logger.info(f"▶️  Etapa {stage.name}")
+        start = time.perf_counter()
+        result = stage.run(context)
+        return result, time.perf_counter() - start
+
+    def run(
+        self,
+        context: PipelineContext,
+        targets: Optional[Iterable[str]] = None,
+        force: bool = False
+    ) -> Dict[str, StageResult]:
+        """
+        Executa as etapas selecionadas
+
+        Em `context.dry_run` as etapas rodam em modo simulado e o cache
+        não é atualizado.
+
+        Args:
+            targets: Etapas desejadas (dependências incluídas); todas se None
+            force: Ignora o cache e executa todas as etapas selecionadas
+
+        Returns:
+            Dict etapa → StageResult, na ordem topológica
+        """
+        selected = self.select(targets)
+        waiting = {
+            name: sum(1 for dep in self.stages[name].depends_on if dep in selected)
+            for name in selected
+        }
+        dependents: Dict[str, List[str]] = {name: [] for name in selected}
+        for name in selected:
+            for dep in self.stages[name].depends_on:
+                dependents[dep].append(name)
+
+        results: Dict[str, StageResult] = {}
+        digests: Dict[str, str] = {}
+        ready = [name for name in selected if waiting[name] == 0]
+        running = {}
+
+        def finish(name: str, result: StageResult):
+            results[name] = result
+            if result.digest is not None:
+                digests[name] = result.digest
+            metrics.inc('stages_total', stage=name, status=result.status)
+            for child in dependents[name]:
+                waiting[child] -= 1
+                if waiting[child] == 0:
+                    ready.append(child)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='stage') as executor:
+            while ready or running:
+                while ready:
+                    name = ready.pop(0)
+                    stage = self.stages[name]
+                    failed = [dep for dep in stage.depends_on if results[dep].status in (FAILED, BLOCKED)]
+                    if failed:
+                        logger.warning(f"⛔ {name} não executada: {', '.join(failed)} falhou")
+                        finish(name, StageResult(BLOCKED))
+                        continue
+                    try:
+                        stage_fingerprint = self._fingerprint(stage, context, digests)
+                    except Exception as e:
+                        logger.error(f"❌ {name}: erro ao calcular entradas: {e}")
+                        finish(name, StageResult(FAILED, error=str(e)))
+                        continue
+                    if not force and self._is_fresh(stage, stage_fingerprint):
+                        logger.info(f"⏭️  {name}: entradas inalteradas (cache)")
+                        entry = self.cache.get(name)
+                        finish(name, StageResult(CACHED, stage_fingerprint, entry['digest']))
+                        continue
+                    future = executor.submit(self._execute, stage, context)
+                    running[future] = (name, stage_fingerprint)
+
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name, stage_fingerprint = running.pop(future)
+                    stage = self.stages[name]
+                    try:
+                        result, seconds = future.result()
+                        digest = self._digest(stage, stage_fingerprint, result)
+                    except Exception as e:
+                        logger.error(f"❌ {name} falhou: {e}")
+                        finish(name, StageResult(FAILED, stage_fingerprint, error=str(e)))
+                        continue
+                    metrics.observe('stage_seconds', seconds, stage=name)
+                    logger.info(f"✅ {name} concluída em {seconds:.1f}s")
+                    if stage.cache_if and not stage.cache_if(result):
+                        logger.warning(f"⚠️  {name}: resultado vazio, não registrado no cache")
+                    elif not context.dry_run:
+                        self.cache.record(name, stage_fingerprint, digest)
+                    finish(name, StageResult(RAN, stage_fingerprint, digest, round(seconds, 3), result))
+
+        return {name: results[name] for name in selected}
+
+
+# ---------------------------------------------------------------------------
+# Etapas do pipeline BBAS3
+# ---------------------------------------------------------------------------
+
+def _collect(context: PipelineContext) -> Dict[str, Any]:
+    from src.collection import run_collection
+    return run_collection(context)
+
+
+def _collected_articles(result: Dict[str, Any]) -> Any:
+    """Conteúdo novo da coleta; None quando nenhum artigo foi gravado"""
+    stats = result.get('pipeline')
+    if not stats or not stats['articles']:
+        return None
+    return {'run_id': result['run_id'], 'articles': stats['articles'], 'saved': stats['saved']}
+
+
+def _prices(context: PipelineContext) -> Dict[str, Any]:
+    from src.prices import load_prices
+    return load_prices(context)
+
+
+def _migrate(context: PipelineContext) -> Dict[str, int]:
+    from src.loaders import migrate_tables
+    return migrate_tables(context)
+
+
+def _transform(group: str) -> Callable[[PipelineContext], List[str]]:
+    def run(context: PipelineContext) -> List[str]:
+        from src.transforms import run_transforms
+        return run_transforms(context, group)
+    return run
+
+
+def _transform_sql(group: str) -> Callable[[PipelineContext], List[str]]:
+    def inputs(context: PipelineContext) -> List[str]:
+        from src.transforms import TRANSFORMS
+        return [sql for _, sql in TRANSFORMS[group]]
+    return inputs
+
+
+def _visualization(script: str) -> Callable[[PipelineContext], None]:
+    def run(context: PipelineContext) -> None:
+        if context.dry_run:
+            logger.info(f"🧪 Dry-run: {script} não executado")
+            return
+        # Scripts independentes (plotly + conexão própria), sem abrir o navegador
+        subprocess.run([sys.executable, str(BASE_DIR / 'scripts' / script), '--no-show'], cwd=BASE_DIR, check=True)
+    return run
+
+
+def _script_source(script: str) -> Callable[[PipelineContext], str]:
+    def inputs(context: PipelineContext) -> str:
+        return fingerprint((BASE_DIR / 'scripts' / script).read_text(encoding='utf-8'))
+    return inputs
+
+
+def pipeline_stages() -> List[Stage]:
+    """
+    DAG do pipeline completo
+
+    Cotações e notícias são ramos independentes; as views de correlação e
+    os gráficos que cruzam preço e sentimento esperam os dois.
+    """
+    stages = [
+        Stage(
+            'prices', _prices,
+            inputs=lambda context: (date.today(), context.since),
+            # Busca vazia no Yahoo Finance: tabelas intactas, tenta de novo na próxima execução
+            output=lambda result: result if result['rows'] else None,
+            cache_if=lambda result: result['rows'] > 0
+        ),
+        Stage('collect', _collect, volatile=True, output=_collected_articles),
+        Stage('migrate', _migrate, depends_on=('collect',)),
+        Stage('transform_prices', _transform('prices'), depends_on=('prices',), inputs=_transform_sql('prices')),
+        Stage('transform_news', _transform('news'), depends_on=('migrate',), inputs=_transform_sql('news')),
+        Stage(
+            'transform_correlation', _transform('correlation'),
+            depends_on=('transform_prices', 'transform_news'), inputs=_transform_sql('correlation')
+        ),
+    ]
+    visualizations = [
+        ('viz_candlestick', 'visualizacao_candlestick.py', 'data/grafico_candlestick.html', ('transform_prices',)),
+        ('viz_indicadores', 'visualizacao_indicadores.py', 'data/dashboard_indicadores.html', ('transform_prices',)),
+        ('viz_heatmap', 'visualizacao_heatmap.py', 'data/heatmap_correlacao.html', ('transform_prices', 'collect')),
+        ('viz_sentimento', 'visualizacao_sentimento.py', 'data/correlacao_sentimento_preco.html',
+         ('transform_prices', 'collect')),
+    ]
+    for name, script, html, depends_on in visualizations:
+        stages.append(Stage(
+            name, _visualization(script),
+            depends_on=depends_on,
+            inputs=_script_source(script),
+            outputs=(html,)
+        ))
+    return stages
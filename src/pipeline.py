@@ -0,0 +1,211 @@
+"""
+Pipeline de coleta em streaming
+Coleta → deduplicação → micro-lotes → persistência/NDJSON, com filas limitadas
+"""
+import logging
+import queue
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Set
+
+from src import metrics
+from src.models import NewsArticle
+from src.services import NewsCollectorService, NewsPersistenceService
+from src.sinks import NDJSONSink
+from src.state import CollectionCheckpoint, SeenArticleIndex
+
+if TYPE_CHECKING:
+    from src.dedup import NearDuplicateIndex
+
+logger = logging.getLogger(__name__)
+
+# Marca de fim de fluxo na fila de lotes
+_END = object()
+
+
+def deduplicate(
+    articles: Iterable[NewsArticle],
+    seen_urls: Optional[Set[str]] = None
+) -> Iterator[NewsArticle]:
+    """
+    Filtra artigos com URL já vista neste fluxo
+
+    Args:
+        articles: Artigos de entrada
+        seen_urls: Conjunto compartilhado entre chamadas (opcional)
+    """
+    seen_urls = set() if seen_urls is None else seen_urls
+    for article in articles:
+        if article.url not in seen_urls:
+            seen_urls.add(article.url)
+            yield article
+
+
+class StreamingPipeline:
+    """
+    Pipeline produtor/consumidor da coleta de notícias
+
+    A thread principal consome o gerador do coletor, remove duplicatas e
+    monta micro-lotes; uma thread de escrita grava cada lote no NDJSON e
+    nos repositórios. A fila entre as duas é limitada (`queue_size`),
+    então uma persistência lenta segura a coleta em vez de acumular
+    artigos em memória.
+
+    Com um `CollectionCheckpoint`, queries já concluídas são puladas e
+    cada lote gravado é registrado; uma query só é marcada como concluída
+    depois que o lote com seu último artigo foi gravado.
+
+    O coletor pode ser qualquer objeto com `iter_query_results(queries)`
+    gerando (query, artigos); query None indica resultado parcial, que
+    não conclui nenhuma query (ver `src.backfill.DateWindowBackfill`).
+    """
+
+    def __init__(
+        self,
+        collector: NewsCollectorService,
+        persistence: Optional[NewsPersistenceService] = None,
+        json_sink: Optional[NDJSONSink] = None,
+        seen_index: Optional[SeenArticleIndex] = None,
+        batch_size: int = 200,
+        queue_size: int = 4,
+        checkpoint: Optional[CollectionCheckpoint] = None,
+        near_duplicates: Optional['NearDuplicateIndex'] = None
+    ):
+        self.collector = collector
+        self.persistence = persistence
+        self.json_sink = json_sink
+        self.seen_index = seen_index
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+        self.checkpoint = checkpoint
+        self.near_duplicates = near_duplicates
+
+    def _persist(self, batch: List[NewsArticle], stats: Dict[str, Any]) -> bool:
+        """
+        Grava um lote em todos os destinos e registra no índice local
+
+        Returns:
+            bool: True se todos os repositórios configurados aceitaram o
+            lote (sem repositórios, basta a gravação no NDJSON)
+        """
+        if self.json_sink:
+            self.json_sink.write_many(batch)
+            self.json_sink.flush()
+
+        repositories = self.persistence.repositories if self.persistence else []
+        if repositories:
+            results = self.persistence.save_all(batch)
+            for repo_name, count in results.items():
+                stats['saved'][repo_name] = stats['saved'].get(repo_name, 0) + count
+            for repo_name, error in self.persistence.last_errors.items():
+                stats['errors'].setdefault(repo_name, []).append(error)
+
+        # Com falha em algum repositório o lote não entra no índice local,
+        # não avança a marca d'água e não conclui queries no checkpoint;
+        # o NDJSON sozinho não garante que o lote chegou aos bancos
+        persisted = not repositories or not self.persistence.last_errors
+        if self.seen_index and persisted:
+            self.seen_index.mark_collected(batch)
+
+        stats['batches'] += 1
+        if stats['first_batch_seconds'] is None:
+            stats['first_batch_seconds'] = round(time.perf_counter() - stats['_start'], 3)
+        logger.info(f"💾 Lote {stats['batches']}: {len(batch)} artigos gravados")
+        return persisted
+
+    def _writer(self, batches: "queue.Queue", stats: Dict[str, Any]):
+        """Thread consumidora: grava lotes até receber o marcador de fim"""
+        # Após um lote não gravado, nenhuma query é dada como concluída
+        healthy = True
+        while True:
+            item = batches.get()
+            if item is _END:
+                return
+            batch_id, batch, completed_queries = item
+            try:
+                with metrics.timer('pipeline_batch_seconds'):
+                    persisted = self._persist(batch, stats) if batch else True
+            except Exception as e:
+                logger.error(f"❌ Erro ao gravar lote: {e}")
+                stats['errors'].setdefault('pipeline', []).append(str(e))
+                persisted = False
+
+            healthy = healthy and persisted
+            if self.checkpoint and healthy:
+                self.checkpoint.record_batch(batch_id, batch, completed_queries)
+
+    def run(self, queries: Iterable[str]) -> Dict[str, Any]:
+        """
+        Executa coleta e persistência em streaming
+
+        Returns:
+            Dict com artigos, lotes, contagens por repositório, erros,
+            queries puladas pelo checkpoint e tempo até o primeiro lote
+        """
+        queries = list(queries)
+        pending_queries = self.checkpoint.pending(queries) if self.checkpoint else queries
+        stats: Dict[str, Any] = {
+            'articles': 0,
+            'batches': 0,
+            'saved': {},
+            'errors': {},
+            'skipped_queries': len(queries) - len(pending_queries),
+            'near_duplicates': 0,
+            'first_batch_seconds': None,
+            '_start': time.perf_counter(),
+        }
+        if stats['skipped_queries']:
+            logger.info(f"⏭️  {stats['skipped_queries']} queries já concluídas no checkpoint")
+
+        duplicates_before = self.near_duplicates.duplicates if self.near_duplicates else 0
+
+        batches: "queue.Queue" = queue.Queue(maxsize=self.queue_size)
+        writer = threading.Thread(target=self._writer, args=(batches, stats), name='pipeline-writer')
+        writer.start()
+
+        batch: List[NewsArticle] = []
+        completed: List[str] = []
+
+        def emit():
+            nonlocal batch, completed
+            batch_id = self.checkpoint.next_batch_id() if self.checkpoint and batch else None
+            # Bloqueia quando a fila está cheia (backpressure)
+            with metrics.timer('pipeline_backpressure_seconds'):
+                batches.put((batch_id, batch, completed))
+            batch, completed = [], []
+
+        try:
+            seen_urls: Set[str] = set()
+            for query, articles in self.collector.iter_query_results(pending_queries):
+                new_articles = list(deduplicate(articles, seen_urls))
+                if self.near_duplicates and new_articles:
+                    # Marca matérias sindicadas com o cluster_id canônico
+                    with metrics.timer('near_duplicate_seconds'):
+                        self.near_duplicates.assign_many(new_articles)
+                for article in new_articles:
+                    batch.append(article)
+                    stats['articles'] += 1
+                    if len(batch) >= self.batch_size:
+                        emit()
+                if query is None:
+                    # Resultado parcial (ex.: uma janela de backfill)
+                    continue
+                # A query termina junto com o lote em montagem; sem lote
+                # aberto, basta que os lotes já enfileirados sejam gravados
+                completed.append(query)
+                if not batch:
+                    emit()
+            if batch or completed:
+                emit()
+        finally:
+            batches.put(_END)
+            writer.join()
+
+        if self.near_duplicates:
+            stats['near_duplicates'] = self.near_duplicates.duplicates - duplicates_before
+
+        if self.checkpoint and not self.checkpoint.pending(queries):
+            self.checkpoint.finish()
+
+        stats['elapsed_seconds'] = round(time.perf_counter() - stats.pop('_start'), 3)
+        return stats
@@ -0,0 +1,179 @@
+"""
+Cotações históricas da BBAS3 (Yahoo Finance)
+Busca, padroniza e carrega no PostgreSQL e no Snowflake
+"""
+import hashlib
+import logging
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Any, Dict, Optional, Sequence, Tuple
+
+from src.context import PipelineContext
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Tickers tentados em ordem (.SAO e .SA indicam ações da B3)
+TICKERS = ("BBAS3.SAO", "BBAS3.SA")
+
+# Início padrão do histórico quando --since não é informado
+DEFAULT_START = date(2020, 1, 1)
+
+# Dias corridos buscados antes de --since para obter o pregão anterior
+# (variação do primeiro dia da janela); cobre fins de semana e feriados
+LOOKBACK_DAYS = 10
+
+# Tabelas de destino (lidas por `src.transforms`)
+PG_PRICES_TABLE = "bbas3_dados_reais_api"
+SF_PRICES_TABLE = "BBAS3_DADOS_REAIS_API"
+
+# Colunas do Yahoo Finance → colunas em português
+COLUMN_NAMES = {
+    'Date': 'Data',
+    'Open': 'Abertura',
+    'High': 'Maxima',
+    'Low': 'Minima',
+    'Close': 'Fechamento',
+    'Volume': 'Volume',
+}
+PRICE_COLUMNS = ['Data', 'Abertura', 'Maxima', 'Minima', 'Fechamento', 'Volume', 'Variacao_Percentual']
+
+
+def fetch_history(start: date, end: date, tickers: Sequence[str] = TICKERS) -> 'pd.DataFrame':
+    """
+    Histórico diário do primeiro ticker que retornar dados
+
+    Returns:
+        DataFrame do yfinance (vazio se nenhum ticker funcionar)
+    """
+    try:
+        import yfinance as yf
+    except ImportError as e:
+        raise ImportError("yfinance é necessário para buscar cotações (pip install yfinance)") from e
+    import pandas as pd
+
+    for ticker in tickers:
+        logger.info(f"📊 Buscando {ticker} de {start} até {end}")
+        try:
+            history = yf.Ticker(ticker).history(start=start.isoformat(), end=end.isoformat())
+        except Exception as e:
+            logger.warning(f"⚠️  Erro ao buscar {ticker}: {e}")
+            continue
+        if not history.empty:
+            return history
+        logger.warning(f"⚠️  Ticker {ticker} não retornou dados")
+    return pd.DataFrame()
+
+
+def prepare_prices(history: 'pd.DataFrame') -> 'pd.DataFrame':
+    """Padroniza o histórico: data simples, colunas em português, variação diária (%)"""
+    import pandas as pd
+
+    df = history.reset_index()
+    df['Date'] = pd.to_datetime(df['Date']).dt.date
+    df['Variacao_Percentual'] = df['Close'].pct_change() * 100
+    df = df.rename(columns=COLUMN_NAMES)
+    for column in ('Abertura', 'Maxima', 'Minima', 'Fechamento', 'Variacao_Percentual'):
+        df[column] = df[column].round(2)
+    return df[PRICE_COLUMNS].dropna()
+
+
+def _write_postgres(df: 'pd.DataFrame', engine, window: Optional[Tuple[date, date]]):
+    """Substitui a tabela inteira ou, com janela, apenas os pregões do intervalo"""
+    if window is None:
+        df.to_sql(PG_PRICES_TABLE, engine, if_exists='replace', index=False)
+        return
+
+    from sqlalchemy import inspect, text
+    with engine.begin() as conn:
+        if inspect(conn).has_table(PG_PRICES_TABLE):
+            conn.execute(
+                text(f'DELETE FROM {PG_PRICES_TABLE} WHERE "Data" >= :start AND "Data" < :end'),
+                {'start': window[0], 'end': window[1]}
+            )
+        df.to_sql(PG_PRICES_TABLE, conn, if_exists='append', index=False)
+
+
+def _write_snowflake(df: 'pd.DataFrame', conn, window: Optional[Tuple[date, date]]) -> int:
+    """Sobrescreve a tabela inteira ou, com janela, apaga e reinsere o intervalo"""
+    from snowflake.connector.pandas_tools import write_pandas
+
+    if window is not None:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(
+                "SELECT COUNT(*) FROM INFORMATION_SCHEMA.TABLES "
+                "WHERE TABLE_SCHEMA = CURRENT_SCHEMA() AND TABLE_NAME = %s",
+                (SF_PRICES_TABLE,)
+            )
+            if cursor.fetchone()[0]:
+                cursor.execute(
+                    f'DELETE FROM {SF_PRICES_TABLE} WHERE "Data" >= %s AND "Data" < %s',
+                    (window[0], window[1])
+                )
+        finally:
+            cursor.close()
+
+    success, _, nrows, _ = write_pandas(
+        conn=conn,
+        df=df,
+        table_name=SF_PRICES_TABLE,
+        auto_create_table=True,
+        overwrite=window is None
+    )
+    logger.info(f"❄️  Snowflake: {nrows} linhas em '{SF_PRICES_TABLE}' (sucesso: {success})")
+    return nrows
+
+
+def load_prices(context: PipelineContext, end: Optional[date] = None) -> Dict[str, Any]:
+    """
+    Busca as cotações e grava nas tabelas de cotações do PostgreSQL e do Snowflake
+
+    Sem `context.since` o histórico completo substitui as tabelas. Com
+    `since`, só os pregões da janela [since, end) são apagados e reinseridos;
+    o pregão anterior à janela é buscado para calcular a variação do
+    primeiro dia. Usa o pool PostgreSQL e a sessão Snowflake do contexto.
+    Em dry-run as cotações são buscadas, mas não gravadas.
+
+    Returns:
+        Dict com quantidade de pregões, primeira/última data e checksum do
+        conteúdo (usado pelo orquestrador para detectar mudanças)
+    """
+    import pandas as pd
+
+    end = end or date.today() + timedelta(days=1)
+    window = (context.since, end) if context.since else None
+    start = context.since - timedelta(days=LOOKBACK_DAYS) if window else DEFAULT_START
+    history = fetch_history(start, end)
+    if history.empty:
+        logger.warning("⏭️  Nenhum ticker retornou dados; cotações não atualizadas")
+        return {'rows': 0, 'first': None, 'last': None, 'checksum': None}
+
+    df = prepare_prices(history)
+    if window:
+        df = df[df['Data'] >= window[0]].reset_index(drop=True)
+        if df.empty:
+            logger.warning(f"⏭️  Nenhum pregão a partir de {window[0]}; cotações não atualizadas")
+            return {'rows': 0, 'first': None, 'last': None, 'checksum': None}
+    summary = {
+        'rows': len(df),
+        'first': str(df['Data'].min()),
+        'last': str(df['Data'].max()),
+        'checksum': hashlib.sha256(pd.util.hash_pandas_object(df, index=False).values.tobytes()).hexdigest()[:16],
+    }
+    logger.info(f"✅ {summary['rows']} pregões de {summary['first']} a {summary['last']}")
+    if context.dry_run:
+        logger.info("🧪 Dry-run: cotações não gravadas")
+        return summary
+
+    settings = context.settings
+    if settings.postgresql.enabled:
+        _write_postgres(df, context.postgres_engine(), window)
+        scope = f"pregões a partir de {window[0]}" if window else "tabela substituída"
+        logger.info(f"💾 PostgreSQL: '{PG_PRICES_TABLE}' atualizada ({scope})")
+
+    if settings.snowflake.enabled:
+        _write_snowflake(df, context.snowflake_connection(), window)
+
+    return summary
@@ -1,22 +1,37 @@
 """
 Repositórios para acesso a dados
 Implementa padrão Repository para desacoplar lógica de negócio do acesso a dados
+
+Os drivers (pymongo, SQLAlchemy, pandas, Snowflake) são importados apenas
+quando o repositório correspondente é criado: uma execução só com MongoDB
+não paga a importação dos demais.
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
+import csv
+import importlib
+import io
 import logging
-from pymongo import MongoClient, errors
-from sqlalchemy import create_engine, text
-import pandas as pd
-from snowflake.connector import connect
-from snowflake.connector.pandas_tools import write_pandas
+import threading
 
-from src.models import NewsArticle
+from src import metrics
+from src.models import NewsArticle, NewsArticleBatch, RELATIONAL_COLUMNS, RELATIONAL_SCHEMA
 from src.config import MongoDBConfig, PostgreSQLConfig, SnowflakeConfig
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = logging.getLogger(__name__)
 
 
+def _require(module: str, package: str):
+    """Importa o driver de um backend sob demanda"""
+    try:
+        return importlib.import_module(module)
+    except ImportError as e:
+        raise ImportError(f"{package} é necessário para este repositório (pip install {package})") from e
+
+
 class INewsRepository(ABC):
     """Interface para repositório de notícias"""
     
@@ -35,18 +50,26 @@ class INewsRepository(ABC):
         """Conta total de artigos"""
         pass
 
+    def close(self):
+        """Libera conexões abertas (opcional)"""
+        pass
+
 
 class MongoDBRepository(INewsRepository):
     """Repositório MongoDB"""
     
     def __init__(self, config: MongoDBConfig):
+        _require('pymongo', 'pymongo')
         self.config = config
         self._client = None
         self._collection = None
+        # False quando nem após remover duplicatas o índice único foi criado
+        self.unique_url = True
 
     def _connect(self):
         """Estabelece conexão com MongoDB"""
         if self._collection is None:
+            from pymongo import MongoClient, errors
             try:
                 self._client = MongoClient(
                     self.config.uri,
@@ -59,23 +82,62 @@ class MongoDBRepository(INewsRepository):
             except errors.ServerSelectionTimeoutError as e:
                 logger.error(f"❌ Erro ao conectar ao MongoDB: {e}")
                 raise
+            self._ensure_indexes()
+
+    def _ensure_indexes(self):
+        """Garante índice único em `url` (upserts viram buscas por índice)"""
+        from pymongo import ASCENDING, errors
+        try:
+            self._collection.create_index([('url', ASCENDING)], unique=True, name='url_unique')
+        except errors.OperationFailure as e:
+            # Coleções antigas podem ter URLs duplicadas: remove e tenta de novo
+            logger.warning(f"⚠️  Índice único em 'url' não criado ({e}); removendo duplicatas")
+            removed = self._dedupe_urls()
+            logger.info(f"🧹 MongoDB: {removed} documentos duplicados por 'url' removidos")
+            try:
+                self._collection.create_index([('url', ASCENDING)], unique=True, name='url_unique')
+            except errors.OperationFailure as e:
+                self.unique_url = False
+                logger.error(
+                    f"❌ Índice único em 'url' não criado mesmo após remover duplicatas: {e}. "
+                    f"Upserts seguem sem garantia de unicidade"
+                )
+                self._collection.create_index([('url', ASCENDING)], name='url_1')
+        # Agrupamento por matéria (quase-duplicatas) nos dashboards
+        self._collection.create_index([('cluster_id', ASCENDING)], name='cluster_id_1', sparse=True)
+
+    def _dedupe_urls(self) -> int:
+        """Remove documentos com `url` repetida, mantendo a busca mais recente"""
+        pipeline = [
+            {'$sort': {'busca_feita': 1, '_id': 1}},
+            {'$group': {'_id': '$url', 'ids': {'$push': '$_id'}, 'count': {'$sum': 1}}},
+            {'$match': {'count': {'$gt': 1}}},
+        ]
+        removed = 0
+        for group in self._collection.aggregate(pipeline, allowDiskUse=True):
+            removed += self._collection.delete_many({'_id': {'$in': group['ids'][:-1]}}).deleted_count
+        return removed
 
     def save(self, articles: List[NewsArticle]) -> int:
-        """Salva artigos no MongoDB usando upsert"""
+        """Salva artigos no MongoDB usando upserts em lote (bulk_write)"""
+        from pymongo import UpdateOne, errors
         self._connect()
         
+        chunk_size = max(1, self.config.bulk_size)
         saved_count = 0
-        for article in articles:
+        for start in range(0, len(articles), chunk_size):
+            operations = [
+                UpdateOne({'url': article.url}, {'$set': article.to_dict()}, upsert=True)
+                for article in articles[start:start + chunk_size]
+            ]
             try:
-                result = self._collection.update_one(
-                    {'url': article.url},
-                    {'$set': article.to_dict()},
-                    upsert=True
-                )
-                if result.upserted_id or result.modified_count > 0:
-                    saved_count += 1
-            except Exception as e:
-                logger.error(f"Erro ao salvar artigo {article.url}: {e}")
+                result = self._collection.bulk_write(operations, ordered=False)
+                saved_count += result.upserted_count + result.modified_count
+            except errors.BulkWriteError as e:
+                details = e.details or {}
+                saved_count += details.get('nUpserted', 0) + details.get('nModified', 0)
+                for error in details.get('writeErrors', [])[:5]:
+                    logger.error(f"Erro ao salvar artigo: {error.get('errmsg')}")
         
         logger.info(f"✅ MongoDB: {saved_count} documentos salvos/atualizados")
         return saved_count
@@ -91,6 +153,40 @@ class MongoDBRepository(INewsRepository):
         self._connect()
         return self._collection.count_documents({})
 
+    def iter_documents(
+        self,
+        projection: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1000
+    ) -> Iterator[Dict[str, Any]]:
+        """Percorre a coleção em streaming (cursor com lotes de `batch_size`)"""
+        self._connect()
+        cursor = self._collection.find({}, projection, no_cursor_timeout=True).batch_size(batch_size)
+        try:
+            yield from cursor
+        finally:
+            cursor.close()
+
+    def update_sentiments(self, updates: List[Tuple[str, Dict[str, Any]]]) -> int:
+        """
+        Atualiza o campo `sentimentos` de vários artigos com um único bulk_write
+
+        Args:
+            updates: Pares (url, sentimentos)
+
+        Returns:
+            int: Quantidade de documentos modificados
+        """
+        if not updates:
+            return 0
+        from pymongo import UpdateOne
+        self._connect()
+        operations = [
+            UpdateOne({'url': url}, {'$set': {'sentimentos': sentiment}})
+            for url, sentiment in updates
+        ]
+        result = self._collection.bulk_write(operations, ordered=False)
+        return result.modified_count
+
     def close(self):
         """Fecha conexão"""
         if self._client:
@@ -98,16 +194,37 @@ class MongoDBRepository(INewsRepository):
 
 
 class PostgreSQLRepository(INewsRepository):
-    """Repositório PostgreSQL"""
+    """
+    Repositório PostgreSQL
+
+    Modos de carga (`PG_LOAD_MODE`):
+      - merge: COPY para tabela temporária + INSERT ... ON CONFLICT (url_hash)
+      - replace: recria a tabela inteira com DataFrame.to_sql (legado)
+    """
+    
+    # Tipo PostgreSQL de cada tipo lógico da projeção relacional
+    COLUMN_TYPES = {
+        'text': 'TEXT',
+        'timestamp': 'TIMESTAMPTZ',
+        'int': 'INTEGER',
+        'float': 'DOUBLE PRECISION',
+    }
+    
+    # Marcador de NULL no CSV enviado via COPY
+    COPY_NULL = '\\N'
     
     def __init__(self, config: PostgreSQLConfig):
+        _require('sqlalchemy', 'sqlalchemy')
         self.config = config
         self._engine = None
-        self.table_name = 'noticias_bbas3'
+        self.table_name = config.table_name
+        # DDL de _ensure_table roda uma vez por instância, não a cada lote
+        self._table_checked = False
 
     def _connect(self):
         """Estabelece conexão com PostgreSQL"""
         if self._engine is None:
+            from sqlalchemy import create_engine, text
             try:
                 self._engine = create_engine(
                     self.config.get_connection_string(),
@@ -122,16 +239,18 @@ class PostgreSQLRepository(INewsRepository):
                 raise
 
     def save(self, articles: List[NewsArticle]) -> int:
-        """Salva artigos no PostgreSQL"""
+        """Salva artigos no PostgreSQL (merge incremental ou replace)"""
         self._connect()
         
+        if self.config.load_mode == 'replace':
+            return self._save_replace(articles)
+        return self._save_merge(articles)
+
+    def _save_replace(self, articles: List[NewsArticle]) -> int:
+        """Substitui a tabela inteira pelos artigos informados"""
         try:
-            # Converte para formato relacional
-            records = [article.to_relational_dict() for article in articles]
-            df = pd.DataFrame(records)
-            
-            # Remove duplicatas pelo hash da URL
-            df = df.drop_duplicates(subset=['url_hash'], keep='last')
+            # Converte para formato relacional (colunar, sem duplicatas de url_hash)
+            df = NewsArticleBatch(articles).to_pandas()
             
             # Salva no banco (substitui tabela)
             df.to_sql(
@@ -141,6 +260,8 @@ class PostgreSQLRepository(INewsRepository):
                 index=False,
                 method='multi'
             )
+            # Tabela recriada pelo pandas, sem chave primária
+            self._table_checked = False
             
             saved_count = len(df)
             logger.info(f"✅ PostgreSQL: {saved_count} registros salvos na tabela '{self.table_name}'")
@@ -150,8 +271,115 @@ class PostgreSQLRepository(INewsRepository):
             logger.error(f"❌ Erro ao salvar no PostgreSQL: {e}")
             raise
 
+    def _create_table_sql(self) -> str:
+        """DDL da tabela de notícias com chave primária em url_hash"""
+        columns = ',\n    '.join(
+            f"{name} {self.COLUMN_TYPES[kind]}" + (' PRIMARY KEY' if name == 'url_hash' else '')
+            for name, kind in RELATIONAL_SCHEMA
+        )
+        return f"CREATE TABLE IF NOT EXISTS {self.table_name} (\n    {columns}\n)"
+
+    def _merge_sql(self, staging_table: str) -> str:
+        """INSERT ... ON CONFLICT a partir da tabela de staging"""
+        columns = ', '.join(RELATIONAL_COLUMNS)
+        updates = ', '.join(
+            f"{name} = EXCLUDED.{name}" for name in RELATIONAL_COLUMNS if name != 'url_hash'
+        )
+        return (
+            f"INSERT INTO {self.table_name} ({columns}) "
+            f"SELECT {columns} FROM {staging_table} "
+            f"ON CONFLICT (url_hash) DO UPDATE SET {updates}"
+        )
+
+    def _to_copy_buffer(self, articles: List[NewsArticle]) -> io.StringIO:
+        """Serializa artigos em CSV para COPY (último registro vence por url_hash)"""
+        url_hash_idx = RELATIONAL_COLUMNS.index('url_hash')
+        rows = {}
+        with metrics.timer('model_projection_seconds'):
+            for article in articles:
+                row = article.to_relational_row()
+                rows[row[url_hash_idx]] = [
+                    self.COPY_NULL if value is None else value
+                    for value in row
+                ]
+        metrics.inc('model_projection_rows_total', len(articles))
+        
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerows(rows.values())
+        buffer.seek(0)
+        return buffer
+
+    def _add_columns_sql(self) -> str:
+        """Adiciona colunas novas da projeção em tabelas criadas antes delas"""
+        clauses = ', '.join(
+            f"ADD COLUMN IF NOT EXISTS {name} {self.COLUMN_TYPES[kind]}"
+            for name, kind in RELATIONAL_SCHEMA
+        )
+        return f"ALTER TABLE {self.table_name} {clauses}"
+
+    def _ensure_table(self, cursor):
+        """Cria a tabela (ou adiciona PK/colunas novas em tabelas legadas)"""
+        if self._table_checked:
+            return
+        cursor.execute(self._create_table_sql())
+        cursor.execute(self._add_columns_sql())
+        cursor.execute(
+            "SELECT 1 FROM information_schema.table_constraints "
+            "WHERE table_name = %s AND constraint_type = 'PRIMARY KEY'",
+            (self.table_name,)
+        )
+        if cursor.fetchone() is None:
+            logger.info(f"🔑 Adicionando chave primária (url_hash) em '{self.table_name}'")
+            cursor.execute(f"ALTER TABLE {self.table_name} ADD PRIMARY KEY (url_hash)")
+        self._table_checked = True
+
+    def _save_merge(self, articles: List[NewsArticle]) -> int:
+        """Carga incremental: COPY para staging e upsert na tabela final"""
+        if not articles:
+            return 0
+        
+        buffer = self._to_copy_buffer(articles)
+        staging_table = f"{self.table_name}_staging"
+        columns = ', '.join(RELATIONAL_COLUMNS)
+        
+        raw_conn = self._engine.raw_connection()
+        try:
+            cursor = raw_conn.cursor()
+            self._ensure_table(cursor)
+            cursor.execute(
+                f"CREATE TEMP TABLE {staging_table} "
+                f"(LIKE {self.table_name} INCLUDING DEFAULTS) ON COMMIT DROP"
+            )
+            cursor.copy_expert(
+                f"COPY {staging_table} ({columns}) FROM STDIN "
+                f"WITH (FORMAT csv, NULL '{self.COPY_NULL}')",
+                buffer
+            )
+            cursor.execute(self._merge_sql(staging_table))
+            saved_count = cursor.rowcount
+            raw_conn.commit()
+            cursor.close()
+        except Exception as e:
+            raw_conn.rollback()
+            # O rollback desfaz também o DDL: verifica de novo no próximo lote
+            self._table_checked = False
+            logger.error(f"❌ Erro ao salvar no PostgreSQL: {e}")
+            raise
+        finally:
+            raw_conn.close()
+        
+        logger.info(f"✅ PostgreSQL: {saved_count} registros inseridos/atualizados na tabela '{self.table_name}'")
+        return saved_count
+
+    def engine(self):
+        """Engine SQLAlchemy (pool compartilhado com outras etapas do processo)"""
+        self._connect()
+        return self._engine
+
     def find_by_url(self, url: str) -> Optional[NewsArticle]:
         """Busca artigo por URL"""
+        from sqlalchemy import text
         self._connect()
         
         import hashlib
@@ -169,6 +397,7 @@ class PostgreSQLRepository(INewsRepository):
 
     def count(self) -> int:
         """Conta total de artigos"""
+        from sqlalchemy import text
         self._connect()
         
         query = f"SELECT COUNT(*) as total FROM {self.table_name}"
@@ -178,73 +407,183 @@ class PostgreSQLRepository(INewsRepository):
             row = result.fetchone()
             return row[0] if row else 0
 
+    def close(self):
+        """Libera o pool de conexões"""
+        if self._engine is not None:
+            self._engine.dispose()
+            self._engine = None
+
 
 class SnowflakeRepository(INewsRepository):
-    """Repositório Snowflake"""
+    """
+    Repositório Snowflake
+
+    Mantém uma única sessão reutilizada entre chamadas. Modos de carga
+    (`SF_LOAD_MODE`):
+      - merge: write_pandas em tabela temporária + MERGE em URL_HASH
+      - replace: write_pandas com overwrite (legado)
+    """
+    
+    # Tipo Snowflake de cada tipo lógico da projeção relacional
+    COLUMN_TYPES = {
+        'text': 'VARCHAR',
+        'timestamp': 'TIMESTAMP_TZ',
+        'int': 'NUMBER(38,0)',
+        'float': 'FLOAT',
+    }
     
     def __init__(self, config: SnowflakeConfig):
+        _require('snowflake.connector', 'snowflake-connector-python')
+        _require('pandas', 'pandas')
         self.config = config
-        self.table_name = 'NOTICIAS_BBAS3'
+        self.table_name = config.table_name
+        self._conn = None
+        self._lock = threading.Lock()
+        self._columns_checked = False
 
     def _connect(self):
-        """Cria conexão com Snowflake"""
+        """Retorna a sessão Snowflake, abrindo (ou reabrindo) quando necessário"""
+        with self._lock:
+            if self._conn is not None and not self._conn.is_closed():
+                return self._conn
+            from snowflake.connector import connect
+            try:
+                self._conn = connect(
+                    user=self.config.user,
+                    password=self.config.password,
+                    account=self.config.account,
+                    warehouse=self.config.warehouse,
+                    database=self.config.database,
+                    schema=self.config.schema,
+                    client_session_keep_alive=True
+                )
+                logger.info(f"✅ Conectado ao Snowflake: {self.config.database}.{self.config.schema}")
+                return self._conn
+            except Exception as e:
+                logger.error(f"❌ Erro ao conectar ao Snowflake: {e}")
+                raise
+
+    def connection(self):
+        """Sessão Snowflake reutilizada (compartilhada com outras etapas do processo)"""
+        return self._connect()
+
+    def _to_dataframe(self, articles: List[NewsArticle]) -> 'pd.DataFrame':
+        """Converte artigos para DataFrame relacional com colunas de data tipadas"""
+        import pandas as pd
+        # Formato relacional colunar, sem duplicatas de url_hash
+        df = NewsArticleBatch(articles).to_pandas()
+        
+        # Converte colunas de data para formato compatível
+        date_columns = ['publicada', 'busca_feita']
+        for col in date_columns:
+            if col in df.columns:
+                df[col] = pd.to_datetime(df[col], errors='coerce')
+        return df
+
+    def save(self, articles: List[NewsArticle]) -> int:
+        """Salva artigos no Snowflake (merge incremental ou replace)"""
+        conn = self._connect()
+        
         try:
-            conn = connect(
-                user=self.config.user,
-                password=self.config.password,
-                account=self.config.account,
-                warehouse=self.config.warehouse,
-                database=self.config.database,
-                schema=self.config.schema
-            )
-            logger.info(f"✅ Conectado ao Snowflake: {self.config.database}.{self.config.schema}")
-            return conn
+            df = self._to_dataframe(articles)
+            if self.config.load_mode == 'replace':
+                return self._save_replace(conn, df)
+            return self._save_merge(conn, df)
         except Exception as e:
-            logger.error(f"❌ Erro ao conectar ao Snowflake: {e}")
+            logger.error(f"❌ Erro ao salvar no Snowflake: {e}")
             raise
 
-    def save(self, articles: List[NewsArticle]) -> int:
-        """Salva artigos no Snowflake"""
-        conn = self._connect()
+    def _save_replace(self, conn, df: 'pd.DataFrame') -> int:
+        """Sobrescreve a tabela inteira com o DataFrame"""
+        from snowflake.connector.pandas_tools import write_pandas
+        success, nchunks, nrows, _ = write_pandas(
+            conn=conn,
+            df=df,
+            table_name=self.table_name,
+            auto_create_table=True,
+            overwrite=True,
+            quote_identifiers=False
+        )
         
+        if success:
+            logger.info(f"✅ Snowflake: {nrows} registros salvos na tabela '{self.table_name}'")
+            return nrows
+        logger.error("❌ Erro ao salvar no Snowflake")
+        return 0
+
+    def _create_table_sql(self) -> str:
+        """DDL da tabela de notícias com chave primária em URL_HASH"""
+        columns = ', '.join(
+            f"{name.upper()} {self.COLUMN_TYPES[kind]}" + (' PRIMARY KEY' if name == 'url_hash' else '')
+            for name, kind in RELATIONAL_SCHEMA
+        )
+        return f"CREATE TABLE IF NOT EXISTS {self.table_name} ({columns})"
+
+    def _ensure_columns(self, cursor):
+        """Adiciona colunas novas da projeção em tabelas criadas antes delas"""
+        if self._columns_checked:
+            return
+        cursor.execute(
+            "SELECT COLUMN_NAME FROM INFORMATION_SCHEMA.COLUMNS "
+            "WHERE TABLE_SCHEMA = CURRENT_SCHEMA() AND TABLE_NAME = %s",
+            (self.table_name.upper(),)
+        )
+        existing = {row[0] for row in cursor.fetchall()}
+        for name, kind in RELATIONAL_SCHEMA:
+            if name.upper() not in existing:
+                logger.info(f"➕ Adicionando coluna {name.upper()} em '{self.table_name}'")
+                cursor.execute(
+                    f"ALTER TABLE {self.table_name} ADD COLUMN {name.upper()} {self.COLUMN_TYPES[kind]}"
+                )
+        self._columns_checked = True
+
+    def _merge_sql(self, staging_table: str) -> str:
+        """MERGE da tabela de staging na tabela final por URL_HASH"""
+        columns = [name.upper() for name in RELATIONAL_COLUMNS]
+        updates = ', '.join(f"t.{c} = s.{c}" for c in columns if c != 'URL_HASH')
+        return (
+            f"MERGE INTO {self.table_name} t USING {staging_table} s "
+            f"ON t.URL_HASH = s.URL_HASH "
+            f"WHEN MATCHED THEN UPDATE SET {updates} "
+            f"WHEN NOT MATCHED THEN INSERT ({', '.join(columns)}) "
+            f"VALUES ({', '.join('s.' + c for c in columns)})"
+        )
+
+    def _save_merge(self, conn, df: 'pd.DataFrame') -> int:
+        """Carga incremental: write_pandas em staging temporária e MERGE"""
+        from snowflake.connector.pandas_tools import write_pandas
+        if df.empty:
+            return 0
+        
+        staging_table = f"{self.table_name}_STAGING"
+        cursor = conn.cursor()
         try:
-            # Converte para formato relacional
-            records = [article.to_relational_dict() for article in articles]
-            df = pd.DataFrame(records)
-            
-            # Remove duplicatas pelo hash da URL
-            df = df.drop_duplicates(subset=['url_hash'], keep='last')
-            
-            # Converte colunas de data para formato compatível
-            date_columns = ['publicada', 'busca_feita']
-            for col in date_columns:
-                if col in df.columns:
-                    df[col] = pd.to_datetime(df[col], errors='coerce')
+            cursor.execute(self._create_table_sql())
+            self._ensure_columns(cursor)
+            cursor.execute(f"CREATE TEMPORARY TABLE IF NOT EXISTS {staging_table} LIKE {self.table_name}")
+            cursor.execute(f"TRUNCATE TABLE {staging_table}")
             
-            # Salva no Snowflake
             success, nchunks, nrows, _ = write_pandas(
                 conn=conn,
                 df=df,
-                table_name=self.table_name,
-                auto_create_table=True,
-                overwrite=True,
+                table_name=staging_table,
+                auto_create_table=False,
+                overwrite=False,
                 quote_identifiers=False
             )
-            
-            conn.close()
-            
-            if success:
-                logger.info(f"✅ Snowflake: {nrows} registros salvos na tabela '{self.table_name}'")
-                return nrows
-            else:
-                logger.error("❌ Erro ao salvar no Snowflake")
+            if not success:
+                logger.error("❌ Erro ao carregar staging no Snowflake")
                 return 0
-                
-        except Exception as e:
-            logger.error(f"❌ Erro ao salvar no Snowflake: {e}")
-            if conn:
-                conn.close()
-            raise
+            
+            cursor.execute(self._merge_sql(staging_table))
+            inserted, updated = cursor.fetchone()[:2]
+        finally:
+            cursor.close()
+        
+        logger.info(
+            f"✅ Snowflake: {inserted} inseridos, {updated} atualizados na tabela '{self.table_name}'"
+        )
+        return inserted + updated
 
     def find_by_url(self, url: str) -> Optional[NewsArticle]:
         """Busca artigo por URL"""
@@ -260,10 +599,14 @@ class SnowflakeRepository(INewsRepository):
             cursor.execute(f"SELECT COUNT(*) FROM {self.table_name}")
             count = cursor.fetchone()[0]
             cursor.close()
-            conn.close()
             return count
         except Exception as e:
             logger.error(f"Erro ao contar registros: {e}")
-            if conn:
-                conn.close()
             return 0
+
+    def close(self):
+        """Fecha a sessão reutilizada"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -2,22 +2,82 @@
 Serviços de negócio
 Implementa a lógica principal da aplicação
 """
+import bisect
+import hashlib
 import logging
-import random
+import os
+import re
 import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from urllib.parse import quote_plus
-from datetime import datetime, timedelta, timezone
-from typing import List, Dict, Any
-
-import feedparser
-from textblob import TextBlob
+from datetime import date, datetime, timedelta, timezone
+from typing import Callable, Iterable, Iterator, List, Dict, Any, Optional, Sequence, Tuple
 
+from src import metrics
+from src.fetchers import CircuitBreaker, FeedCache, FeedFetcher, HostRateLimiter, RetryPolicy
 from src.models import NewsArticle, SentimentAnalysis
-from src.repositories import INewsRepository
+from src.repositories import INewsRepository, MongoDBRepository
+from src.state import SeenArticleIndex, SentimentCache
 
 logger = logging.getLogger(__name__)
 
 
+class KeywordMatcher:
+    """
+    Contador de palavras-chave com uma única regex pré-compilada
+
+    Reproduz a semântica de `keyword in texto`: cada keyword conta no
+    máximo uma vez, inclusive quando aparece dentro de outra palavra
+    (ex.: 'valorização' dentro de 'desvalorização').
+    """
+
+    # Separador entre textos de um lote (não ocorre nas keywords)
+    SEPARATOR = '\x00'
+
+    def __init__(self, positive: Sequence[str], negative: Sequence[str]):
+        self.positive = frozenset(positive)
+        self.negative = frozenset(negative)
+        keywords = sorted(self.positive | self.negative, key=len, reverse=True)
+
+        # Lookahead permite casar em todas as posições (matches sobrepostos);
+        # em cada posição a alternação captura a keyword mais longa
+        self._pattern = re.compile(
+            '(?=(' + '|'.join(re.escape(k) for k in keywords) + '))'
+        )
+        # Keywords contidas em outra também estão presentes quando ela casa
+        self._implied = {
+            k: frozenset(other for other in keywords if other in k)
+            for k in keywords
+        }
+
+    def _counts(self, found: set) -> Tuple[int, int]:
+        return len(found & self.positive), len(found & self.negative)
+
+    def count(self, text_lower: str) -> Tuple[int, int]:
+        """Conta keywords (positivas, negativas) presentes no texto"""
+        found = set()
+        for match in self._pattern.finditer(text_lower):
+            found |= self._implied[match.group(1)]
+        return self._counts(found)
+
+    def count_many(self, texts_lower: Sequence[str]) -> List[Tuple[int, int]]:
+        """Conta keywords de vários textos com uma única varredura da regex"""
+        starts = []
+        offset = 0
+        for text in texts_lower:
+            starts.append(offset)
+            offset += len(text) + 1
+
+        found = [set() for _ in texts_lower]
+        joined = self.SEPARATOR.join(texts_lower)
+        for match in self._pattern.finditer(joined):
+            idx = bisect.bisect_right(starts, match.start()) - 1
+            found[idx] |= self._implied[match.group(1)]
+
+        return [self._counts(f) for f in found]
+
+
 class SentimentAnalysisService:
     """Serviço de análise de sentimento"""
     
@@ -35,6 +95,27 @@ class SentimentAnalysisService:
         'default', 'provisão', 'risco', 'pessimista', 'fraco', 'inadimplente'
     ]
     
+    # Tamanho padrão dos lotes em analyze_batch
+    BATCH_CHUNK_SIZE = 500
+    
+    # Incrementar ao mudar pesos/regras de cálculo (invalida o cache)
+    ANALYZER_VERSION = 2
+    
+    def __init__(self, cache: Optional[SentimentCache] = None):
+        # TextBlob só é carregado quando o serviço é criado
+        from textblob.sentiments import PatternAnalyzer
+        self._analyzer = PatternAnalyzer()
+        self._matcher = KeywordMatcher(self.POSITIVE_KEYWORDS, self.NEGATIVE_KEYWORDS)
+        self.cache = cache
+        # Versão efetiva inclui as listas de keywords
+        keywords = '|'.join(self.POSITIVE_KEYWORDS) + '#' + '|'.join(self.NEGATIVE_KEYWORDS)
+        self._version = f"{self.ANALYZER_VERSION}:{hashlib.md5(keywords.encode()).hexdigest()[:8]}"
+    
+    def cache_key(self, text: str, title: str = "") -> str:
+        """Chave de cache: hash de (versão do analisador, título, texto)"""
+        payload = f"{self._version}\x1f{title or ''}\x1f{text or ''}"
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+    
     def analyze(self, text: str, title: str = "") -> SentimentAnalysis:
         """
         Analisa sentimento de texto com contexto financeiro
@@ -47,28 +128,125 @@ class SentimentAnalysisService:
             SentimentAnalysis: Objeto com análise completa
         """
         if not text:
-            return SentimentAnalysis(
-                polarity=0.0,
-                subjectivity=0.0,
-                label='neutral',
-                confidence=0.0,
-                positive_keywords=0,
-                negative_keywords=0
-            )
+            return self._empty()
+        
+        if self.cache is not None:
+            key = self.cache_key(text, title)
+            cached = self.cache.get(key)
+            if cached is not None:
+                metrics.inc('sentiment_cache_hits_total')
+                return cached
+            metrics.inc('sentiment_cache_misses_total')
         
+        with metrics.timer('sentiment_analyze_seconds'):
+            sentiment = self._analyze_uncached(text, title)
+        
+        if self.cache is not None:
+            self.cache.put(key, sentiment)
+        return sentiment
+
+    def _analyze_uncached(self, text: str, title: str) -> SentimentAnalysis:
+        """Análise propriamente dita (TextBlob + keywords)"""
         # Combina título e texto para melhor contexto
         full_text = f"{title} {text}" if title else text
         
-        # Análise com TextBlob
-        blob = TextBlob(full_text)
-        base_polarity = blob.sentiment.polarity
-        subjectivity = blob.sentiment.subjectivity
+        # Análise com TextBlob (analisador pattern)
+        base_polarity, subjectivity = self._analyzer.analyze(full_text)
         
         # Conta keywords financeiras
-        text_lower = full_text.lower()
-        pos_count = sum(1 for word in self.POSITIVE_KEYWORDS if word in text_lower)
-        neg_count = sum(1 for word in self.NEGATIVE_KEYWORDS if word in text_lower)
+        pos_count, neg_count = self._matcher.count(full_text.lower())
+        
+        return self._build(base_polarity, subjectivity, pos_count, neg_count)
+    
+    def analyze_batch(
+        self,
+        texts: Sequence[str],
+        titles: Optional[Sequence[str]] = None,
+        chunk_size: Optional[int] = None
+    ) -> List[SentimentAnalysis]:
+        """
+        Analisa sentimento de vários textos de uma vez
+        
+        Mesma semântica de `analyze` para cada par (texto, título), mas a
+        contagem de keywords é feita com uma varredura da regex por lote.
+        
+        Args:
+            texts: Textos principais
+            titles: Títulos correspondentes (opcional)
+            chunk_size: Quantidade de artigos por lote
+            
+        Returns:
+            List[SentimentAnalysis]: Análises na mesma ordem dos textos
+        """
+        if titles is None:
+            titles = [""] * len(texts)
+        if len(titles) != len(texts):
+            raise ValueError("texts e titles devem ter o mesmo tamanho")
+        
+        chunk_size = chunk_size or self.BATCH_CHUNK_SIZE
+        results: List[Optional[SentimentAnalysis]] = [None] * len(texts)
+        
+        # Resolve pelo cache e deixa apenas os textos ainda não analisados
+        pending = []
+        hits = 0
+        for idx, (text, title) in enumerate(zip(texts, titles)):
+            if not text:
+                results[idx] = self._empty()
+                continue
+            if self.cache is not None:
+                cached = self.cache.get(self.cache_key(text, title))
+                if cached is not None:
+                    results[idx] = cached
+                    hits += 1
+                    continue
+            pending.append(idx)
+        if self.cache is not None:
+            # Mesmos contadores de `analyze`, incrementados uma vez por lote
+            metrics.inc('sentiment_cache_hits_total', hits)
+            metrics.inc('sentiment_cache_misses_total', len(pending))
+        
+        for start in range(0, len(pending), chunk_size):
+            chunk_started = time.perf_counter()
+            chunk_idx = pending[start:start + chunk_size]
+            chunk_texts = [texts[i] for i in chunk_idx]
+            chunk_titles = [titles[i] for i in chunk_idx]
+            
+            full_texts = [
+                f"{title} {text}" if title else text
+                for text, title in zip(chunk_texts, chunk_titles)
+            ]
+            keyword_counts = self._matcher.count_many([t.lower() for t in full_texts])
+            
+            for idx, full_text, (pos_count, neg_count) in zip(chunk_idx, full_texts, keyword_counts):
+                base_polarity, subjectivity = self._analyzer.analyze(full_text)
+                sentiment = self._build(base_polarity, subjectivity, pos_count, neg_count)
+                if self.cache is not None:
+                    self.cache.put(self.cache_key(texts[idx], titles[idx]), sentiment)
+                results[idx] = sentiment
+            metrics.observe('sentiment_batch_seconds', time.perf_counter() - chunk_started)
         
+        return results
+    
+    @staticmethod
+    def _empty() -> SentimentAnalysis:
+        """Análise neutra para textos vazios"""
+        return SentimentAnalysis(
+            polarity=0.0,
+            subjectivity=0.0,
+            label='neutral',
+            confidence=0.0,
+            positive_keywords=0,
+            negative_keywords=0
+        )
+    
+    @staticmethod
+    def _build(
+        base_polarity: float,
+        subjectivity: float,
+        pos_count: int,
+        neg_count: int
+    ) -> SentimentAnalysis:
+        """Combina polaridade do TextBlob com as keywords financeiras"""
         # Ajusta polaridade com keywords (peso 0.15 por keyword)
         keyword_adjustment = (pos_count - neg_count) * 0.15
         adjusted_polarity = base_polarity + keyword_adjustment
@@ -109,12 +287,133 @@ class NewsCollectorService:
         sentiment_service: SentimentAnalysisService,
         max_per_query: int = 100,
         max_years_back: int = 5,
-        sleep_between: float = 1.0
+        sleep_between: float = 1.0,
+        max_workers: int = 1,
+        rate_limit_burst: int = 1,
+        rate_limiter: Optional[HostRateLimiter] = None,
+        cache_dir: Optional[str] = None,
+        fetcher: Optional[FeedFetcher] = None,
+        seen_index: Optional[SeenArticleIndex] = None,
+        reuse_cached_feeds: bool = False,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        since: Optional[date] = None,
+        watermark_lookback_days: int = 7
     ):
         self.sentiment_service = sentiment_service
         self.max_per_query = max_per_query
         self.max_years_back = max_years_back
+        # Data mínima de publicação (além do limite de max_years_back)
+        self.since = since
         self.sleep_between = sleep_between
+        self.max_workers = max(1, max_workers)
+        # Limitador compartilhado entre threads: governa apenas requisições HTTP
+        self.rate_limiter = rate_limiter or HostRateLimiter(
+            min_interval=sleep_between,
+            burst=rate_limit_burst
+        )
+        self.fetcher = fetcher or FeedFetcher(
+            rate_limiter=self.rate_limiter,
+            cache=FeedCache(cache_dir) if cache_dir else None,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker
+        )
+        # Índice de artigos já persistidos (coleta incremental)
+        self.seen_index = seen_index
+        # Margem antes da marca d'água: o Google News ordena por relevância
+        # e indexa matérias com atraso; repetidas já saem pelo índice de URLs
+        self.watermark_lookback_days = watermark_lookback_days
+        # Em retomadas, um feed inalterado (304) é reprocessado a partir do
+        # cache local: a execução anterior pode ter parado antes de gravá-lo
+        self.reuse_cached_feeds = reuse_cached_feeds
+
+    def collect_all(
+        self,
+        queries: List[str],
+        on_articles: Optional[Callable[[List[NewsArticle]], None]] = None
+    ) -> List[NewsArticle]:
+        """
+        Coleta notícias de várias queries em paralelo
+
+        Os feeds são buscados concorrentemente (até `max_workers` threads);
+        o rate limiter por host continua valendo para todas as requisições.
+        Artigos repetidos entre queries são removidos por URL, preservando
+        a ordem das queries.
+
+        Args:
+            queries: Lista de strings de busca
+            on_articles: Callback chamado com os artigos novos de cada query
+                assim que ela termina (ex.: gravação incremental em NDJSON)
+
+        Returns:
+            List[NewsArticle]: Artigos únicos coletados
+        """
+        workers = min(self.max_workers, len(queries)) or 1
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='collector') as executor:
+            futures = [executor.submit(self.collect_from_query, query) for query in queries]
+
+            all_articles = []
+            seen_urls = set()
+            for query, future in zip(queries, futures):
+                try:
+                    articles = future.result()
+                except Exception as e:
+                    logger.error(f"❌ Erro ao coletar query '{query}': {e}")
+                    continue
+
+                # Remove duplicatas por URL
+                new_articles = []
+                for article in articles:
+                    if article.url not in seen_urls:
+                        seen_urls.add(article.url)
+                        new_articles.append(article)
+                all_articles.extend(new_articles)
+                if on_articles and new_articles:
+                    on_articles(new_articles)
+
+        return all_articles
+
+    def iter_query_results(self, queries: Iterable[str]) -> Iterator[Tuple[str, List[NewsArticle]]]:
+        """
+        Gera (query, artigos) à medida que cada query termina (ordem de conclusão)
+
+        Mantém no máximo `max_workers` queries em andamento: se o consumidor
+        do gerador parar de ler, novas buscas não são disparadas.
+        Queries que falharam não são geradas.
+        """
+        query_iter = iter(queries)
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='collector') as executor:
+            pending = {}
+            for query in query_iter:
+                pending[executor.submit(self.collect_from_query, query)] = query
+                if len(pending) >= self.max_workers:
+                    break
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    query = pending.pop(future)
+
+                    # Repõe a vaga antes de entregar os artigos ao consumidor
+                    next_query = next(query_iter, None)
+                    if next_query is not None:
+                        pending[executor.submit(self.collect_from_query, next_query)] = next_query
+
+                    try:
+                        articles = future.result()
+                    except Exception as e:
+                        logger.error(f"❌ Erro ao coletar query '{query}': {e}")
+                        continue
+                    yield query, articles
+
+    def iter_articles(self, queries: Iterable[str]) -> Iterator[NewsArticle]:
+        """
+        Gera artigos à medida que cada query termina
+
+        Não remove duplicatas entre queries (ver `src.pipeline.deduplicate`).
+        """
+        for _, articles in self.iter_query_results(queries):
+            yield from articles
 
     def collect_from_query(self, query: str) -> List[NewsArticle]:
         """
@@ -126,37 +425,117 @@ class NewsCollectorService:
         Returns:
             List[NewsArticle]: Lista de artigos coletados
         """
+        articles, _ = self._collect(query, count_cached=False)
+        return articles
+
+    def collect_with_feed_size(self, query: str) -> Tuple[List[NewsArticle], int]:
+        """
+        Coleta notícias de uma query e informa o tamanho do feed
+
+        Em 304 o tamanho vem do corpo em cache, parseado só neste caminho
+        (backfill); a coleta normal não parseia feeds inalterados.
+
+        Returns:
+            Tuple com os artigos coletados e o total de entradas do feed
+            (antes do corte por `max_per_query`); um feed igual ao limite
+            indica que a busca foi truncada pelo Google News
+        """
+        return self._collect(query, count_cached=True)
+
+    def _collect(self, query: str, count_cached: bool) -> Tuple[List[NewsArticle], int]:
+        """Busca e processa o feed da query (`count_cached`: conta o feed em cache no 304)"""
         logger.info(f"📰 Buscando: {query}")
         
         # Constrói URL do RSS
         feed_url = self._build_rss_url(query)
         
-        # Faz parse do feed
-        feed = feedparser.parse(feed_url)
+        # Faz parse do feed (None quando o servidor responde 304)
+        feed = self._fetch_feed(feed_url)
+        if feed is None:
+            logger.info(f"♻️  Feed inalterado desde a última coleta: {query}")
+            metrics.inc('feeds_not_modified_total')
+            return [], self._cached_feed_size(feed_url) if count_cached else 0
         
+        return self.process_feed(feed, query)
+
+    def process_feed(self, feed, query: str) -> Tuple[List[NewsArticle], int]:
+        """
+        Converte as entradas de um feed já parseado em artigos da query
+
+        Aplica corte por `max_per_query`, data mínima/marca d'água e índice
+        de artigos já persistidos. Usado também por fontes alternativas
+        (ver `src.sources`).
+
+        Returns:
+            Tuple com os artigos e o total de entradas do feed
+        """
         if getattr(feed, 'bozo', False):
+            # Resposta que não é feed (ex.: página de bloqueio) conta como falha
+            if not feed.get('entries'):
+                raise ValueError(f"Resposta inválida para '{query}': {feed.get('bozo_exception', 'Desconhecido')}")
             logger.warning(f"⚠️  Erro ao processar RSS: {feed.get('bozo_exception', 'Desconhecido')}")
         
+        feed_size = len(feed.get('entries', []))
         entries = feed.get('entries', [])[:self.max_per_query]
         articles = []
+        skipped = 0
         cutoff_date = datetime.now(timezone.utc) - timedelta(days=365 * self.max_years_back)
+        if self.since:
+            cutoff_date = max(cutoff_date, datetime(self.since.year, self.since.month, self.since.day, tzinfo=timezone.utc))
+        
+        # Publicações bem anteriores à marca d'água da query já foram coletadas
+        watermark = self.seen_index.get_watermark(query) if self.seen_index else None
+        if watermark:
+            cutoff_date = max(cutoff_date, watermark - timedelta(days=self.watermark_lookback_days))
         
         for entry in entries:
             # Verifica data de publicação
             pub_date = self._extract_publication_date(entry)
             if pub_date and pub_date < cutoff_date:
+                skipped += 1
+                continue
+            
+            # Ignora artigos já persistidos antes de extrair texto/sentimento
+            if self.seen_index and self.seen_index.contains(entry.get('link', '')):
+                skipped += 1
                 continue
             
             # Cria artigo
             article = self._create_article_from_entry(entry, query)
             if article:
                 articles.append(article)
-            
-            # Respeita rate limit
-            time.sleep(self.sleep_between + random.random() * 0.5)
         
-        logger.info(f"✅ Coletados {len(articles)} artigos para query: {query}")
-        return articles
+        metrics.inc('articles_collected_total', len(articles))
+        metrics.inc('articles_skipped_total', skipped)
+        logger.info(f"✅ Coletados {len(articles)} artigos para query: {query} ({skipped} já conhecidos/antigos)")
+        return articles, feed_size
+
+    def _fetch_feed(self, feed_url: str):
+        """
+        Baixa e faz parse do feed respeitando o rate limit do host
+
+        Returns:
+            Feed parseado, ou None se o feed não mudou desde a última busca
+        """
+        result = self.fetcher.fetch(feed_url)
+        if result.not_modified:
+            cached = None
+            if self.reuse_cached_feeds and self.fetcher.cache:
+                cached = self.fetcher.cache.get_body(feed_url)
+            if not cached:
+                return None
+            body = cached
+        else:
+            body = result.body
+        import feedparser
+        with metrics.timer('feed_parse_seconds'):
+            return feedparser.parse(body)
+
+    def _cached_feed_size(self, feed_url: str) -> int:
+        """Total de entradas da última versão do feed em cache (0 se ausente)"""
+        import feedparser
+        cached = self.fetcher.cache.get_body(feed_url) if self.fetcher.cache else None
+        return len(feedparser.parse(cached).get('entries', [])) if cached else 0
 
     def _build_rss_url(self, query: str) -> str:
         """Constrói URL do Google News RSS"""
@@ -241,25 +620,194 @@ class NewsCollectorService:
 class NewsPersistenceService:
     """Serviço de persistência de notícias"""
     
-    def __init__(self, repositories: List[INewsRepository]):
+    def __init__(
+        self,
+        repositories: List[INewsRepository],
+        concurrent: bool = True,
+        timeout: Optional[float] = None
+    ):
         self.repositories = repositories
+        self.concurrent = concurrent
+        self.timeout = timeout
+        # Detalhes da última chamada a save_all
+        self.last_errors: Dict[str, str] = {}
+        self.last_timings: Dict[str, float] = {}
+
+    @staticmethod
+    def _repo_name(repo: INewsRepository) -> str:
+        return repo.__class__.__name__.replace('Repository', '')
+
+    def _save_one(self, repo: INewsRepository, articles: List[NewsArticle]) -> int:
+        """Salva em um repositório registrando o tempo gasto"""
+        repo_name = self._repo_name(repo)
+        start = time.perf_counter()
+        try:
+            saved = repo.save(articles)
+        except Exception:
+            metrics.inc('repository_errors_total', repository=repo_name)
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            self.last_timings[repo_name] = round(elapsed, 3)
+            metrics.observe('repository_save_seconds', elapsed, repository=repo_name)
+        metrics.inc('articles_saved_total', saved, repository=repo_name)
+        return saved
 
     def save_all(self, articles: List[NewsArticle]) -> Dict[str, int]:
         """
         Salva artigos em todos os repositórios configurados
         
+        No modo concorrente cada repositório roda em sua própria thread,
+        com tempo limite (`timeout`) contado a partir do início da chamada.
+        Erros e tempos por destino ficam em `last_errors` e `last_timings`.
+        
         Returns:
             Dict com nome do repositório e quantidade salva
         """
-        results = {}
+        self.last_errors = {}
+        self.last_timings = {}
         
-        for repo in self.repositories:
-            repo_name = repo.__class__.__name__.replace('Repository', '')
-            try:
-                count = repo.save(articles)
-                results[repo_name] = count
-            except Exception as e:
-                logger.error(f"❌ Erro ao salvar em {repo_name}: {e}")
-                results[repo_name] = 0
+        if not self.concurrent or len(self.repositories) <= 1:
+            results = {}
+            for repo in self.repositories:
+                repo_name = self._repo_name(repo)
+                try:
+                    results[repo_name] = self._save_one(repo, articles)
+                except Exception as e:
+                    logger.error(f"❌ Erro ao salvar em {repo_name}: {e}")
+                    self.last_errors[repo_name] = str(e)
+                    results[repo_name] = 0
+            return results
+        
+        results = {}
+        executor = ThreadPoolExecutor(
+            max_workers=len(self.repositories),
+            thread_name_prefix='persistence'
+        )
+        try:
+            futures = {
+                self._repo_name(repo): executor.submit(self._save_one, repo, articles)
+                for repo in self.repositories
+            }
+            deadline = time.monotonic() + self.timeout if self.timeout else None
+            
+            for repo_name, future in futures.items():
+                remaining = max(0.0, deadline - time.monotonic()) if deadline else None
+                try:
+                    results[repo_name] = future.result(timeout=remaining)
+                except FuturesTimeoutError:
+                    logger.error(f"⏱️  Tempo limite ({self.timeout}s) excedido ao salvar em {repo_name}")
+                    self.last_errors[repo_name] = f"timeout após {self.timeout}s"
+                    results[repo_name] = 0
+                except Exception as e:
+                    logger.error(f"❌ Erro ao salvar em {repo_name}: {e}")
+                    self.last_errors[repo_name] = str(e)
+                    results[repo_name] = 0
+        finally:
+            # Não bloqueia em destinos que estouraram o tempo limite
+            executor.shutdown(wait=False, cancel_futures=True)
         
         return results
+
+
+# Instância por processo usada pelos workers do re-score
+_worker_sentiment_service: Optional[SentimentAnalysisService] = None
+
+
+def _rescore_chunk(chunk: List[Tuple[str, str, str]]) -> List[Tuple[str, Dict[str, Any]]]:
+    """Recalcula sentimentos de um lote (url, texto, título) em um processo worker"""
+    global _worker_sentiment_service
+    if _worker_sentiment_service is None:
+        _worker_sentiment_service = SentimentAnalysisService()
+
+    urls = [url for url, _, _ in chunk]
+    texts = [text for _, text, _ in chunk]
+    titles = [title for _, _, title in chunk]
+    results = _worker_sentiment_service.analyze_batch(texts, titles)
+    return [(url, sentiment.to_dict()) for url, sentiment in zip(urls, results)]
+
+
+class SentimentRescoringService:
+    """
+    Serviço de re-score histórico dos sentimentos armazenados no MongoDB
+
+    Lê a coleção em streaming, distribui lotes entre processos
+    (ProcessPoolExecutor) e grava os novos `sentimentos` com bulk_write.
+    Como o texto completo não é persistido, o re-score usa `resumo`
+    (ou o título, quando não há resumo) junto com `titulo_noticia`.
+    """
+
+    PROJECTION = {'_id': 0, 'url': 1, 'titulo_noticia': 1, 'resumo': 1}
+
+    def __init__(
+        self,
+        repository: MongoDBRepository,
+        workers: Optional[int] = None,
+        chunk_size: int = 500,
+        dry_run: bool = False
+    ):
+        self.repository = repository
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.dry_run = dry_run
+
+    def _iter_chunks(self):
+        """Agrupa documentos da coleção em lotes (url, texto, título)"""
+        chunk = []
+        for doc in self.repository.iter_documents(self.PROJECTION, batch_size=self.chunk_size):
+            url = doc.get('url')
+            if not url:
+                continue
+            title = doc.get('titulo_noticia', '') or ''
+            text = doc.get('resumo', '') or title
+            chunk.append((url, text, title))
+            if len(chunk) >= self.chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def run(self) -> Dict[str, float]:
+        """
+        Executa o re-score completo
+
+        Returns:
+            Dict com artigos processados, atualizados, tempo e artigos/segundo
+        """
+        logger.info(f"🔁 Re-score de sentimentos com {self.workers} processos (lotes de {self.chunk_size})")
+        start = time.perf_counter()
+        processed = 0
+        updated = 0
+        # Limita lotes em voo para manter memória constante
+        max_pending = self.workers * 2
+
+        def handle(future):
+            nonlocal processed, updated
+            results = future.result()
+            processed += len(results)
+            if not self.dry_run:
+                updated += self.repository.update_sentiments(results)
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            pending = set()
+            for chunk in self._iter_chunks():
+                pending.add(executor.submit(_rescore_chunk, chunk))
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        handle(future)
+            for future in pending:
+                handle(future)
+
+        elapsed = time.perf_counter() - start
+        rate = processed / elapsed if elapsed > 0 else 0.0
+        logger.info(
+            f"✅ Re-score concluído: {processed} artigos, {updated} atualizados "
+            f"em {elapsed:.1f}s ({rate:.0f} artigos/s)"
+        )
+        return {
+            'processed': processed,
+            'updated': updated,
+            'elapsed_seconds': round(elapsed, 3),
+            'articles_per_second': round(rate, 1)
+        }
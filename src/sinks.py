@@ -0,0 +1,158 @@
+"""
+Arquivo local de artigos em NDJSON (um JSON por linha)
+Escrita incremental em modo append e leitura em streaming
+"""
+import gzip
+import io
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, IO, Iterable, Iterator
+
+from src.models import NewsArticle
+
+logger = logging.getLogger(__name__)
+
+
+def _open_text(path: Path, mode: str) -> IO[str]:
+    """
+    Abre arquivo texto com compressão definida pela extensão
+    (.gz → gzip, .zst → zstandard, demais → sem compressão)
+    """
+    if path.suffix == '.gz':
+        return gzip.open(path, mode + 't', encoding='utf-8')
+    if path.suffix == '.zst':
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImportError("zstandard é necessário para arquivos .zst (pip install zstandard)") from e
+        if mode == 'a':
+            # Cada abertura em append grava um novo frame zstd
+            raw = zstandard.ZstdCompressor().stream_writer(open(path, 'ab'), closefd=True)
+        else:
+            raw = zstandard.ZstdDecompressor().stream_reader(
+                open(path, 'rb'), read_across_frames=True, closefd=True
+            )
+        return io.TextIOWrapper(raw, encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+
+def _is_legacy_array(path: Path) -> bool:
+    """Verifica se o arquivo existente é uma lista JSON (formato antigo)"""
+    if not path.exists() or path.stat().st_size == 0:
+        return False
+    with _open_text(path, 'r') as f:
+        return f.read(4096).lstrip().startswith('[')
+
+
+def _migrate_legacy_array(path: Path) -> int:
+    """
+    Converte um arquivo no formato antigo (lista JSON) para NDJSON
+
+    Grava em arquivo temporário (mesma compressão) e substitui o original
+    com `os.replace`, sem janela em que o arquivo fique incompleto.
+
+    Returns:
+        int: Quantidade de artigos convertidos
+    """
+    with _open_text(path, 'r') as f:
+        try:
+            articles = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(
+                f"{path} começa como lista JSON (formato antigo), mas não é um JSON válido "
+                f"({e}); corrija ou mova o arquivo antes de gravar NDJSON nele"
+            ) from e
+
+    tmp = path.with_name(f"{path.stem}.tmp{path.suffix}")
+    with _open_text(tmp, 'w') as f:
+        for article in articles:
+            f.write(json.dumps(article, ensure_ascii=False) + '\n')
+    os.replace(tmp, path)
+    logger.info(f"🔄 {path}: {len(articles)} artigos convertidos de lista JSON para NDJSON")
+    return len(articles)
+
+
+class NDJSONSink:
+    """
+    Grava artigos em NDJSON à medida que são produzidos
+
+    O arquivo é aberto em modo append: execuções anteriores são
+    preservadas. Um arquivo no formato antigo (lista JSON, ex.:
+    OUTPUT_JSON=...json de .env antigos) é convertido para NDJSON antes,
+    já que linhas acrescentadas a ele o tornariam ilegível.
+    Seguro para uso por várias threads.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if _is_legacy_array(self.path):
+            _migrate_legacy_array(self.path)
+        self.written = 0
+        self._lock = threading.Lock()
+        self._file = _open_text(self.path, 'a')
+
+    def write(self, article: NewsArticle):
+        """Grava um artigo"""
+        self.write_many([article])
+
+    def write_many(self, articles: Iterable[NewsArticle]):
+        """Grava vários artigos (uma linha por artigo)"""
+        lines = ''.join(
+            json.dumps(article.to_dict(), ensure_ascii=False) + '\n'
+            for article in articles
+        )
+        if not lines:
+            return
+        with self._lock:
+            self._file.write(lines)
+            self.written += lines.count('\n')
+
+    def flush(self):
+        """Força gravação do buffer em disco"""
+        with self._lock:
+            self._file.flush()
+
+    def close(self):
+        """Fecha o arquivo"""
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+        logger.info(f"✅ NDJSON: {self.written} artigos gravados em {self.path}")
+
+    def __enter__(self) -> 'NDJSONSink':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def iter_article_dicts(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Lê artigos do arquivo local em streaming (um dict por artigo)
+
+    Aceita NDJSON (comprimido ou não) e, por compatibilidade, o formato
+    antigo com uma única lista JSON.
+    """
+    path = Path(path)
+    with _open_text(path, 'r') as f:
+        first_line = f.readline()
+        if first_line.lstrip().startswith('['):
+            # Formato legado: documento JSON único
+            yield from json.loads(first_line + f.read())
+            return
+
+        if first_line.strip():
+            yield json.loads(first_line)
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def iter_articles(path: str) -> Iterator[NewsArticle]:
+    """Lê o arquivo local em streaming como NewsArticle"""
+    for data in iter_article_dicts(path):
+        yield NewsArticle.from_dict(data)
@@ -0,0 +1,248 @@
+"""
+Fontes de notícias plugáveis
+Google News RSS, feeds RSS/Atom arbitrários e diretório local de feeds
+gravados, buscados juntos por um único cliente HTTP assíncrono
+"""
+import asyncio
+import logging
+import queue
+import re
+import threading
+import unicodedata
+from abc import ABC, abstractmethod
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+from urllib.parse import quote_plus
+
+from src import metrics
+from src.fetchers import AsyncFeedClient, FetchResult
+from src.models import NewsArticle
+from src.services import NewsCollectorService
+
+logger = logging.getLogger(__name__)
+
+# Marca de fim das buscas na fila de resultados
+_END = object()
+
+
+@dataclass(frozen=True)
+class FeedRequest:
+    """Um feed a buscar e a query (ou nome da fonte) dos seus artigos"""
+    key: str
+    url: str
+    source: str
+
+
+class NewsSource(ABC):
+    """Interface de fonte de notícias"""
+
+    name: str = 'source'
+
+    @abstractmethod
+    def requests(self, queries: Sequence[str]) -> List[FeedRequest]:
+        """Feeds a buscar para as queries"""
+        pass
+
+
+class GoogleNewsSource(NewsSource):
+    """Busca do Google News RSS (um feed por query)"""
+
+    name = 'google_news'
+
+    def __init__(self, hl: str = 'pt-BR', gl: str = 'BR', ceid: str = 'BR:pt-419'):
+        self.hl = hl
+        self.gl = gl
+        self.ceid = ceid
+
+    def feed_url(self, query: str) -> str:
+        """URL do feed de busca"""
+        return f"https://news.google.com/rss/search?q={quote_plus(query)}&hl={self.hl}&gl={self.gl}&ceid={self.ceid}"
+
+    def requests(self, queries: Sequence[str]) -> List[FeedRequest]:
+        return [FeedRequest(query, self.feed_url(query), self.name) for query in queries]
+
+
+class RSSFeedSource(NewsSource):
+    """
+    Feeds RSS/Atom fixos (ex.: RI do banco, portais de economia)
+
+    Os feeds não dependem das queries; os artigos de cada feed ficam
+    associados ao nome do feed.
+    """
+
+    name = 'rss'
+
+    def __init__(self, feeds: Dict[str, str]):
+        self.feeds = feeds
+
+    def requests(self, queries: Sequence[str]) -> List[FeedRequest]:
+        return [FeedRequest(label, url, self.name) for label, url in self.feeds.items()]
+
+
+def slugify(text: str) -> str:
+    """Nome de arquivo seguro para uma query ("BBAS3 B3" → "bbas3-b3")"""
+    ascii_text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode()
+    return re.sub(r'[^a-z0-9]+', '-', ascii_text.lower()).strip('-')
+
+
+class LocalFeedDirectorySource(NewsSource):
+    """
+    Diretório com feeds XML gravados (`<slug da query>.xml`)
+
+    Permite rodar a coleta completa sem rede, a partir de respostas
+    gravadas anteriormente.
+    """
+
+    name = 'local'
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+
+    def requests(self, queries: Sequence[str]) -> List[FeedRequest]:
+        requests = []
+        for query in queries:
+            path = self.directory / f"{slugify(query)}.xml"
+            if path.exists():
+                requests.append(FeedRequest(query, path.resolve().as_uri(), self.name))
+        return requests
+
+
+def parse_feed_map(value: str) -> Dict[str, str]:
+    """Converte "nome=url,nome2=url2" em dicionário"""
+    feeds = {}
+    for item in value.split(','):
+        if '=' in item:
+            label, url = item.split('=', 1)
+            feeds[label.strip()] = url.strip()
+    return feeds
+
+
+def build_sources(
+    names: Iterable[str],
+    rss_feeds: str = '',
+    local_dir: str = ''
+) -> List[NewsSource]:
+    """Instancia as fontes pelos nomes configurados (NEWS_SOURCES)"""
+    sources: List[NewsSource] = []
+    for name in names:
+        name = name.strip()
+        if name == GoogleNewsSource.name:
+            sources.append(GoogleNewsSource())
+        elif name == RSSFeedSource.name:
+            sources.append(RSSFeedSource(parse_feed_map(rss_feeds)))
+        elif name == LocalFeedDirectorySource.name:
+            sources.append(LocalFeedDirectorySource(local_dir))
+        elif name:
+            raise ValueError(f"Fonte de notícias desconhecida: {name}")
+    return sources
+
+
+class MultiSourceCollector:
+    """
+    Coleta de várias fontes com um único cliente HTTP assíncrono
+
+    Todos os feeds de todas as fontes são buscados concorrentemente num
+    event loop em thread própria; o parse e a análise de sentimento são
+    feitos pelo `NewsCollectorService` na thread consumidora à medida que
+    as respostas chegam. Compatível com `StreamingPipeline`.
+    """
+
+    def __init__(
+        self,
+        collector: NewsCollectorService,
+        sources: Sequence[NewsSource],
+        client: Optional[AsyncFeedClient] = None
+    ):
+        self.collector = collector
+        self.sources = list(sources)
+        self.client = client or AsyncFeedClient(
+            cache=collector.fetcher.cache,
+            retry_policy=collector.fetcher.retry_policy,
+            min_interval=collector.sleep_between
+        )
+
+    async def _fetch_all(self, requests: List[FeedRequest], results: "queue.Queue"):
+        async with self.client as client:
+            async def fetch(request: FeedRequest):
+                try:
+                    results.put((request, await client.fetch(request.url)))
+                except Exception as e:
+                    results.put((request, e))
+
+            await asyncio.gather(*(fetch(request) for request in requests))
+
+    def _run_loop(self, requests: List[FeedRequest], results: "queue.Queue"):
+        try:
+            asyncio.run(self._fetch_all(requests, results))
+        except Exception as e:
+            results.put((None, e))
+        finally:
+            results.put(_END)
+
+    def _articles_from(self, request: FeedRequest, result: FetchResult) -> List[NewsArticle]:
+        """Converte uma resposta em artigos (304 usa o cache só em retomadas)"""
+        body = result.body
+        if result.not_modified:
+            cache = self.client.cache
+            body = cache.get_body(request.url) if cache and self.collector.reuse_cached_feeds else None
+            if not body:
+                logger.info(f"♻️  Feed inalterado desde a última coleta: {request.key}")
+                return []
+        import feedparser
+        with metrics.timer('feed_parse_seconds'):
+            feed = feedparser.parse(body)
+        articles, _ = self.collector.process_feed(feed, request.key)
+        return articles
+
+    def iter_query_results(self, queries: Iterable[str]) -> Iterator[Tuple[Optional[str], List[NewsArticle]]]:
+        """
+        Gera artigos de cada feed assim que ele chega
+
+        Gera (query, artigos) quando o último feed da query termina e
+        (None, artigos) para feeds intermediários. Feeds fixos (fonte `rss`)
+        não são queries: saem sempre como (None, artigos), para que o
+        checkpoint registre apenas queries concluídas.
+        """
+        queries = list(queries)
+        query_keys = set(queries)
+        requests = [request for source in self.sources for request in source.requests(queries)]
+        remaining = Counter(request.key for request in requests)
+        failed: Set[str] = set()
+        logger.info(f"🌐 {len(requests)} feeds de {len(self.sources)} fontes")
+
+        results: "queue.Queue" = queue.Queue()
+        fetcher = threading.Thread(
+            target=self._run_loop, args=(requests, results), name='feed-client', daemon=True
+        )
+        fetcher.start()
+
+        while True:
+            item = results.get()
+            if item is _END:
+                break
+            request, outcome = item
+            if request is None:
+                raise outcome
+
+            remaining[request.key] -= 1
+            articles: List[NewsArticle] = []
+            try:
+                if isinstance(outcome, Exception):
+                    raise outcome
+                logger.info(f"📰 {request.source}: {request.key}")
+                articles = self._articles_from(request, outcome)
+            except Exception as e:
+                logger.error(f"❌ Erro ao coletar '{request.key}' ({request.source}): {e}")
+                failed.add(request.key)
+
+            finished = (
+                request.key in query_keys
+                and remaining[request.key] == 0
+                and request.key not in failed
+            )
+            yield (request.key if finished else None), articles
+
+        fetcher.join()
+        logger.info(f"🌐 Requisições HTTP: {self.client.requests} ({self.client.retries} repetições)")
@@ -0,0 +1,314 @@
+"""
+Estado persistente entre execuções da coleta
+Índice local de URLs já persistidas, marca d'água de publicação por query,
+checkpoint de execuções longas e cache de análises de sentimento
+"""
+import json
+import logging
+import os
+import sqlite3
+import threading
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from src.models import NewsArticle, SentimentAnalysis, generate_url_hash
+
+logger = logging.getLogger(__name__)
+
+
+class SeenArticleIndex:
+    """
+    Índice SQLite dos artigos já coletados e persistidos
+
+    Guarda o `url_hash` de cada artigo e, por query, a data de publicação
+    mais recente já vista (high-water mark). O coletor consulta o índice
+    antes de extrair texto ou analisar sentimento.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        if path != ':memory:':
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS seen_urls ("
+            "url_hash TEXT PRIMARY KEY, first_seen TEXT NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS query_watermarks ("
+            "query TEXT PRIMARY KEY, last_published TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    def contains(self, url: str) -> bool:
+        """Verifica se a URL já foi persistida"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM seen_urls WHERE url_hash = ?",
+                (generate_url_hash(url),)
+            ).fetchone()
+        return row is not None
+
+    def get_watermark(self, query: str) -> Optional[datetime]:
+        """Retorna a publicação mais recente já coletada para a query"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT last_published FROM query_watermarks WHERE query = ?",
+                (query,)
+            ).fetchone()
+        return datetime.fromisoformat(row[0]) if row else None
+
+    def mark_collected(self, articles: Iterable[NewsArticle]) -> int:
+        """
+        Registra artigos persistidos e avança a marca d'água de cada query
+
+        Returns:
+            int: Quantidade de URLs novas no índice
+        """
+        now = datetime.now().isoformat()
+        hashes: List[tuple] = []
+        watermarks: Dict[str, datetime] = {}
+
+        for article in articles:
+            hashes.append((generate_url_hash(article.url), now))
+            if article.publicada:
+                try:
+                    published = datetime.fromisoformat(article.publicada)
+                except ValueError:
+                    continue
+                current = watermarks.get(article.query)
+                if current is None or published > current:
+                    watermarks[article.query] = published
+
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO seen_urls (url_hash, first_seen) VALUES (?, ?)",
+                hashes
+            )
+            added = self._conn.total_changes - before
+            self._conn.executemany(
+                "INSERT INTO query_watermarks (query, last_published) VALUES (?, ?) "
+                "ON CONFLICT(query) DO UPDATE SET last_published = excluded.last_published "
+                "WHERE excluded.last_published > query_watermarks.last_published",
+                [(query, dt.isoformat()) for query, dt in watermarks.items()]
+            )
+            self._conn.commit()
+
+        logger.info(f"🗂️  Índice local: {added} URLs novas registradas")
+        return added
+
+    def count(self) -> int:
+        """Total de URLs no índice"""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM seen_urls").fetchone()[0]
+
+    def close(self):
+        """Fecha conexão"""
+        with self._lock:
+            self._conn.close()
+
+
+class CollectionCheckpoint:
+    """
+    Checkpoint JSON de uma execução de coleta
+
+    Registra as queries concluídas (todos os artigos já gravados), a
+    publicação mais recente gravada por query e os ids dos lotes gravados.
+    Cada atualização reescreve o arquivo de forma atômica, então uma
+    execução interrompida pode ser retomada a partir do último lote.
+    """
+
+    def __init__(self, path: str, resume: bool = False):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+        if resume and self.path.exists():
+            self.state = json.loads(self.path.read_text(encoding='utf-8'))
+            logger.info(
+                f"⏯️  Retomando execução {self.state['run_id']}: "
+                f"{len(self.state['completed_queries'])} queries concluídas, "
+                f"{len(self.state['flushed_batches'])} lotes gravados"
+            )
+        else:
+            now = datetime.now().isoformat()
+            self.state = {
+                'run_id': uuid.uuid4().hex[:12],
+                'started_at': now,
+                'updated_at': now,
+                'finished': False,
+                'batch_seq': 0,
+                'completed_queries': [],
+                'last_published': {},
+                'flushed_batches': [],
+            }
+            self._save()
+
+    @property
+    def run_id(self) -> str:
+        return self.state['run_id']
+
+    @property
+    def finished(self) -> bool:
+        return self.state['finished']
+
+    def is_completed(self, query: str) -> bool:
+        """Verifica se todos os artigos da query já foram gravados"""
+        return query in self.state['completed_queries']
+
+    def pending(self, queries: Iterable[str]) -> List[str]:
+        """Queries ainda não concluídas, na ordem original"""
+        completed = set(self.state['completed_queries'])
+        return [query for query in queries if query not in completed]
+
+    def next_batch_id(self) -> str:
+        """Reserva o id do próximo lote (único entre retomadas)"""
+        with self._lock:
+            self.state['batch_seq'] += 1
+            return f"{self.run_id}-{self.state['batch_seq']:06d}"
+
+    def record_batch(
+        self,
+        batch_id: Optional[str],
+        articles: Iterable[NewsArticle],
+        completed_queries: Iterable[str] = ()
+    ):
+        """
+        Registra um lote gravado e as queries que ele concluiu
+
+        `batch_id` é None quando o lote só conclui queries (sem artigos).
+        """
+        with self._lock:
+            last_published = self.state['last_published']
+            for article in articles:
+                if not article.publicada:
+                    continue
+                current = last_published.get(article.query)
+                try:
+                    published = datetime.fromisoformat(article.publicada)
+                    if current is None or published > datetime.fromisoformat(current):
+                        last_published[article.query] = published.isoformat()
+                except (TypeError, ValueError):
+                    continue
+
+            if batch_id:
+                self.state['flushed_batches'].append(batch_id)
+            for query in completed_queries:
+                if query not in self.state['completed_queries']:
+                    self.state['completed_queries'].append(query)
+            self._save()
+
+    def finish(self):
+        """Marca a execução como concluída"""
+        with self._lock:
+            self.state['finished'] = True
+            self._save()
+
+    def _save(self):
+        self.state['updated_at'] = datetime.now().isoformat()
+        tmp = self.path.with_suffix(self.path.suffix + '.tmp')
+        tmp.write_text(json.dumps(self.state, ensure_ascii=False, indent=2), encoding='utf-8')
+        os.replace(tmp, self.path)
+
+
+class SentimentCache:
+    """
+    Cache de análises de sentimento indexado por hash do conteúdo
+
+    LRU em memória limitado a `max_size` entradas, opcionalmente apoiado
+    por uma tabela SQLite para reaproveitar resultados entre execuções.
+    A chave (calculada pelo serviço) inclui a versão do analisador.
+    """
+
+    # Escritas pendentes antes de um commit no SQLite
+    FLUSH_EVERY = 200
+
+    def __init__(self, max_size: int = 10000, path: Optional[str] = None):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, SentimentAnalysis]" = OrderedDict()
+        self._pending: List[tuple] = []
+        self._lock = threading.Lock()
+        self._conn = None
+
+        if path:
+            if path != ':memory:':
+                Path(path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS sentiment_cache ("
+                "key TEXT PRIMARY KEY, data TEXT NOT NULL)"
+            )
+            self._conn.commit()
+
+    def get(self, key: str) -> Optional[SentimentAnalysis]:
+        """Busca análise no LRU e, se ausente, no SQLite"""
+        with self._lock:
+            sentiment = self._entries.get(key)
+            if sentiment is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return sentiment
+
+            if self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT data FROM sentiment_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row:
+                    sentiment = SentimentAnalysis.from_dict(json.loads(row[0]))
+                    self._remember(key, sentiment)
+                    self.hits += 1
+                    return sentiment
+
+            self.misses += 1
+            return None
+
+    def put(self, key: str, sentiment: SentimentAnalysis):
+        """Armazena análise no LRU e agenda gravação no SQLite"""
+        with self._lock:
+            self._remember(key, sentiment)
+            if self._conn is not None:
+                self._pending.append((key, json.dumps(sentiment.to_dict())))
+                if len(self._pending) >= self.FLUSH_EVERY:
+                    self._flush()
+
+    def _remember(self, key: str, sentiment: SentimentAnalysis):
+        self._entries[key] = sentiment
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def _flush(self):
+        if self._pending:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO sentiment_cache (key, data) VALUES (?, ?)",
+                self._pending
+            )
+            self._conn.commit()
+            self._pending = []
+
+    def stats(self) -> Dict[str, float]:
+        """Contadores de acerto/erro do cache"""
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / total, 4) if total else 0.0,
+            'size': len(self._entries)
+        }
+
+    def close(self):
+        """Grava escritas pendentes e fecha o SQLite"""
+        with self._lock:
+            if self._conn is not None:
+                self._flush()
+                self._conn.close()
+                self._conn = None
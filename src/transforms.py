@@ -0,0 +1,274 @@
+"""
+Transformações SQL no Snowflake (modelo dimensional)
+Tabelas fato/dimensão e views analíticas de cotações e notícias, executadas
+na sessão Snowflake compartilhada do contexto
+"""
+import logging
+from typing import Dict, List, Tuple
+
+from src.context import PipelineContext
+
+logger = logging.getLogger(__name__)
+
+# (objeto criado, SQL)
+Transform = Tuple[str, str]
+
+# Cotações: lê BBAS3_DADOS_REAIS_API (ver `src.prices`)
+PRICE_TRANSFORMS: List[Transform] = [
+    ('FATO_ACOES_REAL', """
+CREATE OR REPLACE TABLE FATO_ACOES_REAL AS
+SELECT 
+    TO_DATE("Data") as DATA_NEGOCIACAO,
+    "Abertura" as PRECO_ABERTURA,
+    "Maxima" as PRECO_MAXIMO,
+    "Minima" as PRECO_MINIMO,
+    "Fechamento" as PRECO_FECHAMENTO,
+    "Volume" as VOLUME,
+    "Variacao_Percentual" as VARIACAO_PERCENTUAL
+FROM BBAS3_DADOS_REAIS_API
+WHERE "Data" IS NOT NULL
+ORDER BY "Data";
+"""),
+    ('DIM_TEMPO_REAL', """
+CREATE OR REPLACE TABLE DIM_TEMPO_REAL AS
+SELECT DISTINCT
+    TO_DATE("Data") as DATA,
+    YEAR(TO_DATE("Data")) as ANO,
+    QUARTER(TO_DATE("Data")) as TRIMESTRE,
+    MONTH(TO_DATE("Data")) as MES,
+    MONTHNAME(TO_DATE("Data")) as NOME_MES,
+    DAY(TO_DATE("Data")) as DIA,
+    DAYNAME(TO_DATE("Data")) as DIA_SEMANA,
+    WEEK(TO_DATE("Data")) as SEMANA_ANO
+FROM BBAS3_DADOS_REAIS_API
+WHERE "Data" IS NOT NULL;
+"""),
+    ('VW_RESUMO_MENSAL_REAL', """
+CREATE OR REPLACE VIEW VW_RESUMO_MENSAL_REAL AS
+SELECT 
+    t.ANO,
+    t.MES,
+    t.NOME_MES,
+    ROUND(AVG(f.PRECO_FECHAMENTO), 2) as PRECO_MEDIO,
+    ROUND(MAX(f.PRECO_MAXIMO), 2) as PRECO_MAX,
+    ROUND(MIN(f.PRECO_MINIMO), 2) as PRECO_MIN,
+    SUM(f.VOLUME) as VOLUME_TOTAL,
+    ROUND(AVG(f.VARIACAO_PERCENTUAL), 2) as VARIACAO_MEDIA,
+    COUNT(*) as DIAS_NEGOCIADOS
+FROM FATO_ACOES_REAL f
+JOIN DIM_TEMPO_REAL t ON f.DATA_NEGOCIACAO = t.DATA
+GROUP BY t.ANO, t.MES, t.NOME_MES
+ORDER BY t.ANO, t.MES;
+"""),
+    ('VW_ANALISE_ANUAL_REAL', """
+CREATE OR REPLACE VIEW VW_ANALISE_ANUAL_REAL AS
+SELECT 
+    t.ANO,
+    ROUND(AVG(f.PRECO_FECHAMENTO), 2) as PRECO_MEDIO_ANO,
+    ROUND(MAX(f.PRECO_MAXIMO), 2) as PRECO_MAXIMO_ANO,
+    ROUND(MIN(f.PRECO_MINIMO), 2) as PRECO_MINIMO_ANO,
+    ROUND(MAX(f.VARIACAO_PERCENTUAL), 2) as MAIOR_ALTA,
+    ROUND(MIN(f.VARIACAO_PERCENTUAL), 2) as MAIOR_QUEDA,
+    ROUND(AVG(f.VARIACAO_PERCENTUAL), 2) as VARIACAO_MEDIA,
+    ROUND(STDDEV(f.VARIACAO_PERCENTUAL), 2) as VOLATILIDADE,
+    SUM(f.VOLUME) as VOLUME_TOTAL_ANO,
+    COUNT(*) as DIAS_NEGOCIADOS
+FROM FATO_ACOES_REAL f
+JOIN DIM_TEMPO_REAL t ON f.DATA_NEGOCIACAO = t.DATA
+GROUP BY t.ANO
+ORDER BY t.ANO;
+"""),
+    ('VW_INDICADORES_TECNICOS', """
+CREATE OR REPLACE VIEW VW_INDICADORES_TECNICOS AS
+SELECT 
+    DATA_NEGOCIACAO,
+    PRECO_FECHAMENTO,
+    VARIACAO_PERCENTUAL,
+    VOLUME,
+    -- Médias Móveis
+    ROUND(AVG(PRECO_FECHAMENTO) OVER (
+        ORDER BY DATA_NEGOCIACAO 
+        ROWS BETWEEN 7 PRECEDING AND CURRENT ROW
+    ), 2) as MEDIA_MOVEL_7D,
+    ROUND(AVG(PRECO_FECHAMENTO) OVER (
+        ORDER BY DATA_NEGOCIACAO 
+        ROWS BETWEEN 20 PRECEDING AND CURRENT ROW
+    ), 2) as MEDIA_MOVEL_20D,
+    ROUND(AVG(PRECO_FECHAMENTO) OVER (
+        ORDER BY DATA_NEGOCIACAO 
+        ROWS BETWEEN 50 PRECEDING AND CURRENT ROW
+    ), 2) as MEDIA_MOVEL_50D,
+    ROUND(AVG(PRECO_FECHAMENTO) OVER (
+        ORDER BY DATA_NEGOCIACAO 
+        ROWS BETWEEN 200 PRECEDING AND CURRENT ROW
+    ), 2) as MEDIA_MOVEL_200D,
+    -- Volatilidade
+    ROUND(STDDEV(VARIACAO_PERCENTUAL) OVER (
+        ORDER BY DATA_NEGOCIACAO 
+        ROWS BETWEEN 30 PRECEDING AND CURRENT ROW
+    ), 2) as VOLATILIDADE_30D,
+    -- Retorno acumulado
+    ROUND(((PRECO_FECHAMENTO / FIRST_VALUE(PRECO_FECHAMENTO) OVER (ORDER BY DATA_NEGOCIACAO)) - 1) * 100, 2) as RETORNO_ACUMULADO_PCT
+FROM FATO_ACOES_REAL
+ORDER BY DATA_NEGOCIACAO DESC;
+"""),
+    ('VW_PERFORMANCE_TRIMESTRAL', """
+CREATE OR REPLACE VIEW VW_PERFORMANCE_TRIMESTRAL AS
+SELECT 
+    t.ANO,
+    t.TRIMESTRE,
+    ROUND(AVG(f.PRECO_FECHAMENTO), 2) as PRECO_MEDIO,
+    ROUND(
+        (MAX(CASE WHEN f.DATA_NEGOCIACAO = (
+            SELECT MAX(DATA_NEGOCIACAO) 
+            FROM FATO_ACOES_REAL f2
+            JOIN DIM_TEMPO_REAL t2 ON f2.DATA_NEGOCIACAO = t2.DATA
+            WHERE t2.ANO = t.ANO AND t2.TRIMESTRE = t.TRIMESTRE
+        ) THEN f.PRECO_FECHAMENTO END) / 
+        MIN(CASE WHEN f.DATA_NEGOCIACAO = (
+            SELECT MIN(DATA_NEGOCIACAO) 
+            FROM FATO_ACOES_REAL f2
+            JOIN DIM_TEMPO_REAL t2 ON f2.DATA_NEGOCIACAO = t2.DATA
+            WHERE t2.ANO = t.ANO AND t2.TRIMESTRE = t.TRIMESTRE
+        ) THEN f.PRECO_FECHAMENTO END) - 1) * 100
+    , 2) as VARIACAO_TRIMESTRE,
+    SUM(f.VOLUME) as VOLUME_TOTAL
+FROM FATO_ACOES_REAL f
+JOIN DIM_TEMPO_REAL t ON f.DATA_NEGOCIACAO = t.DATA
+GROUP BY t.ANO, t.TRIMESTRE
+ORDER BY t.ANO, t.TRIMESTRE;
+"""),
+]
+
+# Notícias: lê DADOS_MONG (migrada do PostgreSQL, ver `load migrate`)
+NEWS_TRANSFORMS: List[Transform] = [
+    ('FATO_NOTICIAS', """
+CREATE OR REPLACE TABLE FATO_NOTICIAS AS
+SELECT 
+    "_id" as ID_NOTICIA,
+    TO_TIMESTAMP_NTZ("busca_feita") as DATA_BUSCA,
+    TO_TIMESTAMP_NTZ("publicada") as DATA_PUBLICACAO,
+    "query" as QUERY_BUSCA,
+    "titulo_noticia" as TITULO,
+    REGEXP_REPLACE("url", '^https://news\\.google\\.com/rss/articles/', '') as URL_LIMPA,
+    "url" as URL_COMPLETA,
+    "label" as SENTIMENTO,
+    ROUND("polarity", 2) as POLARIDADE,
+    ROUND("subjectivity", 2) as SUBJETIVIDADE,
+    -- Extrair domínio da notícia
+    CASE 
+        WHEN "titulo_noticia" LIKE '% - %' 
+        THEN TRIM(SPLIT_PART("titulo_noticia", ' - ', -1))
+        ELSE 'Desconhecido'
+    END as FONTE_NOTICIA
+FROM DADOS_MONG
+WHERE "_id" IS NOT NULL;
+"""),
+    ('DIM_SENTIMENTO', """
+CREATE OR REPLACE TABLE DIM_SENTIMENTO AS
+SELECT DISTINCT
+    "label" as SENTIMENTO,
+    CASE 
+        WHEN "label" = 'positive' THEN 'Positivo'
+        WHEN "label" = 'negative' THEN 'Negativo'
+        WHEN "label" = 'neutral' THEN 'Neutro'
+        ELSE 'Desconhecido'
+    END as SENTIMENTO_PT,
+    CASE 
+        WHEN "label" = 'positive' THEN 1
+        WHEN "label" = 'neutral' THEN 0
+        WHEN "label" = 'negative' THEN -1
+        ELSE 0
+    END as SENTIMENTO_VALOR
+FROM DADOS_MONG;
+"""),
+    ('VW_SENTIMENTO_POR_PERIODO', """
+CREATE OR REPLACE VIEW VW_SENTIMENTO_POR_PERIODO AS
+SELECT 
+    DATE_TRUNC('day', DATA_PUBLICACAO) as DATA,
+    SENTIMENTO,
+    COUNT(*) as TOTAL_NOTICIAS,
+    ROUND(AVG(POLARIDADE), 2) as POLARIDADE_MEDIA,
+    ROUND(AVG(SUBJETIVIDADE), 2) as SUBJETIVIDADE_MEDIA
+FROM FATO_NOTICIAS
+GROUP BY DATE_TRUNC('day', DATA_PUBLICACAO), SENTIMENTO
+ORDER BY DATA DESC, SENTIMENTO;
+"""),
+    ('VW_NOTICIAS_POR_FONTE', """
+CREATE OR REPLACE VIEW VW_NOTICIAS_POR_FONTE AS
+SELECT 
+    FONTE_NOTICIA,
+    COUNT(*) as TOTAL_NOTICIAS,
+    ROUND(AVG(POLARIDADE), 2) as POLARIDADE_MEDIA,
+    COUNT(CASE WHEN SENTIMENTO = 'positive' THEN 1 END) as NOTICIAS_POSITIVAS,
+    COUNT(CASE WHEN SENTIMENTO = 'neutral' THEN 1 END) as NOTICIAS_NEUTRAS,
+    COUNT(CASE WHEN SENTIMENTO = 'negative' THEN 1 END) as NOTICIAS_NEGATIVAS
+FROM FATO_NOTICIAS
+GROUP BY FONTE_NOTICIA
+ORDER BY TOTAL_NOTICIAS DESC;
+"""),
+]
+
+# Cruza notícias e cotações: depende das duas transformações anteriores
+CORRELATION_TRANSFORMS: List[Transform] = [
+    ('VW_CORRELACAO_NOTICIAS_PRECO', """
+CREATE OR REPLACE VIEW VW_CORRELACAO_NOTICIAS_PRECO AS
+SELECT 
+    DATE(n.DATA_PUBLICACAO) as DATA,
+    COUNT(n.ID_NOTICIA) as TOTAL_NOTICIAS,
+    ROUND(AVG(n.POLARIDADE), 2) as POLARIDADE_MEDIA_DIA,
+    ROUND(AVG(CASE WHEN n.SENTIMENTO = 'positive' THEN 1.0 
+                    WHEN n.SENTIMENTO = 'negative' THEN -1.0 
+                    ELSE 0.0 END), 2) as SCORE_SENTIMENTO,
+    a.PRECO_FECHAMENTO,
+    a.VARIACAO_PERCENTUAL
+FROM FATO_NOTICIAS n
+LEFT JOIN FATO_ACOES_REAL a ON DATE(n.DATA_PUBLICACAO) = a.DATA_NEGOCIACAO
+GROUP BY DATE(n.DATA_PUBLICACAO), a.PRECO_FECHAMENTO, a.VARIACAO_PERCENTUAL
+ORDER BY DATA DESC;
+"""),
+]
+
+# Grupos na ordem de execução de `transform all`
+TRANSFORMS: Dict[str, List[Transform]] = {
+    'prices': PRICE_TRANSFORMS,
+    'news': NEWS_TRANSFORMS,
+    'correlation': CORRELATION_TRANSFORMS,
+}
+
+# Tabela fato resumida ao fim de cada grupo
+FACT_TABLES = {
+    'prices': 'FATO_ACOES_REAL',
+    'news': 'FATO_NOTICIAS',
+}
+
+
+def run_transforms(context: PipelineContext, group: str) -> List[str]:
+    """
+    Executa um grupo de transformações
+
+    Em dry-run apenas lista os objetos (e o SQL em nível DEBUG), sem
+    abrir sessão no Snowflake.
+
+    Returns:
+        List[str]: Objetos criados (ou que seriam criados)
+    """
+    transforms = TRANSFORMS[group]
+    if context.dry_run:
+        for obj, sql in transforms:
+            logger.info(f"🧪 Dry-run: {obj}")
+            logger.debug(sql)
+        return [obj for obj, _ in transforms]
+
+    cursor = context.snowflake_connection().cursor()
+    try:
+        for obj, sql in transforms:
+            cursor.execute(sql)
+            logger.info(f"✅ {obj} criado")
+        fact_table = FACT_TABLES.get(group)
+        if fact_table:
+            cursor.execute(f"SELECT COUNT(*) FROM {fact_table}")
+            logger.info(f"📊 {fact_table}: {cursor.fetchone()[0]} registros")
+    finally:
+        cursor.close()
+    return [obj for obj, _ in transforms]
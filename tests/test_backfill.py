@@ -0,0 +1,82 @@
+"""
+Testes do backfill por janelas de data (feeds sintéticos)
+"""
+import re
+import sys
+from datetime import date, datetime, timedelta, timezone
+from email.utils import format_datetime
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+# Adiciona diretório raiz ao path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+import feedparser
+
+from src.backfill import DateWindow, DateWindowBackfill, base_queries
+from src.services import NewsCollectorService, SentimentAnalysisService
+
+FEED_CAP = 10
+
+
+class WindowedFeedCollector(NewsCollectorService):
+    """Simula o Google News: filtra por after:/before: e corta em FEED_CAP"""
+
+    def __init__(self, published_dates, **kwargs):
+        super().__init__(SentimentAnalysisService(), max_per_query=FEED_CAP, **kwargs)
+        self.published_dates = published_dates
+        self.fetched = []
+
+    def _fetch_feed(self, feed_url):
+        query = parse_qs(urlparse(feed_url).query)['q'][0]
+        self.fetched.append(query)
+        after = date.fromisoformat(re.search(r'after:(\S+)', query).group(1))
+        before = date.fromisoformat(re.search(r'before:(\S+)', query).group(1))
+        items = [
+            (i, day) for i, day in enumerate(self.published_dates) if after <= day < before
+        ][:FEED_CAP]
+        entries = "".join(
+            f"<item><title>Noticia {i} - Fonte</title><link>https://n/{i}</link>"
+            f"<pubDate>{format_datetime(datetime(day.year, day.month, day.day, tzinfo=timezone.utc))}</pubDate>"
+            f"<description>Banco do Brasil</description></item>"
+            for i, day in items
+        )
+        return feedparser.parse(f"<?xml version='1.0'?><rss version='2.0'><channel>{entries}</channel></rss>")
+
+
+def test_base_queries_strip_year_suffix():
+    """Queries por ano viram uma única query base"""
+    queries = ["BBAS3 resultados 2024", "BBAS3 resultados 2023", "Banco do Brasil"]
+    assert base_queries(queries) == ["BBAS3 resultados", "Banco do Brasil"]
+
+
+def test_date_window_split_and_query():
+    """Janela é dividida ao meio e vira operadores after:/before:"""
+    window = DateWindow(date(2024, 1, 1), date(2024, 1, 11))
+    assert window.split() == (
+        DateWindow(date(2024, 1, 1), date(2024, 1, 6)),
+        DateWindow(date(2024, 1, 6), date(2024, 1, 11)),
+    )
+    assert window.apply("BBAS3") == "BBAS3 after:2024-01-01 before:2024-01-11"
+
+
+def test_backfill_splits_only_saturated_windows():
+    """Janela densa é dividida até cobrir tudo; janelas esparsas custam 1 requisição"""
+    start = date(2022, 1, 1)
+    # 40 notícias concentradas em um mês e 3 espalhadas pelo restante
+    dense = [start + timedelta(days=400 + i % 30) for i in range(40)]
+    sparse = [start + timedelta(days=d) for d in (10, 200, 700)]
+    collector = WindowedFeedCollector(dense + sparse, max_workers=4, sleep_between=0.0, max_years_back=50)
+    backfill = DateWindowBackfill(collector, start, start + timedelta(days=3 * 365), initial_window_days=365)
+
+    results = list(backfill.iter_query_results(["BBAS3"]))
+
+    urls = [a.url for _, articles in results for a in articles]
+    assert len(urls) == len(set(urls)) == 43
+    assert all(a.query == "BBAS3" for _, articles in results for a in articles)
+    # Só a última janela conclui a query base
+    assert [query for query, _ in results].count("BBAS3") == 1
+    assert results[-1][0] == "BBAS3"
+    assert backfill.splits > 0
+    assert backfill.requests == len(collector.fetched) < 40
@@ -0,0 +1,54 @@
+"""
+Testes do harness de benchmarks e dos dados sintéticos
+"""
+import sys
+from pathlib import Path
+
+# Adiciona diretório raiz ao path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+import feedparser
+
+from benchmarks import bench_coleta
+from benchmarks.synthetic import google_news_rss, synthetic_articles
+from src.services import NewsCollectorService, SentimentAnalysisService
+
+
+def test_synthetic_feed_is_google_news_shaped_and_deterministic():
+    """Feed gerado é parseável, reprodutível e vira artigos com fonte"""
+    xml = google_news_rss("BBAS3 B3", 25, seed=7)
+    assert xml == google_news_rss("BBAS3 B3", 25, seed=7)
+
+    feed = feedparser.parse(xml)
+    assert not feed.bozo
+    assert len(feed.entries) == 25
+
+    collector = NewsCollectorService(SentimentAnalysisService(), max_years_back=50, sleep_between=0.0)
+    articles, feed_size = collector.process_feed(feed, "BBAS3 B3")
+    assert feed_size == 25
+    assert len({a.url for a in articles}) == 25
+    assert all(a.to_relational_dict()['fonte_noticia'] for a in articles)
+    assert len({a.url for a in synthetic_articles(50)}) == 50
+
+
+def test_harness_runs_and_flags_regressions(tmp_path):
+    """Execução pequena grava histórico e a comparação aponta regressões"""
+    results_file = tmp_path / "historico.jsonl"
+    argv = [
+        '--size', '20', '--repeat', '2', '--warmup', '0', '--results', str(results_file),
+        '--only', 'relational_projection', 'postgresql_save', '--save'
+    ]
+    assert bench_coleta.main(argv) == 0
+
+    history = bench_coleta.load_history(results_file)
+    record = history[-1]
+    assert set(record['results']) == {'relational_projection', 'postgresql_save'}
+    assert record['results']['postgresql_save']['items'] == 20
+
+    slower = dict(record, commit='abc1234', results={
+        name: dict(stats, median_seconds=stats['median_seconds'] * 2)
+        for name, stats in record['results'].items()
+    })
+    assert bench_coleta.find_baseline(history, slower) is record
+    assert bench_coleta.compare(record, slower, threshold=0.2) == ['relational_projection', 'postgresql_save']
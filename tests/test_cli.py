@@ -0,0 +1,171 @@
+"""
+Testes da CLI unificada (offline, sem bancos)
+"""
+import json
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+# Adiciona diretório raiz ao path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+import pandas as pd
+import pytest
+
+from src import cli
+from src.config import Settings
+from src.context import PipelineContext
+from src.prices import PRICE_COLUMNS, prepare_prices
+from src.sources import slugify
+from tests.test_collector import build_rss
+
+
+def offline_settings(tmp_path):
+    """Configurações que leem feeds gravados e gravariam apenas em tmp_path"""
+    settings = Settings()
+    settings.queries = ["BBAS3 B3", "Banco do Brasil"]
+    feeds_dir = tmp_path / "feeds"
+    feeds_dir.mkdir()
+    for i, query in enumerate(settings.queries):
+        items = [(f"Noticia {i}-{n} - Fonte", f"https://exemplo/{i}/{n}") for n in range(3)]
+        (feeds_dir / f"{slugify(query)}.xml").write_text(build_rss(items), encoding='utf-8')
+
+    app = settings.app
+    app.news_sources = 'local'
+    app.local_feeds_dir = str(feeds_dir)
+    app.max_years_back = 50
+    app.sleep_between_requests = 0.0
+    app.feed_cache_dir = ''
+    app.seen_index_path = ''
+    app.near_dup_index_path = ''
+    app.sentiment_cache_path = ''
+    app.metrics_enabled = False
+    app.save_json_local = True
+    app.json_output_file = str(tmp_path / "artigos.ndjson")
+    app.checkpoint_path = str(tmp_path / "checkpoint.json")
+    return settings
+
+
+def write_articles(path, articles):
+    with open(path, 'w', encoding='utf-8') as f:
+        for title, published, polarity in articles:
+            f.write(json.dumps({
+                'url': f"https://exemplo/{title}",
+                'query': "BBAS3 B3",
+                'titulo_noticia': title,
+                'publicada': published,
+                'sentimentos': {'polarity': polarity, 'label': 'positive' if polarity > 0 else 'negative'},
+            }) + "\n")
+
+
+def test_parse_args_accepts_only_honored_options():
+    """Cada comando aceita só as opções globais que respeita"""
+    args = cli.parse_args(['collect', '--dry-run', '--since', '2024-01-01', '--workers', '2', '--resume'])
+    assert (args.dry_run, args.since, args.workers, args.resume) == (True, date(2024, 1, 1), 2, True)
+    assert cli.parse_args(['transform', 'all', '--dry-run']).group == 'all'
+    assert [stage for stage, _ in cli.parse_args(['run']).stage_args] == cli.DEFAULT_RUN
+
+    for argv in (
+        ['transform', 'all', '--since', '2024-01-01'],
+        ['load', 'migrate', '--since', '2024-01-01'],
+        ['load', 'prices', '--workers', '2'],
+        ['analyze', '--dry-run'],
+        ['run', 'load:migrate', 'transform:all', '--since', '2024-01-01'],
+    ):
+        with pytest.raises(SystemExit):
+            cli.parse_args(argv)
+
+
+def test_collect_dry_run_writes_nothing(tmp_path):
+    """Coleta em dry-run não deixa checkpoint, NDJSON, cache de feeds nem índices em disco"""
+    settings = offline_settings(tmp_path)
+    state = tmp_path / "state"
+    settings.app.feed_cache_dir = str(tmp_path / "cache" / "feeds")
+    settings.app.seen_index_path = str(state / "seen_articles.sqlite3")
+    settings.app.near_dup_index_path = str(state / "near_duplicates.sqlite3")
+    settings.app.sentiment_cache_path = str(tmp_path / "cache" / "sentiment.sqlite3")
+    with PipelineContext(settings, dry_run=True) as context:
+        result = cli._collect(context, cli.parse_args(['collect']))
+        assert context._repositories == {}
+
+    assert result['pipeline']['articles'] == 6
+    assert result['run_id'] is None
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["feeds"]
+
+
+def test_run_chains_stages_in_one_context(tmp_path):
+    """run encadeia coleta, transformação e análise sem abrir conexões em dry-run"""
+    settings = offline_settings(tmp_path)
+    write_articles(settings.app.json_output_file, [
+        ("Lucro recorde", "2025-03-01T10:00:00", 0.6),
+        ("Inadimplencia sobe", "2025-02-01T10:00:00", -0.4),
+        ("Resultado antigo", "2019-05-01T10:00:00", 0.1),
+    ])
+    args = cli.parse_args(['run', 'collect', 'transform:all', 'analyze', '--dry-run', '--since', '2025-01-01'])
+
+    with PipelineContext(settings, dry_run=args.dry_run, since=args.since) as context:
+        results = cli._run(context, args)
+        assert context._repositories == {}
+
+    assert list(results) == ['collect', 'transform:all', 'analyze']
+    assert results['transform:all']['correlation'] == ['VW_CORRELACAO_NOTICIAS_PRECO']
+    assert results['analyze']['total'] == 2
+    assert results['analyze']['most_negative'][0] == (-0.4, "Inadimplencia sobe")
+    assert results['analyze']['years'] == {2025: 2}
+
+
+def test_prepare_prices_renames_and_computes_variation():
+    """Histórico do Yahoo Finance vira colunas em português com variação diária"""
+    history = pd.DataFrame(
+        {'Open': [10.0, 11.0, 12.0], 'High': [11.0, 12.0, 13.0], 'Low': [9.0, 10.0, 11.0],
+         'Close': [10.0, 11.0, 9.9], 'Volume': [100, 200, 300], 'Dividends': [0, 0, 0]},
+        index=pd.DatetimeIndex(['2025-01-02', '2025-01-03', '2025-01-06'], name='Date', tz='America/Sao_Paulo')
+    )
+    prices = prepare_prices(history)
+
+    assert list(prices.columns) == PRICE_COLUMNS
+    assert prices['Data'].tolist() == [date(2025, 1, 3), date(2025, 1, 6)]
+    assert prices['Variacao_Percentual'].tolist() == [10.0, -10.0]
+
+
+def test_load_prices_since_replaces_only_the_window(tmp_path, monkeypatch):
+    """--since regrava só os pregões da janela, com variação do primeiro dia calculada"""
+    from sqlalchemy import create_engine, text
+
+    from src import prices
+
+    days = pd.DatetimeIndex(['2025-01-02', '2025-01-03', '2025-01-06', '2025-01-07'], name='Date')
+    full = pd.DataFrame(
+        {'Open': 10.0, 'High': 11.0, 'Low': 9.0, 'Close': [10.0, 11.0, 12.1, 12.1], 'Volume': 100},
+        index=days
+    )
+    fetched = []
+
+    def fake_fetch(start, end):
+        fetched.append(start)
+        return full[full.index >= pd.Timestamp(start)]
+
+    monkeypatch.setattr(prices, 'fetch_history', fake_fetch)
+    engine = create_engine(f"sqlite:///{tmp_path / 'precos.db'}")
+    settings = Settings()
+    settings.postgresql.enabled = True
+    settings.snowflake.enabled = False
+    context = PipelineContext(settings)
+    monkeypatch.setattr(context, 'postgres_engine', lambda: engine)
+
+    prices.load_prices(context, end=date(2025, 1, 8))
+    # Cotação do dia 06 corrigida na fonte; recarga só a partir dele
+    full.loc[pd.Timestamp('2025-01-06'), 'Close'] = 13.2
+    context.since = date(2025, 1, 6)
+    summary = prices.load_prices(context, end=date(2025, 1, 8))
+
+    assert fetched[-1] == date(2025, 1, 6) - timedelta(days=prices.LOOKBACK_DAYS)
+    assert (summary['rows'], summary['first']) == (2, '2025-01-06')
+    with engine.connect() as conn:
+        rows = conn.execute(text(
+            f'SELECT "Data", "Fechamento", "Variacao_Percentual" FROM {prices.PG_PRICES_TABLE} ORDER BY "Data"'
+        )).fetchall()
+    assert [tuple(r) for r in rows] == [
+        ('2025-01-03', 11.0, 10.0), ('2025-01-06', 13.2, 20.0), ('2025-01-07', 12.1, -8.33)
+    ]
@@ -0,0 +1,138 @@
+"""
+Testes do serviço de coleta (offline, com feeds sintéticos)
+"""
+import sys
+import time
+from pathlib import Path
+
+# Adiciona diretório raiz ao path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+import feedparser
+
+from src.fetchers import FeedCache, FetchResult, HostRateLimiter, TokenBucket
+from src.services import SentimentAnalysisService, NewsCollectorService
+from src.state import SeenArticleIndex
+
+
+def build_rss(items):
+    """Gera XML RSS no formato do Google News a partir de (titulo, url)"""
+    entries = "".join(
+        f"<item><title>{title}</title><link>{url}</link>"
+        f"<pubDate>Mon, 15 Sep 2025 10:00:00 GMT</pubDate>"
+        f"<description>{title} com lucro e crescimento</description></item>"
+        for title, url in items
+    )
+    return f"<?xml version='1.0'?><rss version='2.0'><channel>{entries}</channel></rss>"
+
+
+class FakeCollector(NewsCollectorService):
+    """Coletor que devolve feeds sintéticos por query"""
+
+    def __init__(self, feeds, **kwargs):
+        super().__init__(SentimentAnalysisService(), **kwargs)
+        self.feeds = feeds
+
+    def _fetch_feed(self, feed_url):
+        self.rate_limiter.acquire(feed_url)
+        for query, xml in self.feeds.items():
+            if self._build_rss_url(query) == feed_url:
+                return feedparser.parse(xml)
+        raise AssertionError(f"URL inesperada: {feed_url}")
+
+
+def test_token_bucket_burst_and_refill():
+    """Rajada inicial é imediata; tokens seguintes respeitam a taxa"""
+    bucket = TokenBucket(rate=20.0, capacity=2)
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == 0.0
+    start = time.monotonic()
+    bucket.acquire()
+    assert time.monotonic() - start >= 0.04
+
+
+def test_host_rate_limiter_is_per_host():
+    """Hosts diferentes não compartilham tokens"""
+    limiter = HostRateLimiter(min_interval=10.0, burst=1)
+    assert limiter.acquire("https://news.google.com/rss?q=a") == 0.0
+    assert limiter.acquire("https://example.com/feed") == 0.0
+
+
+def test_collect_all_parallel_dedup():
+    """Coleta paralela preserva ordem das queries e remove URLs repetidas"""
+    feeds = {
+        "q1": build_rss([("Noticia A - Fonte", "https://a"), ("Noticia B - Fonte", "https://b")]),
+        "q2": build_rss([("Noticia B - Fonte", "https://b"), ("Noticia C - Fonte", "https://c")]),
+    }
+    collector = FakeCollector(feeds, max_workers=4, sleep_between=0.0, max_years_back=50)
+
+    articles = collector.collect_all(["q1", "q2"])
+
+    assert [a.url for a in articles] == ["https://a", "https://b", "https://c"]
+    assert articles[0].query == "q1"
+    assert articles[2].query == "q2"
+
+
+def test_seen_index_skips_persisted_articles():
+    """Artigos já registrados no índice local não são reprocessados"""
+    feeds = {"q1": build_rss([("Noticia A - Fonte", "https://a"), ("Noticia B - Fonte", "https://b")])}
+    index = SeenArticleIndex(':memory:')
+    collector = FakeCollector(feeds, sleep_between=0.0, max_years_back=50, seen_index=index)
+
+    first = collector.collect_from_query("q1")
+    assert len(first) == 2
+    assert index.mark_collected(first[:1]) == 1
+    assert index.get_watermark("q1") is not None
+
+    second = collector.collect_from_query("q1")
+    assert [a.url for a in second] == ["https://b"]
+
+
+def test_not_modified_feed_is_parsed_only_for_feed_size(tmp_path, monkeypatch):
+    """Na coleta normal o 304 não parseia o feed em cache; o backfill conta as entradas"""
+    cache = FeedCache(str(tmp_path))
+
+    class NotModifiedFetcher:
+        def __init__(self):
+            self.cache = cache
+
+        def fetch(self, url):
+            return FetchResult(url, 304)
+
+    collector = NewsCollectorService(SentimentAnalysisService(), sleep_between=0.0, fetcher=NotModifiedFetcher())
+    url = collector._build_rss_url("q1")
+    body = build_rss([("Noticia A - Fonte", "https://a"), ("Noticia B - Fonte", "https://b")])
+    cache.store(FetchResult(url, 200, body.encode()))
+    parsed = []
+    parse = feedparser.parse
+    monkeypatch.setattr(feedparser, 'parse', lambda data: parsed.append(data) or parse(data))
+
+    assert collector.collect_from_query("q1") == []
+    assert parsed == []
+    assert collector.collect_with_feed_size("q1") == ([], 2)
+    assert len(parsed) == 1
+
+
+def test_watermark_keeps_lookback_margin():
+    """Matéria indexada com atraso dentro da margem ainda é coletada"""
+    def item(url, published):
+        return (
+            f"<item><title>Noticia {url} - Fonte</title><link>{url}</link>"
+            f"<pubDate>{published}</pubDate><description>lucro</description></item>"
+        )
+
+    index = SeenArticleIndex(':memory:')
+    recent = FakeCollector(
+        {"q1": f"<rss version='2.0'><channel>{item('https://a', 'Mon, 15 Sep 2025 10:00:00 GMT')}</channel></rss>"},
+        sleep_between=0.0, max_years_back=50, seen_index=index
+    )
+    index.mark_collected(recent.collect_from_query("q1"))
+
+    late = f"<rss version='2.0'><channel>{item('https://a', 'Mon, 15 Sep 2025 10:00:00 GMT')}" \
+           f"{item('https://late', 'Thu, 11 Sep 2025 10:00:00 GMT')}" \
+           f"{item('https://old', 'Fri, 15 Aug 2025 10:00:00 GMT')}</channel></rss>"
+    collector = FakeCollector({"q1": late}, sleep_between=0.0, max_years_back=50,
+                              seen_index=index, watermark_lookback_days=7)
+
+    assert [a.url for a in collector.collect_from_query("q1")] == ["https://late"]
@@ -0,0 +1,112 @@
+"""
+Testes da detecção de quase-duplicatas (MinHash/LSH)
+"""
+import sys
+from pathlib import Path
+
+# Adiciona diretório raiz ao path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from src.dedup import MinHasher, NearDuplicateIndex, normalize_text, strip_markup
+from src.models import NewsArticle, SentimentAnalysis, generate_url_hash
+
+STORY = (
+    "Banco do Brasil registra lucro líquido ajustado de R$ 9,5 bilhões no segundo "
+    "trimestre, alta de 8% na comparação anual, impulsionado pela carteira de crédito "
+    "ao agronegócio e pela redução das despesas com provisões"
+)
+
+
+def make(i, title, resumo):
+    return NewsArticle(
+        url=f"https://news.google.com/rss/articles/{i}",
+        query="BBAS3 B3",
+        titulo_noticia=title,
+        publicada="2025-08-14T10:00:00+00:00",
+        busca_feita="2025-08-15T08:00:00+00:00",
+        resumo=resumo,
+        sentimentos=SentimentAnalysis(0.3, 0.5, 'positive', 0.7, 2, 0)
+    )
+
+
+def test_normalize_and_similarity():
+    """Texto é normalizado; textos iguais têm similaridade 1"""
+    assert normalize_text("Lucro, AÇÕES e Inadimplência!") == "lucro acoes e inadimplencia"
+    hasher = MinHasher()
+    assert hasher.signature("") is None
+    signature = hasher.signature(STORY)
+    assert MinHasher.similarity(signature, hasher.signature(STORY.upper())) == 1.0
+
+
+def test_syndicated_story_shares_cluster_id():
+    """Mesma matéria em veículos diferentes recebe o id do primeiro artigo"""
+    index = NearDuplicateIndex()
+    original = make(1, "BB tem lucro de R$ 9,5 bi no 2º tri - Valor", STORY)
+    syndicated = make(2, "BB tem lucro de R$ 9,5 bi no 2º tri - InfoMoney", STORY + " segundo analistas")
+    other = make(3, "Banco do Brasil anuncia novo programa de renegociação - Exame",
+                 "Programa permite renegociar dívidas rurais com desconto de até 50% para pequenos produtores")
+
+    clusters = index.assign_many([original, syndicated, other])
+
+    assert clusters[0] == clusters[1] == generate_url_hash(original.url)
+    assert clusters[2] == generate_url_hash(other.url)
+    assert syndicated.cluster_id == clusters[0]
+    assert index.duplicates == 1
+    # Reprocessar o mesmo artigo devolve o grupo já gravado
+    assert index.assign(make(2, "outro título", "outro texto")) == clusters[0]
+    assert syndicated.to_relational_dict()['cluster_id'] == clusters[0]
+    assert NewsArticle.from_dict(syndicated.to_dict()).cluster_id == clusters[0]
+
+
+def google_news_description(title, article_id):
+    """Descrição como a do Google News (ver benchmarks/synthetic.py), já sem escape"""
+    source = title.rsplit(' - ', 1)[-1]
+    link = f"https://news.google.com/rss/articles/CBMi{article_id}?oc=5"
+    return f'<a href="{link}" target="_blank">{title}</a>\xa0\xa0<font color="#6f6f6f">{source}</font>'
+
+
+def test_google_news_descriptions_share_cluster_id():
+    """Links únicos e fonte da descrição HTML não separam cópias da mesma matéria"""
+    index = NearDuplicateIndex()
+    titles = [
+        "BB tem lucro de R$ 9,5 bi no 2º tri e supera projeções do mercado - Valor",
+        "BB tem lucro de R$ 9,5 bi no 2º tri e supera projeções do mercado - InfoMoney",
+        "Banco do Brasil anuncia programa de renegociação de dívidas rurais - Exame",
+    ]
+    articles = [
+        make(i, title, google_news_description(title, generate_url_hash(title) * 3))
+        for i, title in enumerate(titles, start=11)
+    ]
+
+    clusters = index.assign_many(articles)
+
+    assert clusters[0] == clusters[1] == generate_url_hash(articles[0].url)
+    assert clusters[2] == generate_url_hash(articles[2].url)
+    assert NearDuplicateIndex.text_for(articles[0]) == articles[0].titulo_limpo
+    assert strip_markup("<p>Lucro &amp; dividendos em https://exemplo.com/x</p>").split() == [
+        "Lucro", "&", "dividendos", "em"
+    ]
+
+
+def test_index_persists_and_lookup_uses_bucket_index(tmp_path):
+    """Índice em disco é retomado; busca de candidatos usa o índice de buckets"""
+    path = str(tmp_path / "near_dup.sqlite3")
+    index = NearDuplicateIndex(path)
+    articles = [
+        make(i, f"Notícia {i} sobre tema {i * 7919 % 1000} - Fonte", f"Resumo único {i} com termos {i * 31} e {i * 17}")
+        for i in range(300)
+    ]
+    index.assign_many(articles)
+
+    plan = index._conn.execute(
+        "EXPLAIN QUERY PLAN SELECT DISTINCT s.url_hash FROM lsh_buckets b "
+        "JOIN minhash_signatures s ON s.url_hash = b.url_hash WHERE b.bucket IN (?, ?)",
+        (b'a', b'b')
+    ).fetchall()
+    assert any('idx_lsh_buckets' in row[-1] for row in plan)
+    index.close()
+
+    reopened = NearDuplicateIndex(path)
+    assert reopened.count() == 300
+    assert reopened.assign(make(5000, articles[0].titulo_noticia, articles[0].resumo)) == articles[0].cluster_id
@@ -0,0 +1,175 @@
+"""
+Testes da camada HTTP (servidor local, sem acesso à internet)
+"""
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+
+# Adiciona diretório raiz ao path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+import pytest
+
+import urllib.error
+
+from src.fetchers import (
+    CircuitBreaker, FeedCache, FeedFetcher, HostRateLimiter, RetryBudget, RetryPolicy, parse_retry_after
+)
+
+FEED_BODY = b"<?xml version='1.0'?><rss version='2.0'><channel></channel></rss>"
+
+
+class FeedHandler(BaseHTTPRequestHandler):
+    """Serve um feed fixo com ETag e responde 304 a requisições condicionais"""
+
+    requests_seen = []
+    # Respostas de erro a devolver antes do feed (status, Retry-After)
+    failures = []
+
+    def do_GET(self):
+        FeedHandler.requests_seen.append(dict(self.headers))
+        if FeedHandler.failures:
+            status, retry_after = FeedHandler.failures.pop(0)
+            self.send_response(status)
+            if retry_after is not None:
+                self.send_header('Retry-After', retry_after)
+            self.end_headers()
+            return
+        if self.headers.get('If-None-Match') == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('ETag', '"v1"')
+        self.send_header('Content-Type', 'application/rss+xml')
+        self.send_header('Content-Length', str(len(FEED_BODY)))
+        self.end_headers()
+        self.wfile.write(FEED_BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def feed_server():
+    """Sobe servidor HTTP local em porta livre"""
+    FeedHandler.requests_seen = []
+    FeedHandler.failures = []
+    server = HTTPServer(('127.0.0.1', 0), FeedHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/rss"
+    server.shutdown()
+    server.server_close()
+
+
+def test_conditional_get_returns_304_after_cache(feed_server, tmp_path):
+    """Segunda busca envia If-None-Match e recebe 304 sem corpo"""
+    fetcher = FeedFetcher(cache=FeedCache(str(tmp_path)))
+
+    first = fetcher.fetch(feed_server)
+    assert first.status == 200
+    assert first.body == FEED_BODY
+    assert fetcher.cache.get_body(feed_server) == FEED_BODY
+
+    second = fetcher.fetch(feed_server)
+    assert second.not_modified
+    assert FeedHandler.requests_seen[-1].get('If-None-Match') == '"v1"'
+
+
+def test_fetch_without_cache_is_unconditional(feed_server):
+    """Sem cache, toda busca é incondicional"""
+    fetcher = FeedFetcher()
+    fetcher.fetch(feed_server)
+    result = fetcher.fetch(feed_server)
+    assert result.status == 200
+    assert 'If-None-Match' not in FeedHandler.requests_seen[-1]
+
+
+def test_retry_honours_retry_after_and_backs_off(feed_server):
+    """429/503 são repetidos; Retry-After define a espera e o host desacelera"""
+    FeedHandler.failures = [(429, '7'), (503, None)]
+    sleeps = []
+    limiter = HostRateLimiter(min_interval=0.001, burst=10)
+    fetcher = FeedFetcher(
+        rate_limiter=limiter,
+        retry_policy=RetryPolicy(max_retries=3, backoff_base=0.5),
+        sleep=sleeps.append
+    )
+
+    result = fetcher.fetch(feed_server)
+
+    assert result.status == 200
+    assert fetcher.requests == 3
+    assert fetcher.retries == 2
+    assert sleeps[0] == 7.0
+    assert 0 <= sleeps[1] <= 1.0
+    assert limiter.interval(feed_server) > 0.001
+
+
+def test_retry_gives_up_on_client_errors_and_exhausted_budget(feed_server):
+    """404 não é repetido; sem orçamento, a falha é propagada na hora"""
+    FeedHandler.failures = [(404, None)]
+    fetcher = FeedFetcher(retry_policy=RetryPolicy(max_retries=3), sleep=lambda _: None)
+    with pytest.raises(urllib.error.HTTPError):
+        fetcher.fetch(feed_server)
+    assert fetcher.requests == 1
+
+    FeedHandler.failures = [(503, None)] * 2
+    fetcher = FeedFetcher(
+        retry_policy=RetryPolicy(max_retries=3),
+        retry_budget=RetryBudget(ratio=0.0, min_retries=1),
+        sleep=lambda _: None
+    )
+    with pytest.raises(urllib.error.HTTPError):
+        fetcher.fetch(feed_server)
+    assert fetcher.retries == 1
+
+
+def test_circuit_breaker_ignores_404_and_counts_blocking_statuses(feed_server):
+    """404 é neutro; 403 e 429 abrem o circuito como falhas de rede"""
+    breaker = CircuitBreaker(error_rate=0.5, window=4, min_requests=2, cooldown=60)
+    fetcher = FeedFetcher(circuit_breaker=breaker, sleep=lambda _: None)
+
+    FeedHandler.failures = [(404, None)] * 3
+    for _ in range(3):
+        with pytest.raises(urllib.error.HTTPError):
+            fetcher.fetch(feed_server)
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert len(breaker._outcomes) == 0
+
+    FeedHandler.failures = [(403, None), (429, None)]
+    for _ in range(2):
+        with pytest.raises(urllib.error.HTTPError):
+            fetcher.fetch(feed_server)
+    assert breaker.state == CircuitBreaker.OPEN
+
+    # Resposta neutra na requisição de teste não fecha nem reabre o circuito
+    breaker.state, breaker._probe_in_flight = CircuitBreaker.HALF_OPEN, True
+    breaker.record(None)
+    assert (breaker.state, breaker._probe_in_flight) == (CircuitBreaker.HALF_OPEN, False)
+
+
+def test_parse_retry_after_http_date():
+    """Retry-After aceita segundos ou data HTTP"""
+    assert parse_retry_after('120') == 120.0
+    assert parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT') == 0.0
+    assert parse_retry_after('invalido') is None
+
+
+def test_circuit_breaker_pauses_and_recovers():
+    """Taxa de erros alta abre o circuito; após a pausa um teste o fecha"""
+    breaker = CircuitBreaker(error_rate=0.5, window=4, min_requests=4, cooldown=0.1)
+    for success in (True, False, False, True):
+        assert breaker.before_request() == 0.0
+        breaker.record(success)
+    assert breaker.state == CircuitBreaker.OPEN
+
+    waited = breaker.before_request()
+    assert waited >= 0.05
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    breaker.record(True)
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.opened == 1
@@ -0,0 +1,43 @@
+"""
+Testes de importação sob demanda (drivers e .env carregados só quando usados)
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+# Adiciona diretório raiz ao path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+HEAVY_MODULES = ['pymongo', 'sqlalchemy', 'pandas', 'snowflake.connector', 'feedparser', 'textblob', 'dotenv']
+
+
+def loaded_after(code: str):
+    """Módulos pesados presentes em sys.modules após executar `code` num processo novo"""
+    script = (
+        f"import sys\n{code}\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    output = subprocess.run(
+        [sys.executable, '-c', script], cwd=root_dir, check=True, capture_output=True, text=True
+    ).stdout.strip()
+    return set(output.split(',')) - {''}
+
+
+def test_importing_entry_points_loads_no_backend():
+    """Importar o pacote, a CLI e o script principal não carrega drivers nem o .env"""
+    assert loaded_after("import src.repositories, src.services, src.pipeline, src.sources\nimport collect_news_bbas3") == set()
+    assert loaded_after("import src.cli, src.collection, src.prices, src.transforms, src.loaders, src.orchestrator") == set()
+
+
+def test_backends_load_on_demand():
+    """Cada repositório importa só o próprio driver; settings carrega o .env"""
+    mongo_only = loaded_after(
+        "from src.config import MongoDBConfig\n"
+        "from src.repositories import MongoDBRepository\n"
+        "MongoDBRepository(MongoDBConfig(uri='mongodb://x', database='d', collection='c'))"
+    )
+    assert mongo_only == {'pymongo'}
+
+    assert loaded_after("from src.config import settings") == {'dotenv'}
+    assert loaded_after("from src.services import SentimentAnalysisService\nSentimentAnalysisService()") == {'textblob'}
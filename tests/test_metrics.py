@@ -0,0 +1,65 @@
+"""
+Testes da camada de métricas
+"""
+import json
+import sys
+from pathlib import Path
+
+# Adiciona diretório raiz ao path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+import pytest
+
+from src import metrics
+from src.models import NewsArticleBatch
+from src.services import NewsPersistenceService
+from tests.test_repositories import MongoDBStubRepository, make_article
+
+
+@pytest.fixture
+def registry():
+    registry = metrics.enable()
+    yield registry
+    metrics.disable()
+
+
+def test_disabled_metrics_are_noops():
+    """Sem registro ativo nada é acumulado e o timer é compartilhado"""
+    metrics.disable()
+    metrics.inc('x_total')
+    metrics.observe('x_bytes', 10)
+    with metrics.timer('x_seconds'):
+        pass
+    NewsArticleBatch([make_article(i) for i in range(3)])
+    assert metrics.summary() == {}
+    assert metrics._registry is None
+    assert metrics.timer('a') is metrics.timer('b')
+
+
+def test_counters_timers_and_exports(registry, tmp_path):
+    """Projeção, persistência e contadores aparecem no JSON e no Prometheus"""
+    articles = [make_article(i) for i in range(3)]
+    NewsArticleBatch(articles)
+    NewsPersistenceService([MongoDBStubRepository(0.0)]).save_all(articles)
+    metrics.inc('http_responses_total', status=200)
+
+    summary = metrics.summary()
+    # Projeção medida uma vez por lote, com o número de linhas num contador
+    assert summary['timers']['model_projection_seconds']['count'] == 1
+    assert summary['counters']['model_projection_rows_total'] == 3
+    assert summary['timers']['repository_save_seconds']['repository=MongoDBStub']['count'] == 1
+    assert summary['counters']['articles_saved_total']['repository=MongoDBStub'] == 3
+
+    json_path = tmp_path / "metrics.json"
+    metrics.write_json(str(json_path), extra={'run_id': 'abc'})
+    assert json.loads(json_path.read_text())['run_id'] == 'abc'
+
+    prom_path = tmp_path / "coleta.prom"
+    metrics.write_prometheus(str(prom_path))
+    text = prom_path.read_text()
+    assert '# TYPE bbas3_news_articles_saved_total counter' in text
+    assert 'bbas3_news_http_responses_total{status="200"} 1' in text
+    assert 'bbas3_news_model_projection_seconds_bucket{le="+Inf"} 1' in text
+    assert 'bbas3_news_model_projection_seconds_count 1' in text
+    assert 'bbas3_news_model_projection_rows_total 3' in text
@@ -0,0 +1,97 @@
+"""
+Testes da projeção relacional dos modelos
+"""
+import sys
+from pathlib import Path
+
+# Adiciona diretório raiz ao path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+import numpy as np
+
+from src.models import (
+    NewsArticle,
+    NewsArticleBatch,
+    RELATIONAL_COLUMNS,
+    SentimentAnalysis,
+    parse_datetime,
+    to_relational_columns,
+)
+
+
+def make_article(publicada, busca_feita="2025-01-16T08:00:00+00:00"):
+    """Cria artigo com as datas informadas"""
+    return NewsArticle(
+        url="https://news.google.com/rss/articles/abc\n",
+        query="Banco do Brasil agribusiness inadimplencia 2024",
+        titulo_noticia="BB  amplia\tprovisão\x07 - Valor Econômico",
+        publicada=publicada,
+        busca_feita=busca_feita,
+        resumo="Resumo\ncom   quebras",
+        sentimentos=SentimentAnalysis(-0.2, 0.4, 'negative', 0.5, 0, 2)
+    )
+
+
+def test_relational_projection_dates():
+    """ISO é mantido; outros formatos são convertidos; inválidos viram None"""
+    iso = make_article("2025-01-15T10:30:00Z").to_relational_dict()
+    assert iso['publicada'] == "2025-01-15T10:30:00Z"
+    assert (iso['ano_publicacao'], iso['mes_publicacao']) == (2025, 1)
+
+    rfc = make_article("15 Sep 2025 10:00:00 +0000", busca_feita="2024-03-02").to_relational_dict()
+    assert rfc['publicada'] == "2025-09-15T10:00:00+00:00"
+    assert rfc['busca_feita'] == "2024-03-02T00:00:00"
+    assert rfc['mes_publicacao'] == 9
+
+    invalid = make_article("data inválida").to_relational_dict()
+    assert invalid['publicada'] is None and invalid['ano_publicacao'] is None
+    assert parse_datetime(None) is None
+
+
+def test_relational_projection_cleaning_and_columns():
+    """Limpeza de texto e conversão colunar equivalem à projeção por linha"""
+    articles = [make_article("2025-01-15T10:30:00Z"), make_article(None)]
+    record = articles[0].to_relational_dict()
+    assert record['titulo_noticia'] == "BB amplia provisão - Valor Econômico"
+    assert record['resumo'] == "Resumo com quebras"
+    assert record['url'] == "https://news.google.com/rss/articles/abc"
+    assert record['query_category'] == 'INADIMPLENCIA_AGRO'
+
+    columns = to_relational_columns(articles)
+    assert list(columns) == RELATIONAL_COLUMNS
+    for i, article in enumerate(articles):
+        assert {name: values[i] for name, values in columns.items()} == article.to_relational_dict()
+    assert to_relational_columns([])['url_hash'] == []
+
+
+def test_news_article_batch_exports(tmp_path):
+    """Lote colunar deduplica por URL e exporta para pandas, Arrow e Parquet"""
+    articles = [make_article("2025-01-15T10:30:00Z"), make_article("2024-03-02")]
+    articles[1].url = "https://news.google.com/rss/articles/outro"
+    repeated = make_article("2023-05-05T00:00:00Z")
+
+    batch = NewsArticleBatch(articles + [repeated])
+    assert len(batch) == 2
+
+    df = batch.to_pandas()
+    assert list(df.columns) == RELATIONAL_COLUMNS
+    assert df['publicada'].tolist() == ["2023-05-05T00:00:00Z", "2024-03-02T00:00:00"]
+    assert df['sentimento_negative_keywords'].dtype == 'int64'
+    # Colunas numéricas compartilham a memória dos buffers do lote
+    for name in NewsArticleBatch.FLOAT_COLUMNS + NewsArticleBatch.INT_COLUMNS:
+        assert np.shares_memory(df[name].to_numpy(), np.frombuffer(batch.columns()[name], dtype=df[name].dtype))
+
+    table = batch.to_arrow()
+    assert table.num_rows == 2
+    assert str(table.schema.field('publicada').type) == 'timestamp[us, tz=UTC]'
+
+    path = tmp_path / "noticias.parquet"
+    batch.write_parquet(str(path))
+    assert path.stat().st_size > 0
+
+    try:
+        batch.append(make_article(None))
+        assert False, "lote exportado deveria estar congelado"
+    except ValueError:
+        pass
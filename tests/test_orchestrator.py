@@ -0,0 +1,160 @@
+"""
+Testes do orquestrador em DAG (etapas sintéticas, sem bancos)
+"""
+import sys
+import threading
+from pathlib import Path
+
+# Adiciona diretório raiz ao path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+import pytest
+
+from src.config import Settings
+from src.context import PipelineContext
+from src.orchestrator import (
+    BLOCKED, CACHED, FAILED, RAN, DAGRunner, Stage, StageCache, pipeline_stages
+)
+
+
+def make_stages(calls, inputs, barrier=None, new_articles=None):
+    """prices e collect independentes; report depende dos dois"""
+    def record(name):
+        def run(context):
+            if barrier and name in ('prices', 'collect'):
+                barrier.wait()
+            calls.append(name)
+            return inputs.get(name)
+        return run
+
+    return [
+        Stage('prices', record('prices'), inputs=lambda context: inputs['prices'],
+              output=lambda result: result),
+        Stage('collect', record('collect'), volatile=True,
+              output=lambda result: new_articles() if new_articles else None),
+        Stage('report', record('report'), depends_on=('prices', 'collect')),
+    ]
+
+
+def test_independent_branches_run_concurrently():
+    """prices e collect só passam da barreira se executarem ao mesmo tempo"""
+    calls = []
+    barrier = threading.Barrier(2, timeout=5)
+    runner = DAGRunner(make_stages(calls, {'prices': 1}, barrier=barrier), max_workers=2)
+
+    results = runner.run(PipelineContext(Settings()))
+
+    assert {name: r.status for name, r in results.items()} == {'prices': RAN, 'collect': RAN, 'report': RAN}
+    assert calls[-1] == 'report'
+
+
+def test_unchanged_inputs_skip_stages_across_runs(tmp_path):
+    """Entradas iguais pulam a etapa; saída nova invalida só as dependentes"""
+    calls = []
+    inputs = {'prices': 1}
+    articles = {'value': None}
+    cache_path = str(tmp_path / "orquestrador.json")
+    stages = make_stages(calls, inputs, new_articles=lambda: articles['value'])
+    context = PipelineContext(Settings())
+
+    DAGRunner(stages, StageCache(cache_path)).run(context)
+    assert sorted(calls) == ['collect', 'prices', 'report']
+
+    # Nova execução (cache relido do disco): coleta sem artigos novos não invalida report
+    calls.clear()
+    results = DAGRunner(stages, StageCache(cache_path)).run(context)
+    assert calls == ['collect']
+    assert (results['prices'].status, results['report'].status) == (CACHED, CACHED)
+
+    # Cotações mudaram: prices e report executam de novo
+    calls.clear()
+    inputs['prices'] = 2
+    DAGRunner(stages, StageCache(cache_path)).run(context)
+    assert sorted(calls) == ['collect', 'prices', 'report']
+
+    # Coleta com artigos novos também invalida report
+    calls.clear()
+    articles['value'] = {'articles': 3}
+    DAGRunner(stages, StageCache(cache_path)).run(context)
+    assert sorted(calls) == ['collect', 'report']
+
+    # Entradas mudaram, mas o conteúdo produzido não: report continua em cache
+    calls.clear()
+    stages[0] = Stage('prices', stages[0].run, inputs=lambda context: 'outra', output=lambda result: 2)
+    DAGRunner(stages, StageCache(cache_path)).run(context)
+    assert sorted(calls) == ['collect', 'prices']
+
+    # --force ignora o cache
+    calls.clear()
+    DAGRunner(stages, StageCache(cache_path)).run(context, force=True)
+    assert sorted(calls) == ['collect', 'prices', 'report']
+
+
+def test_empty_result_is_not_cached():
+    """Busca vazia executa de novo na próxima vez e não invalida as dependentes"""
+    rows = {'value': 0}
+    calls = []
+
+    def prices(context):
+        calls.append('prices')
+        return {'rows': rows['value']}
+
+    stages = [
+        Stage('prices', prices, inputs=lambda context: 'hoje',
+              output=lambda result: result if result['rows'] else None,
+              cache_if=lambda result: result['rows'] > 0),
+        Stage('report', lambda context: calls.append('report'), depends_on=('prices',)),
+    ]
+    cache = StageCache()
+    context = PipelineContext(Settings())
+
+    DAGRunner(stages, cache).run(context)
+    assert 'prices' not in cache.entries
+    calls.clear()
+    results = DAGRunner(stages, cache).run(context)
+    assert calls == ['prices']
+    assert results['report'].status == CACHED
+
+    rows['value'] = 3
+    calls.clear()
+    DAGRunner(stages, cache).run(context)
+    assert calls == ['prices', 'report']
+    calls.clear()
+    DAGRunner(stages, cache).run(context)
+    assert calls == []
+
+
+def test_failure_blocks_only_dependents():
+    """Erro em um ramo não impede o ramo independente"""
+    def broken(context):
+        raise RuntimeError("sem rede")
+
+    stages = [
+        Stage('prices', lambda context: 1),
+        Stage('collect', broken),
+        Stage('transform_prices', lambda context: 2, depends_on=('prices',)),
+        Stage('report', lambda context: 3, depends_on=('transform_prices', 'collect')),
+    ]
+    cache = StageCache()
+    results = DAGRunner(stages, cache).run(PipelineContext(Settings()))
+
+    assert {name: r.status for name, r in results.items()} == {
+        'prices': RAN, 'collect': FAILED, 'transform_prices': RAN, 'report': BLOCKED
+    }
+    assert results['collect'].error == "sem rede"
+    assert set(cache.entries) == {'prices', 'transform_prices'}
+
+
+def test_invalid_graphs_and_pipeline_definition():
+    """Ciclos e dependências inexistentes são rejeitados; o DAG do pipeline é válido"""
+    with pytest.raises(ValueError, match="Ciclo"):
+        DAGRunner([Stage('a', print, depends_on=('b',)), Stage('b', print, depends_on=('a',))])
+    with pytest.raises(ValueError, match="inexistentes"):
+        DAGRunner([Stage('a', print, depends_on=('x',))])
+
+    runner = DAGRunner(pipeline_stages())
+    assert runner.select(['transform_correlation']) == [
+        'prices', 'collect', 'migrate', 'transform_prices', 'transform_news', 'transform_correlation'
+    ]
+    assert runner.select(['viz_candlestick']) == ['prices', 'transform_prices', 'viz_candlestick']
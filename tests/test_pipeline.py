@@ -0,0 +1,155 @@
+"""
+Testes do pipeline de coleta em streaming
+"""
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Adiciona diretório raiz ao path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from src.pipeline import StreamingPipeline, deduplicate
+from src.services import NewsPersistenceService
+from src.sinks import NDJSONSink, iter_article_dicts
+from src.state import CollectionCheckpoint, SeenArticleIndex
+from tests.test_collector import FakeCollector, build_rss
+from tests.test_repositories import MongoDBStubRepository, SlowRepository, make_article
+
+
+def test_deduplicate():
+    """URLs repetidas são descartadas"""
+    articles = [make_article(1), make_article(2), make_article(1)]
+    assert [a.url for a in deduplicate(articles)] == [articles[0].url, articles[1].url]
+
+
+def test_pipeline_streams_batches_to_all_destinations(tmp_path):
+    """Lotes vão para NDJSON, repositórios e índice local sem duplicatas"""
+    feeds = {
+        "q1": build_rss([(f"Noticia {i} - Fonte", f"https://n/{i}") for i in range(5)]),
+        "q2": build_rss([(f"Noticia {i} - Fonte", f"https://n/{i}") for i in range(3, 8)]),
+    }
+    collector = FakeCollector(feeds, max_workers=2, sleep_between=0.0, max_years_back=50)
+    persistence = NewsPersistenceService([MongoDBStubRepository(0.0)])
+    index = SeenArticleIndex(':memory:')
+    output = tmp_path / "artigos.ndjson"
+
+    with NDJSONSink(str(output)) as sink:
+        stats = StreamingPipeline(
+            collector, persistence, json_sink=sink, seen_index=index, batch_size=3
+        ).run(["q1", "q2"])
+
+    assert stats['articles'] == 8
+    assert stats['batches'] == 3
+    assert stats['saved'] == {'MongoDBStub': 8}
+    assert stats['first_batch_seconds'] is not None
+    assert sorted(d['url'] for d in iter_article_dicts(str(output))) == [f"https://n/{i}" for i in range(8)]
+    assert index.count() == 8
+
+
+def test_pipeline_does_not_mark_batches_rejected_by_every_repository(tmp_path):
+    """NDJSON gravado não basta: sem repositório aceitando, nada é dado como coletado"""
+    feeds = {"q1": build_rss([("Noticia A - Fonte", "https://a"), ("Noticia B - Fonte", "https://b")])}
+
+    class FailingRepository(SlowRepository):
+        def save(self, articles):
+            raise RuntimeError("banco fora do ar")
+
+    collector = FakeCollector(feeds, max_workers=1, sleep_between=0.0, max_years_back=50)
+    index = SeenArticleIndex(':memory:')
+    checkpoint = CollectionCheckpoint(str(tmp_path / "checkpoint.json"))
+    output = tmp_path / "artigos.ndjson"
+    persistence = NewsPersistenceService([FailingRepository(0.0), FailingRepository(0.0)])
+
+    with NDJSONSink(str(output)) as sink:
+        stats = StreamingPipeline(
+            collector, persistence, json_sink=sink, seen_index=index, checkpoint=checkpoint
+        ).run(["q1"])
+
+    assert len(list(iter_article_dicts(str(output)))) == 2
+    assert stats['errors']
+    assert index.count() == 0
+    assert index.get_watermark("q1") is None
+    assert checkpoint.state['completed_queries'] == []
+    assert not checkpoint.finished
+
+
+def test_pipeline_backpressure_limits_batches_in_flight():
+    """Com persistência lenta, a coleta não acumula mais que a fila permite"""
+
+    class TrackingRepository(SlowRepository):
+        def __init__(self):
+            super().__init__(0.05)
+            self.calls = 0
+
+        def save(self, articles):
+            self.calls += 1
+            return super().save(articles)
+
+    class CountingCollector(FakeCollector):
+        produced = 0
+
+        def iter_articles(self, queries):
+            for article in super().iter_articles(queries):
+                CountingCollector.produced += 1
+                yield article
+
+    feeds = {"q1": build_rss([(f"Noticia {i} - Fonte", f"https://n/{i}") for i in range(20)])}
+    collector = CountingCollector(feeds, sleep_between=0.0, max_years_back=50)
+    repo = TrackingRepository()
+    pipeline = StreamingPipeline(collector, NewsPersistenceService([repo]), batch_size=1, queue_size=1)
+
+    observed = []
+
+    def watch():
+        while repo.calls < 20:
+            # produzidos - gravados <= lote em gravação + fila + lote em montagem
+            observed.append(CountingCollector.produced - repo.calls)
+            time.sleep(0.01)
+
+    watcher = threading.Thread(target=watch)
+    watcher.start()
+    stats = pipeline.run(["q1"])
+    watcher.join()
+
+    assert stats['saved'] == {'Tracking': 20}
+    assert max(observed) <= 3
+
+
+def test_pipeline_resume_skips_completed_queries(tmp_path):
+    """Após falha de gravação, a retomada refaz só as queries pendentes"""
+    feeds = {
+        "q1": build_rss([("Noticia A - Fonte", "https://a"), ("Noticia B - Fonte", "https://b")]),
+        "q2": build_rss([("Noticia C - Fonte", "https://c")]),
+    }
+    checkpoint_path = str(tmp_path / "checkpoint.json")
+
+    class FailingOnQuery(SlowRepository):
+        def save(self, articles):
+            if any(a.query == "q2" for a in articles):
+                raise RuntimeError("falha simulada")
+            return len(articles)
+
+    collector = FakeCollector(feeds, max_workers=1, sleep_between=0.0, max_years_back=50)
+    checkpoint = CollectionCheckpoint(checkpoint_path)
+    StreamingPipeline(
+        collector, NewsPersistenceService([FailingOnQuery(0.0)]), batch_size=2, checkpoint=checkpoint
+    ).run(["q1", "q2"])
+
+    assert checkpoint.state['completed_queries'] == ["q1"]
+    assert len(checkpoint.state['flushed_batches']) == 1
+    assert checkpoint.state['last_published']["q1"].startswith("2025-09-15")
+    assert not checkpoint.finished
+
+    resumed = CollectionCheckpoint(checkpoint_path, resume=True)
+    assert resumed.run_id == checkpoint.run_id
+    repo = MongoDBStubRepository(0.0)
+    stats = StreamingPipeline(
+        collector, NewsPersistenceService([repo]), batch_size=2, checkpoint=resumed
+    ).run(["q1", "q2"])
+
+    assert stats['skipped_queries'] == 1
+    assert stats['saved'] == {'MongoDBStub': 1}
+    assert resumed.finished
+    assert CollectionCheckpoint(checkpoint_path, resume=True).state['completed_queries'] == ["q1", "q2"]
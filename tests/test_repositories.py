@@ -0,0 +1,206 @@
+"""
+Testes dos repositórios (sem bancos reais)
+"""
+import csv
+import sys
+import time
+from pathlib import Path
+
+# Adiciona diretório raiz ao path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from pymongo.results import BulkWriteResult
+
+from src.config import MongoDBConfig, PostgreSQLConfig, SnowflakeConfig
+from src.models import NewsArticle, SentimentAnalysis
+from src.repositories import INewsRepository, MongoDBRepository, PostgreSQLRepository, SnowflakeRepository
+from src.services import NewsPersistenceService
+
+
+def make_article(i, query="BBAS3 B3"):
+    """Cria artigo sintético"""
+    return NewsArticle(
+        url=f"https://news.google.com/rss/articles/{i}",
+        query=query,
+        titulo_noticia=f"Banco do Brasil notícia {i} - Fonte {i % 3}",
+        publicada="2025-01-15T10:30:00+00:00",
+        busca_feita="2025-01-16T08:00:00+00:00",
+        resumo=f"Resumo da notícia {i} com lucro recorde",
+        sentimentos=SentimentAnalysis(0.3, 0.5, 'positive', 0.7, 2, 0)
+    )
+
+
+class FakeCollection:
+    """Coleção que registra chamadas de bulk_write"""
+
+    def __init__(self):
+        self.bulk_calls = []
+
+    def bulk_write(self, operations, ordered=True):
+        self.bulk_calls.append((list(operations), ordered))
+        raw = {'nUpserted': len(operations), 'nModified': 0, 'upserted': []}
+        return BulkWriteResult(raw, acknowledged=True)
+
+
+def test_mongodb_save_uses_chunked_unordered_bulk_write():
+    """save envia upserts em lotes não ordenados e soma os contadores"""
+    config = MongoDBConfig(uri='mongodb://x', database='db', collection='c', bulk_size=2)
+    repo = MongoDBRepository(config)
+    repo._collection = FakeCollection()
+
+    saved = repo.save([make_article(i) for i in range(5)])
+
+    assert saved == 5
+    assert [len(ops) for ops, _ in repo._collection.bulk_calls] == [2, 2, 1]
+    assert all(ordered is False for _, ordered in repo._collection.bulk_calls)
+    first_op = repo._collection.bulk_calls[0][0][0]
+    assert first_op._filter == {'url': make_article(0).url}
+    assert first_op._upsert is True
+
+
+def test_mongodb_unique_index_removes_duplicates_before_retrying():
+    """Coleção legada com URLs repetidas mantém a busca mais recente e ganha o índice único"""
+    import mongomock
+
+    repo = MongoDBRepository(MongoDBConfig(uri='mongodb://x', database='db', collection='c'))
+    repo._collection = mongomock.MongoClient()['db']['c']
+    repo._collection.insert_many([
+        {'url': 'https://a', 'busca_feita': '2025-01-02T00:00:00'},
+        {'url': 'https://a', 'busca_feita': '2025-01-03T00:00:00'},
+        {'url': 'https://a', 'busca_feita': '2025-01-01T00:00:00'},
+        {'url': 'https://b', 'busca_feita': '2025-01-01T00:00:00'},
+    ])
+
+    repo._ensure_indexes()
+
+    assert repo.unique_url
+    assert repo._collection.index_information()['url_unique']['unique']
+    assert sorted((d['url'], d['busca_feita']) for d in repo._collection.find({}, {'_id': 0})) == [
+        ('https://a', '2025-01-03T00:00:00'), ('https://b', '2025-01-01T00:00:00')
+    ]
+
+
+def test_postgresql_merge_sql_and_copy_buffer():
+    """Merge usa ON CONFLICT (url_hash) e o CSV do COPY deduplica por hash"""
+    config = PostgreSQLConfig(user='u', password='p', host='h', port='5432', database='db')
+    repo = PostgreSQLRepository(config)
+
+    assert 'url_hash TEXT PRIMARY KEY' in repo._create_table_sql()
+    assert 'ADD COLUMN IF NOT EXISTS cluster_id TEXT' in repo._add_columns_sql()
+    merge_sql = repo._merge_sql('stage')
+    assert 'ON CONFLICT (url_hash) DO UPDATE SET' in merge_sql
+    assert 'url_hash = EXCLUDED.url_hash' not in merge_sql
+
+    article = make_article(1)
+    article.publicada = None
+    rows = list(csv.reader(repo._to_copy_buffer([make_article(0), make_article(1), article])))
+    assert len(rows) == 2
+    # publicada (9ª coluna) nula vira o marcador de NULL do COPY
+    assert rows[1][8] == PostgreSQLRepository.COPY_NULL
+    assert rows[0][8] == '2025-01-15T10:30:00+00:00'
+
+
+def test_postgresql_checks_table_once_per_instance():
+    """CREATE/ALTER TABLE e a busca da PK rodam só no primeiro lote"""
+    statements = []
+
+    class Cursor:
+        rowcount = 1
+
+        def execute(self, sql, params=None):
+            statements.append(sql)
+
+        def fetchone(self):
+            return (1,)
+
+        def copy_expert(self, sql, buffer):
+            statements.append(sql)
+
+        def close(self):
+            pass
+
+    class Connection:
+        def cursor(self):
+            return Cursor()
+
+        def commit(self):
+            pass
+
+        def close(self):
+            pass
+
+    class Engine:
+        def raw_connection(self):
+            return Connection()
+
+    repo = PostgreSQLRepository(PostgreSQLConfig(user='u', password='p', host='h', port='5432', database='db'))
+    repo._engine = Engine()
+    repo._save_merge([make_article(0)])
+    repo._save_merge([make_article(1)])
+
+    assert sum(sql.startswith('CREATE TABLE') for sql in statements) == 1
+    assert sum(sql.startswith('ALTER TABLE') for sql in statements) == 1
+    assert sum('information_schema' in sql for sql in statements) == 1
+    assert sum(sql.startswith('INSERT INTO') for sql in statements) == 2
+
+
+def test_snowflake_merge_sql_targets_url_hash():
+    """MERGE casa por URL_HASH e insere todas as colunas relacionais"""
+    config = SnowflakeConfig(user='u', password='p', account='a', warehouse='w', database='d', schema='s')
+    repo = SnowflakeRepository(config)
+
+    merge_sql = repo._merge_sql('NOTICIAS_BBAS3_STAGING')
+    assert merge_sql.startswith('MERGE INTO NOTICIAS_BBAS3 t USING NOTICIAS_BBAS3_STAGING s')
+    assert 'ON t.URL_HASH = s.URL_HASH' in merge_sql
+    assert 't.URL_HASH = s.URL_HASH,' not in merge_sql
+    assert 'URL_HASH VARCHAR PRIMARY KEY' in repo._create_table_sql()
+
+
+class SlowRepository(INewsRepository):
+    """Repositório que dorme antes de salvar"""
+
+    def __init__(self, delay, fail=False):
+        self.delay = delay
+        self.fail = fail
+
+    def save(self, articles):
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("falha simulada")
+        return len(articles)
+
+    def find_by_url(self, url):
+        return None
+
+    def count(self):
+        return 0
+
+
+class MongoDBStubRepository(SlowRepository):
+    pass
+
+
+class PostgreSQLStubRepository(SlowRepository):
+    pass
+
+
+class SnowflakeStubRepository(SlowRepository):
+    pass
+
+
+def test_persistence_save_all_runs_sinks_concurrently():
+    """Tempo total ~ max(destinos); erros e timeouts não derrubam os demais"""
+    service = NewsPersistenceService(
+        [MongoDBStubRepository(0.2), PostgreSQLStubRepository(0.2, fail=True), SnowflakeStubRepository(2)],
+        timeout=0.6
+    )
+    start = time.perf_counter()
+    results = service.save_all([make_article(i) for i in range(3)])
+    elapsed = time.perf_counter() - start
+
+    assert results == {'MongoDBStub': 3, 'PostgreSQLStub': 0, 'SnowflakeStub': 0}
+    assert elapsed < 1.5
+    assert 'falha simulada' in service.last_errors['PostgreSQLStub']
+    assert 'timeout' in service.last_errors['SnowflakeStub']
+    assert service.last_timings['MongoDBStub'] >= 0.2
@@ -0,0 +1,120 @@
+"""
+Testes do serviço de análise de sentimento
+"""
+import sys
+from pathlib import Path
+
+# Adiciona diretório raiz ao path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from src import metrics
+from src.services import SentimentAnalysisService, SentimentRescoringService
+from src.state import SentimentCache
+
+TEXTS = [
+    "Banco do Brasil anuncia lucro recorde com crescimento forte e alta rentabilidade",
+    "Banco do Brasil sofre prejuízo com crise e queda na inadimplência",
+    "BBAS3 registra desvalorização após provisão para risco de calote",
+    "Banco do Brasil divulga relatório anual",
+    "",
+    "Ações do BB: RECUPERAÇÃO e dividendos sólidos, apesar da multa",
+]
+TITLES = ["BBAS3 tem alta", "BBAS3 em crise", "", "BBAS3", "Sem texto", "Sanção?"]
+
+
+def naive_keyword_counts(text, title):
+    """Contagem de referência: uma busca `in` por keyword"""
+    text_lower = (f"{title} {text}" if title else text).lower()
+    pos = sum(1 for w in SentimentAnalysisService.POSITIVE_KEYWORDS if w in text_lower)
+    neg = sum(1 for w in SentimentAnalysisService.NEGATIVE_KEYWORDS if w in text_lower)
+    return pos, neg
+
+
+def test_keyword_counts_match_substring_semantics():
+    """Matcher compilado conta as mesmas keywords que `word in text`"""
+    service = SentimentAnalysisService()
+    for text, title in zip(TEXTS, TITLES):
+        if not text:
+            continue
+        result = service.analyze(text, title)
+        assert (result.positive_keywords, result.negative_keywords) == naive_keyword_counts(text, title)
+
+    # 'desvalorização' também contém a keyword positiva 'valorização'
+    result = service.analyze("forte desvalorização")
+    assert (result.positive_keywords, result.negative_keywords) == (1, 1)
+
+
+def test_analyze_batch_matches_analyze():
+    """analyze_batch produz o mesmo resultado que analyze por artigo"""
+    service = SentimentAnalysisService()
+    expected = [service.analyze(text, title) for text, title in zip(TEXTS, TITLES)]
+    assert service.analyze_batch(TEXTS, TITLES, chunk_size=4) == expected
+    assert service.analyze_batch(TEXTS) == [service.analyze(text) for text in TEXTS]
+
+
+class InMemoryMongoRepository:
+    """Substituto do MongoDBRepository para o re-score"""
+
+    def __init__(self, docs):
+        self.docs = {doc['url']: doc for doc in docs}
+
+    def iter_documents(self, projection=None, batch_size=1000):
+        yield from list(self.docs.values())
+
+    def update_sentiments(self, updates):
+        for url, sentiment in updates:
+            self.docs[url]['sentimentos'] = sentiment
+        return len(updates)
+
+
+def test_rescoring_service_updates_all_documents():
+    """Re-score em processos paralelos grava o mesmo resultado de analyze"""
+    docs = [
+        {'url': f'https://n/{i}', 'titulo_noticia': title, 'resumo': text, 'sentimentos': {}}
+        for i, (text, title) in enumerate(zip(TEXTS * 5, TITLES * 5))
+    ]
+    repo = InMemoryMongoRepository(docs)
+
+    stats = SentimentRescoringService(repo, workers=2, chunk_size=7).run()
+
+    assert stats['processed'] == len(docs)
+    assert stats['updated'] == len(docs)
+    service = SentimentAnalysisService()
+    doc = repo.docs['https://n/0']
+    assert doc['sentimentos'] == service.analyze(TEXTS[0], TITLES[0]).to_dict()
+
+
+def test_sentiment_cache_hits_and_persistence(tmp_path):
+    """Textos repetidos são servidos pelo cache, inclusive entre execuções"""
+    path = str(tmp_path / "sentiment.sqlite3")
+    cache = SentimentCache(max_size=2, path=path)
+    service = SentimentAnalysisService(cache=cache)
+
+    first = service.analyze(TEXTS[0], TITLES[0])
+    assert service.analyze(TEXTS[0], TITLES[0]) == first
+    assert service.analyze_batch(TEXTS[:2], TITLES[:2])[0] == first
+    assert cache.stats()['hits'] == 2
+    assert cache.stats()['misses'] == 2
+    cache.close()
+
+    reloaded = SentimentCache(max_size=2, path=path)
+    service = SentimentAnalysisService(cache=reloaded)
+    assert service.analyze(TEXTS[1], TITLES[1]) == SentimentAnalysisService().analyze(TEXTS[1], TITLES[1])
+    assert reloaded.stats() == {'hits': 1, 'misses': 0, 'hit_rate': 1.0, 'size': 1}
+
+
+def test_cache_metrics_match_between_analyze_and_batch():
+    """analyze e analyze_batch alimentam os mesmos contadores de cache"""
+    service = SentimentAnalysisService(cache=SentimentCache())
+    registry = metrics.enable()
+    try:
+        service.analyze(TEXTS[0], TITLES[0])
+        service.analyze(TEXTS[0], TITLES[0])
+        service.analyze_batch(TEXTS[:3], TITLES[:3])
+        counters = registry.summary()['counters']
+    finally:
+        metrics.disable()
+
+    assert counters['sentiment_cache_hits_total'] == 2
+    assert counters['sentiment_cache_misses_total'] == 3
@@ -0,0 +1,64 @@
+"""
+Testes do arquivo local NDJSON
+"""
+import json
+import sys
+from pathlib import Path
+
+# Adiciona diretório raiz ao path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+import pytest
+
+from src.sinks import NDJSONSink, iter_article_dicts, iter_articles
+from tests.test_repositories import make_article
+
+
+@pytest.mark.parametrize("filename", ["artigos.ndjson", "artigos.ndjson.gz", "artigos.ndjson.zst"])
+def test_ndjson_sink_appends_across_runs(tmp_path, filename):
+    """Execuções sucessivas acrescentam linhas e a leitura é em streaming"""
+    if filename.endswith('.zst'):
+        pytest.importorskip('zstandard')
+    path = tmp_path / filename
+
+    with NDJSONSink(str(path)) as sink:
+        sink.write_many([make_article(0), make_article(1)])
+    with NDJSONSink(str(path)) as sink:
+        sink.write(make_article(2))
+
+    articles = list(iter_articles(str(path)))
+    assert [a.url for a in articles] == [make_article(i).url for i in range(3)]
+    assert articles[0].sentimentos == make_article(0).sentimentos
+
+
+def test_reader_accepts_legacy_json_array(tmp_path):
+    """Arquivo antigo (lista JSON indentada) continua legível"""
+    path = tmp_path / "collected_articles_bbas3.json"
+    path.write_text(json.dumps([make_article(0).to_dict()], indent=2), encoding='utf-8')
+
+    assert [d['url'] for d in iter_article_dicts(str(path))] == [make_article(0).url]
+
+
+def test_sink_converts_legacy_json_array_before_appending(tmp_path):
+    """OUTPUT_JSON antigo (lista JSON) vira NDJSON em vez de ficar ilegível"""
+    path = tmp_path / "collected_articles_bbas3.json"
+    path.write_text(json.dumps([make_article(0).to_dict(), make_article(1).to_dict()], indent=2), encoding='utf-8')
+
+    with NDJSONSink(str(path)) as sink:
+        sink.write(make_article(2))
+
+    assert [d['url'] for d in iter_article_dicts(str(path))] == [make_article(i).url for i in range(3)]
+    assert path.read_text(encoding='utf-8').count('\n') == 3
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["collected_articles_bbas3.json"]
+
+
+def test_sink_refuses_corrupted_legacy_file(tmp_path):
+    """Lista JSON já misturada com linhas NDJSON gera erro claro, sem alterar o arquivo"""
+    path = tmp_path / "collected_articles_bbas3.json"
+    content = json.dumps([make_article(0).to_dict()], indent=2) + "\n" + json.dumps(make_article(1).to_dict()) + "\n"
+    path.write_text(content, encoding='utf-8')
+
+    with pytest.raises(ValueError, match="formato antigo"):
+        NDJSONSink(str(path))
+    assert path.read_text(encoding='utf-8') == content
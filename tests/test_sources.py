@@ -0,0 +1,81 @@
+"""
+Testes das fontes plugáveis e do cliente assíncrono (offline)
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+# Adiciona diretório raiz ao path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from src.fetchers import AsyncFeedClient, FeedCache, RetryPolicy
+from src.pipeline import StreamingPipeline
+from src.services import NewsCollectorService, SentimentAnalysisService
+from src.state import CollectionCheckpoint
+from src.sources import (
+    GoogleNewsSource, LocalFeedDirectorySource, MultiSourceCollector, RSSFeedSource,
+    build_sources, slugify
+)
+from tests.test_collector import build_rss
+from tests.test_fetchers import FEED_BODY, FeedHandler, feed_server  # noqa: F401 (fixture)
+
+
+def make_collector(**kwargs):
+    return NewsCollectorService(SentimentAnalysisService(), sleep_between=0.0, max_years_back=50, **kwargs)
+
+
+def test_sources_build_requests():
+    """Cada fonte gera seus feeds; feeds RSS fixos ignoram as queries"""
+    sources = build_sources(['google_news', 'rss'], rss_feeds="ri=https://ri.bb.com.br/feed, valor=https://valor/rss")
+    requests = [r for source in sources for r in source.requests(["BBAS3 B3"])]
+
+    assert requests[0].url == make_collector()._build_rss_url("BBAS3 B3")
+    assert [(r.key, r.source) for r in requests] == [
+        ("BBAS3 B3", 'google_news'), ("ri", 'rss'), ("valor", 'rss')
+    ]
+    assert slugify("Banco do Brasil inadimplência") == "banco-do-brasil-inadimplencia"
+
+
+def test_multi_source_collector_offline(tmp_path):
+    """Feeds gravados em diretório e arquivo local passam pelo pipeline completo"""
+    (tmp_path / "bbas3-b3.xml").write_text(
+        build_rss([("Noticia A - Fonte", "https://a"), ("Noticia B - Fonte", "https://b")]), encoding='utf-8'
+    )
+    extra = tmp_path / "extra.xml"
+    extra.write_text(build_rss([("Noticia B - Fonte", "https://b"), ("Noticia C - Fonte", "https://c")]), encoding='utf-8')
+
+    collector = MultiSourceCollector(
+        make_collector(),
+        [LocalFeedDirectorySource(str(tmp_path)), RSSFeedSource({"extra": extra.as_uri()})]
+    )
+    results = list(collector.iter_query_results(["BBAS3 B3", "sem feed gravado"]))
+
+    # O feed fixo "extra" não é uma query: nunca é reportado como concluído
+    assert len(results) == 2
+    assert [key for key, _ in results if key] == ["BBAS3 B3"]
+
+    checkpoint = CollectionCheckpoint(str(tmp_path / "checkpoint.json"))
+    stats = StreamingPipeline(collector, checkpoint=checkpoint).run(["BBAS3 B3"])
+    assert stats['articles'] == 3
+    assert checkpoint.state['completed_queries'] == ["BBAS3 B3"]
+    assert checkpoint.finished
+
+
+def test_async_client_conditional_get_and_retry(feed_server, tmp_path):
+    """Cliente assíncrono repete 503, usa ETag e recebe 304 na mesma sessão"""
+    FeedHandler.failures = [(503, '0')]
+
+    async def run():
+        client = AsyncFeedClient(cache=FeedCache(str(tmp_path)), retry_policy=RetryPolicy(max_retries=2))
+        async with client:
+            first = await client.fetch(feed_server)
+            second = await client.fetch(feed_server)
+        return client, first, second
+
+    client, first, second = asyncio.run(run())
+
+    assert first.status == 200 and first.body == FEED_BODY
+    assert second.not_modified
+    assert client.retries == 1
+    assert FeedHandler.requests_seen[-1].get('If-None-Match') == '"v1"'